@@ -0,0 +1,201 @@
+"""
+Compares how long the available JSON decoders take to decode Reddit listing and comment payloads.
+
+Recorded payloads (e.g. saved with `curl -A my-agent https://www.reddit.com/r/AskReddit/comments/13ptwzd.json`)
+can be passed as arguments. Without any, synthetic listing and comment payloads of a realistic shape are used.
+
+    python benchmarks/json_decoding.py [payload.json ...] [--rounds 50]
+"""
+
+import argparse
+import importlib
+import json
+import os
+import random
+import string
+import timeit
+from typing import Callable, Dict, List, Tuple
+
+from rich import box
+from rich.console import Console
+from rich.table import Table
+
+# Decoders to compare, as (name, module, function) triples. Those that are not installed are skipped.
+DECODERS: List[Tuple[str, str, str]] = [
+    ("json", "json", "loads"),
+    ("orjson", "orjson", "loads"),
+    ("ujson", "ujson", "loads"),
+    ("msgspec", "msgspec.json", "decode"),
+]
+
+
+def random_text(rng: random.Random, words: int) -> str:
+    return " ".join(
+        "".join(rng.choices(string.ascii_lowercase, k=rng.randint(2, 10)))
+        for _ in range(words)
+    )
+
+
+def synthetic_post(rng: random.Random, index: int) -> Dict:
+    return {
+        "kind": "t3",
+        "data": {
+            "id": f"p{index:05d}",
+            "name": f"t3_p{index:05d}",
+            "title": random_text(rng, words=12),
+            "selftext": random_text(rng, words=rng.randint(0, 300)),
+            "author": f"user_{rng.randint(1, 10**6)}",
+            "subreddit": "AskReddit",
+            "subreddit_id": "t5_2qh1i",
+            "permalink": f"/r/AskReddit/comments/p{index:05d}/",
+            "url": f"https://www.reddit.com/r/AskReddit/comments/p{index:05d}/",
+            "score": rng.randint(0, 50000),
+            "ups": rng.randint(0, 50000),
+            "upvote_ratio": round(rng.random(), 2),
+            "num_comments": rng.randint(0, 5000),
+            "created_utc": 1.7e9 + rng.randint(0, 10**7),
+            "over_18": False,
+            "stickied": False,
+            "all_awardings": [],
+            "link_flair_richtext": [{"e": "text", "t": random_text(rng, words=2)}],
+            "preview": {
+                "images": [
+                    {
+                        "resolutions": [
+                            {
+                                "url": "https://preview.redd.it/x.jpg",
+                                "width": w,
+                                "height": w,
+                            }
+                            for w in (108, 216, 320, 640)
+                        ]
+                    }
+                ]
+            },
+        },
+    }
+
+
+def synthetic_comment(rng: random.Random, index: int, depth: int) -> Dict:
+    replies = (
+        {
+            "kind": "Listing",
+            "data": {
+                "children": [
+                    synthetic_comment(rng, index=index * 10 + child, depth=depth - 1)
+                    for child in range(rng.randint(0, 3))
+                ]
+            },
+        }
+        if depth > 0
+        else ""
+    )
+
+    return {
+        "kind": "t1",
+        "data": {
+            "id": f"c{index}",
+            "name": f"t1_c{index}",
+            "body": random_text(rng, words=rng.randint(5, 120)),
+            "author": f"user_{rng.randint(1, 10**6)}",
+            "score": rng.randint(-50, 5000),
+            "created_utc": 1.7e9 + rng.randint(0, 10**7),
+            "depth": 5 - depth,
+            "replies": replies,
+        },
+    }
+
+
+def synthetic_payloads(seed: int = 0) -> Dict[str, bytes]:
+    """Builds a 100-post listing page and a post page with a deeply nested comment tree."""
+
+    rng = random.Random(seed)
+    listing = {
+        "kind": "Listing",
+        "data": {
+            "after": "t3_p00099",
+            "children": [synthetic_post(rng, index=index) for index in range(100)],
+        },
+    }
+    comments = [
+        {"kind": "Listing", "data": {"children": [synthetic_post(rng, index=0)]}},
+        {
+            "kind": "Listing",
+            "data": {
+                "children": [
+                    synthetic_comment(rng, index=index, depth=5)
+                    for index in range(1, 60)
+                ]
+            },
+        },
+    ]
+
+    return {
+        "synthetic listing": json.dumps(listing).encode(),
+        "synthetic comments": json.dumps(comments).encode(),
+    }
+
+
+def available_decoders() -> Dict[str, Callable]:
+    decoders: Dict[str, Callable] = {}
+    for name, module, function in DECODERS:
+        try:
+            decoders[name] = getattr(importlib.import_module(module), function)
+        except ImportError:
+            continue
+
+    return decoders
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("payloads", nargs="*", help="recorded JSON payloads to decode")
+    parser.add_argument(
+        "--rounds", type=int, default=50, help="decodes per payload and decoder"
+    )
+    arguments = parser.parse_args()
+
+    payloads: Dict[str, bytes] = {}
+    for path in arguments.payloads:
+        with open(path, "rb") as payload:
+            payloads[os.path.basename(path)] = payload.read()
+    payloads = payloads or synthetic_payloads()
+
+    decoders: Dict[str, Callable] = available_decoders()
+    table = Table(title="JSON decoding", box=box.ROUNDED)
+    table.add_column("Payload")
+    table.add_column("Size", justify="right")
+    for name in decoders:
+        table.add_column(name, justify="right")
+
+    for payload_name, payload in payloads.items():
+        timings: Dict[str, float] = {}
+        for name, decode in decoders.items():
+            # Best of 5 repeats, to keep other activity on the machine out of the comparison.
+            timings[name] = (
+                min(
+                    timeit.repeat(
+                        lambda: decode(payload), number=arguments.rounds, repeat=5
+                    )
+                )
+                / arguments.rounds
+            )
+
+        baseline: float = timings["json"]
+        table.add_row(
+            payload_name,
+            f"{len(payload) / 1024:.0f} KB",
+            *[
+                f"{timing * 1000:.2f} ms ({baseline / timing:.1f}x)"
+                for timing in timings.values()
+            ],
+        )
+
+    Console().print(table)
+
+
+if __name__ == "__main__":
+    main()
+
+
+# -------------------------------- END ----------------------------------------- #
@@ -0,0 +1,304 @@
+"""
+Measures how fast `Api` and the `core` classes page through listings and comment trees on the network path.
+
+Each scenario runs against a local stand-in for Reddit (`knewkarma.tools.fake_reddit`), which is started in a
+separate process so that serving the responses does not compete with the client for the event loop. It reports
+requests and items per second, request latency percentiles and peak memory, and can write the results to a JSON
+file to compare against the results of another version.
+
+    python benchmarks/network.py [--scenarios listing-1000 ...] [--rounds 3] [--latency 0.05]
+                                 [--output results.json] [--compare previous.json]
+"""
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import platform
+import statistics
+import time
+import tracemalloc
+from typing import Awaitable, Callable, Dict, List, Optional, Sized
+
+from rich import box
+from rich.console import Console
+from rich.table import Table
+
+from knewkarma.api import Api, RetryPolicy
+from knewkarma.core import Post, Subreddit
+from knewkarma.meta import version
+from knewkarma.tools.fake_reddit import FakeReddit
+from knewkarma.tools.tracing import RequestTrace, RequestTracer
+
+# Scenarios to run, as name: coroutine function that takes an `Api` and returns the items it fetched.
+SCENARIOS: Dict[str, Callable[[Api], Awaitable[Sized]]] = {
+    "listing-100": lambda api: Subreddit(name="bench", api=api).posts(limit=100),
+    "listing-1000": lambda api: Subreddit(name="bench", api=api).posts(limit=1000),
+    "listing-10000": lambda api: Subreddit(name="bench", api=api).posts(limit=10000),
+    "comments-deep": lambda api: Post(id="deep", subreddit="bench", api=api).comments(
+        limit=5000
+    ),
+    "comments-fan-out": lambda api: Subreddit(name="bench", api=api).comments(
+        posts_limit=25, comments_per_post=100
+    ),
+    "subreddits-fan-out": lambda api: fan_out(api=api, subreddits=50, limit=100),
+}
+
+
+async def fan_out(api: Api, subreddits: int, limit: int) -> List:
+    """Gets posts from many subreddits at once."""
+
+    pages = await asyncio.gather(
+        *[
+            Subreddit(name=f"bench_{index}", api=api).posts(limit=limit)
+            for index in range(subreddits)
+        ]
+    )
+
+    return [post for page in pages for post in page]
+
+
+class LatencyTracer(RequestTracer):
+    """A `RequestTracer` that also keeps the latency of every request, across endpoint kinds."""
+
+    def __init__(self):
+        super().__init__()
+        self.latencies: List[float] = []
+
+    def finish(
+        self,
+        trace: RequestTrace,
+        status: int,
+        error: Optional[BaseException] = None,
+    ):
+        super().finish(trace=trace, status=status, error=error)
+        self.latencies.append(trace.durations()["total"])
+
+
+def serve(url_queue: multiprocessing.Queue, latency: float, seed: int):
+    """Runs a fake Reddit until the process is terminated, sending its URL back through `url_queue`."""
+
+    async def run():
+        server = FakeReddit(
+            seed=seed,
+            items_per_listing=10000,
+            comments_per_post=5000,
+            listing_cap=None,
+            rate_limit=10**9,
+            latency=latency,
+        )
+        url_queue.put(await server.start())
+        await asyncio.Event().wait()
+
+    asyncio.run(run())
+
+
+async def run_scenario(
+    scenario: Callable[[Api], Awaitable[Sized]],
+    base_url: str,
+    connections: int,
+    trace_memory: bool = False,
+) -> Dict:
+    tracer = LatencyTracer()
+    async with Api(
+        base_url=base_url,
+        tracer=tracer,
+        retry_policy=RetryPolicy(base_delay=0.05),
+        connector_options={"limit_per_host": connections},
+    ) as api:
+        if trace_memory:
+            tracemalloc.start()
+        started_at: float = time.perf_counter()
+        items: Sized = await scenario(api)
+        seconds: float = time.perf_counter() - started_at
+        peak_memory: int = tracemalloc.get_traced_memory()[1] if trace_memory else 0
+        if trace_memory:
+            tracemalloc.stop()
+
+    return {
+        "seconds": seconds,
+        "items": len(items),
+        "requests": len(tracer.latencies),
+        "latencies": sorted(tracer.latencies),
+        "peak_memory": peak_memory,
+    }
+
+
+def percentile(sorted_values: List[float], percent: float) -> float:
+    if not sorted_values:
+        return 0.0
+
+    return sorted_values[round(percent / 100 * (len(sorted_values) - 1))]
+
+
+def benchmark(name: str, base_url: str, rounds: int, connections: int) -> Dict:
+    """Runs a scenario `rounds` times, then once more to measure its peak memory."""
+
+    scenario = SCENARIOS[name]
+    # The first run also warms up the server's generated data, so it is not timed.
+    asyncio.run(run_scenario(scenario, base_url=base_url, connections=connections))
+    runs: List[Dict] = [
+        asyncio.run(run_scenario(scenario, base_url=base_url, connections=connections))
+        for _ in range(rounds)
+    ]
+    # Tracing allocations slows everything down, so memory is measured in a run of its own.
+    memory_run: Dict = asyncio.run(
+        run_scenario(
+            scenario, base_url=base_url, connections=connections, trace_memory=True
+        )
+    )
+
+    seconds: float = statistics.median(run["seconds"] for run in runs)
+    latencies: List[float] = sorted(
+        latency for run in runs for latency in run["latencies"]
+    )
+
+    return {
+        "scenario": name,
+        "items": runs[0]["items"],
+        "requests": runs[0]["requests"],
+        "seconds": seconds,
+        "requests_per_second": runs[0]["requests"] / seconds,
+        "items_per_second": runs[0]["items"] / seconds,
+        "p50_ms": percentile(latencies, 50) * 1000,
+        "p95_ms": percentile(latencies, 95) * 1000,
+        "p99_ms": percentile(latencies, 99) * 1000,
+        "peak_memory_bytes": memory_run["peak_memory"],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--scenarios",
+        nargs="+",
+        choices=list(SCENARIOS),
+        default=list(SCENARIOS),
+        help="scenarios to run (all by default)",
+    )
+    parser.add_argument("--rounds", type=int, default=3, help="timed runs per scenario")
+    parser.add_argument(
+        "--latency",
+        type=float,
+        default=0.0,
+        help="seconds the server waits before each response, to simulate network latency",
+    )
+    parser.add_argument(
+        "--connections",
+        type=int,
+        default=20,
+        help="maximum number of connections to the server",
+    )
+    parser.add_argument("--seed", type=int, default=0, help="seed of the served data")
+    parser.add_argument(
+        "--base-url",
+        help="run against an already running server, e.g. `python -m knewkarma.tools.fake_reddit --no-listing-cap`",
+    )
+    parser.add_argument("--output", help="write the results to this JSON file")
+    parser.add_argument(
+        "--compare", help="compare items per second with the results in this JSON file"
+    )
+    arguments = parser.parse_args()
+
+    server: Optional[multiprocessing.Process] = None
+    base_url: Optional[str] = arguments.base_url
+    if not base_url:
+        url_queue: multiprocessing.Queue = multiprocessing.Queue()
+        server = multiprocessing.Process(
+            target=serve,
+            args=(url_queue, arguments.latency, arguments.seed),
+            daemon=True,
+        )
+        server.start()
+        base_url = url_queue.get(timeout=30)
+
+    try:
+        results: List[Dict] = [
+            benchmark(
+                name=name,
+                base_url=base_url,
+                rounds=arguments.rounds,
+                connections=arguments.connections,
+            )
+            for name in arguments.scenarios
+        ]
+    finally:
+        if server:
+            server.terminate()
+
+    previous: Dict[str, Dict] = {}
+    if arguments.compare:
+        with open(arguments.compare, encoding="utf-8") as compare_file:
+            previous = {
+                result["scenario"]: result
+                for result in json.load(compare_file)["results"]
+            }
+
+    table = Table(title=f"Network path (Knew Karma {version.release})", box=box.ROUNDED)
+    for column in (
+        "Scenario",
+        "Items",
+        "Requests",
+        "Seconds",
+        "Requests/s",
+        "Items/s",
+        "p50",
+        "p95",
+        "p99",
+        "Peak memory",
+    ):
+        table.add_column(column, justify="left" if column == "Scenario" else "right")
+    if previous:
+        table.add_column("vs. previous", justify="right")
+
+    for result in results:
+        row: List[str] = [
+            result["scenario"],
+            str(result["items"]),
+            str(result["requests"]),
+            f"{result['seconds']:.2f}",
+            f"{result['requests_per_second']:.0f}",
+            f"{result['items_per_second']:.0f}",
+            *[
+                f"{result[percentile_ms]:.1f} ms"
+                for percentile_ms in ("p50_ms", "p95_ms", "p99_ms")
+            ],
+            f"{result['peak_memory_bytes'] / 2**20:.1f} MiB",
+        ]
+        if previous:
+            baseline: Optional[Dict] = previous.get(result["scenario"])
+            row.append(
+                f"{result['items_per_second'] / baseline['items_per_second'] - 1:+.0%}"
+                if baseline
+                else "-"
+            )
+        table.add_row(*row)
+
+    Console().print(table)
+
+    if arguments.output:
+        with open(arguments.output, "w", encoding="utf-8") as output_file:
+            json.dump(
+                {
+                    "version": version.release,
+                    "python": platform.python_version(),
+                    "platform": platform.platform(),
+                    "time": time.time(),
+                    "options": {
+                        "rounds": arguments.rounds,
+                        "latency": arguments.latency,
+                        "connections": arguments.connections,
+                        "seed": arguments.seed,
+                    },
+                    "results": results,
+                },
+                output_file,
+                indent=2,
+            )
+
+
+if __name__ == "__main__":
+    main()
+
+
+# -------------------------------- END ----------------------------------------- #
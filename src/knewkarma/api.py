@@ -1,28 +1,817 @@
 import asyncio
+import base64
+import json
+import random
 import time
-from random import randint
-from typing import Callable, Literal, Union, Optional, List, Dict
-
-from aiohttp import ClientSession
+from contextlib import aclosing
+from email.utils import parsedate_to_datetime
+from types import SimpleNamespace
+from typing import (
+    AsyncIterator,
+    Callable,
+    Iterator,
+    Literal,
+    Union,
+    Optional,
+    List,
+    Dict,
+    Mapping,
+    Set,
+    Tuple,
+    get_args,
+)
+from urllib.parse import urlparse
+
+from aiohttp import (
+    ClientConnectionError,
+    ClientPayloadError,
+    ClientResponseError,
+    ClientSession,
+    TCPConnector,
+)
 from karmakaze import Sanitise
 from rich.status import Status
 
-__all__ = ["Api", "SORT_CRITERION", "TIMEFRAME", "TIME_FORMAT"]
+from .tools.cache import EntityCache, ResponseCache
+from .tools.cassette import Cassette
+from .tools.checkpoint import CheckpointStore
+from .tools.compat import default_instance_method, session_first
+from .tools.dedup import SeenSet
+from .tools.metrics import MetricsRegistry
+from .tools.progress import ProgressSink
+from .tools.sync import SyncState
+from .tools.tracing import RequestTrace, RequestTracer
+
+try:
+    import orjson
+
+    # orjson decodes large, deeply nested listing and comment pages several times faster than `json`.
+    JSON_DECODER: Callable[[Union[bytes, str]], Union[Dict, List]] = orjson.loads
+except ImportError:
+    JSON_DECODER = json.loads
+
+__all__ = [
+    "Api",
+    "BASE_URL",
+    "CircuitBreaker",
+    "ClientCredentials",
+    "JSON_DECODER",
+    "OAUTH_URL",
+    "RateLimiter",
+    "RetryPolicy",
+    "SORT_CRITERION",
+    "STATUS_URL",
+    "TIMEFRAME",
+    "TIME_FORMAT",
+]
 
 SORT_CRITERION = Literal["controversial", "new", "top", "best", "hot", "rising", "all"]
 TIMEFRAME = Literal["hour", "day", "week", "month", "year", "all"]
 TIME_FORMAT = Literal["concise", "locale"]
+POSTS_OR_COMMENTS_KIND = Literal[
+    "best",
+    "controversial",
+    "front_page",
+    "new",
+    "popular",
+    "rising",
+    "posts_from_a_subreddit",
+    "search_from_a_subreddit",
+    "posts_from_a_user",
+    "overview_of_a_user",
+    "comments_from_a_user",
+    "comments_from_a_post",
+]
+ENDPOINT_KIND = Literal[
+    "about", "comments", "listing", "search", "status", "wiki", "other"
+]
+
+BASE_URL: str = "https://www.reddit.com"
+STATUS_URL: str = "https://www.redditstatus.com"
+# Host of the authenticated API, which allows far more requests than `BASE_URL` does.
+OAUTH_URL: str = "https://oauth.reddit.com"
+
+# Maximum number of comment IDs that `/api/morechildren` accepts in one request.
+MORE_CHILDREN_BATCH_SIZE: int = 100
+MORE_CHILDREN_SORTS: tuple[str, ...] = ("top", "new", "controversial")
+# Maximum number of fullnames that `/api/info` accepts in one request.
+INFO_BATCH_SIZE: int = 100
+
+# Reddit stops serving a listing after about this many items, however far it is paginated.
+LISTING_CAP: int = 1000
+# Sorts that `harvest_posts_or_comments()` merges, and those of them that are ranked within a timeframe.
+HARVEST_SORTS: tuple[str, ...] = ("new", "hot", "rising", "top", "controversial")
+TIMEFRAME_SORTS: tuple[str, ...] = ("top", "controversial")
+# Sorts of a subreddit's posts, which Reddit serves from their own path (`/r/{subreddit}/{sort}.json`).
+# It ignores the `sort` parameter of `/r/{subreddit}.json`, which is always sorted by "hot".
+SUBREDDIT_SORTS: tuple[str, ...] = ("hot", "new", "top", "rising", "controversial")
+
+# Defaults for the connection pool of the `Api`'s own session: a bounded number of connections per host,
+# kept alive between requests, and cached DNS lookups.
+CONNECTOR_OPTIONS: Dict = {
+    "limit": 100,
+    "limit_per_host": 20,
+    "keepalive_timeout": 60,
+    "ttl_dns_cache": 300,
+}
+
+# Statuses of responses that are worth retrying: timeouts, rate limiting and server-side errors.
+RETRY_STATUSES: tuple[int, ...] = (408, 429, 500, 502, 503, 504)
+
+
+class RateLimiter:
+    """
+    Paces requests against the rate-limit budget that Reddit advertises in its response headers
+    (`X-Ratelimit-Remaining`, `X-Ratelimit-Reset` and `Retry-After`).
+
+    A single instance is shared by every coroutine that sends requests through it, so concurrent
+    requests draw from one budget. Requests are only delayed once that budget has actually been spent.
+    """
+
+    def __init__(self):
+        self._remaining: Optional[float] = None
+        self._window_budget: Optional[float] = None
+        self._reset_at: float = 0.0
+        self._blocked_until: float = 0.0
+        self._in_flight: int = 0
+        self._lock: Optional[asyncio.Lock] = None
+        self._lock_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @property
+    def remaining(self) -> Optional[float]:
+        """Number of requests left in the current window, or None if it is not known yet."""
+
+        return self._remaining
+
+    @property
+    def in_flight(self) -> int:
+        """Number of requests that have been reserved and not released yet."""
+
+        return self._in_flight
+
+    def delay(self) -> float:
+        """
+        Gets the number of seconds to wait before the next request may be sent.
+
+        :return: Seconds until the budget is replenished, or 0.0 if a request can be sent right away.
+        :rtype: float
+        """
+
+        now: float = time.monotonic()
+        if self._blocked_until > now:
+            return self._blocked_until - now
+
+        if self._remaining is not None and self._remaining < 1 and self._reset_at > now:
+            return self._reset_at - now
+
+        return 0.0
+
+    async def acquire(self):
+        """
+        Asynchronously reserves one request from the budget, sleeping only if the budget is exhausted.
+        """
+
+        async with self._get_lock():
+            delay: float = self.delay()
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+            # The window has rolled over since the budget was last reported, start it afresh.
+            if self._reset_at <= time.monotonic() and self._remaining is not None:
+                self._remaining = self._window_budget
+
+            if self._remaining is not None:
+                self._remaining -= 1
+            self._in_flight += 1
+
+    def release(self, headers: Optional[Mapping[str, str]] = None, status: int = 0):
+        """
+        Returns a reservation made by `acquire()` and updates the budget from the response headers.
+
+        :param headers: Headers of the response to the reserved request, if one was received.
+        :type headers: Optional[Mapping[str, str]]
+        :param status: HTTP status code of the response. Defaults to 0 (no response).
+        :type status: int
+        """
+
+        self._in_flight = max(self._in_flight - 1, 0)
+        if not headers:
+            return
+
+        now: float = time.monotonic()
+        remaining = self.header_value(headers, "X-Ratelimit-Remaining")
+        reset = self.header_value(headers, "X-Ratelimit-Reset")
+        used = self.header_value(headers, "X-Ratelimit-Used")
+
+        if remaining is not None and reset is not None:
+            # The server's count does not include requests that are still in flight.
+            self._remaining = remaining - self._in_flight
+            self._reset_at = now + reset
+            if used is not None:
+                self._window_budget = used + remaining
+
+        retry_after = self.header_value(headers, "Retry-After")
+        if retry_after is not None:
+            self._blocked_until = max(self._blocked_until, now + retry_after)
+        elif status == 429:
+            self._remaining = 0
+            self._reset_at = max(self._reset_at, now + 1)
+
+    def _get_lock(self) -> asyncio.Lock:
+        # A lock is bound to the event loop it is first used in, and the same limiter
+        # may outlive several `asyncio.run()` calls.
+        loop = asyncio.get_running_loop()
+        if self._lock is None or self._lock_loop is not loop:
+            self._lock = asyncio.Lock()
+            self._lock_loop = loop
+
+        return self._lock
+
+    @staticmethod
+    def header_value(headers: Mapping[str, str], name: str) -> Optional[float]:
+        """
+        Gets the numeric value of a rate-limit header.
+
+        :param headers: Response headers to read from.
+        :type headers: Mapping[str, str]
+        :param name: Name of the header.
+        :type name: str
+        :return: The header's value in seconds or requests, or None if it is missing or malformed.
+        :rtype: Optional[float]
+        """
+
+        value = headers.get(name)
+        if value is None:
+            return None
+
+        try:
+            return float(value)
+        except ValueError:
+            # `Retry-After` may also be given as an HTTP date.
+            try:
+                return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+            except (TypeError, ValueError):
+                return None
+
+
+class RetryPolicy:
+    """
+    Decides which failed requests are worth retrying, and how long to wait before each retry.
+
+    Connection errors, timeouts, and responses with a retryable status (e.g. 429, 502 or 503) are
+    retried up to `max_retries` times. Retries back off exponentially with full jitter, unless the
+    server asks for a longer wait with a `Retry-After` header.
+    """
+
+    def __init__(
+        self,
+        max_retries: int = 5,
+        base_delay: float = 1.0,
+        max_delay: float = 60.0,
+        retry_statuses: tuple[int, ...] = RETRY_STATUSES,
+    ):
+        """
+        Initialises the retry policy.
+
+        :param max_retries: Maximum number of times a request is retried. Defaults to 5.
+        :type max_retries: int
+        :param base_delay: Upper bound (in seconds) of the first backoff. Defaults to 1.0.
+        :type base_delay: float
+        :param max_delay: Upper bound (in seconds) of any backoff. Defaults to 60.0.
+        :type max_delay: float
+        :param retry_statuses: HTTP status codes that are retried. Defaults to `RETRY_STATUSES`.
+        :type retry_statuses: tuple[int, ...]
+        """
+
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.retry_statuses = retry_statuses
+        self.retries: int = 0
+        self.failures: int = 0
+
+    def is_retryable(self, error: BaseException) -> bool:
+        """
+        Checks whether a request that failed with the given error may succeed if sent again.
+
+        :param error: The error a request failed with.
+        :type error: BaseException
+        :return: True if the error is transient, False otherwise.
+        :rtype: bool
+        """
+
+        if isinstance(error, ClientResponseError):
+            return error.status in self.retry_statuses
+
+        return isinstance(
+            error, (ClientConnectionError, ClientPayloadError, asyncio.TimeoutError)
+        )
+
+    def should_retry(self, error: BaseException, attempt: int) -> bool:
+        """
+        Checks whether a request should be retried after failing on the given attempt, and counts
+        the retry or the failure.
+
+        :param error: The error the request failed with.
+        :type error: BaseException
+        :param attempt: Zero-based number of the attempt that failed.
+        :type attempt: int
+        :return: True if the request should be retried, False if the error should be raised.
+        :rtype: bool
+        """
+
+        if attempt < self.max_retries and self.is_retryable(error=error):
+            self.retries += 1
+            return True
+
+        self.failures += 1
+        return False
+
+    def backoff(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """
+        Gets the number of seconds to wait before retrying a request.
+
+        :param attempt: Zero-based number of the attempt that failed.
+        :type attempt: int
+        :param retry_after: Seconds the server asked to wait in a `Retry-After` header, if any.
+        :type retry_after: Optional[float]
+        :return: A random delay between 0 and the exponential backoff cap, or `retry_after` if it is longer.
+        :rtype: float
+        """
+
+        delay: float = random.uniform(
+            0, min(self.max_delay, self.base_delay * 2**attempt)
+        )
+
+        return max(delay, retry_after or 0.0)
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Gets the retry statistics.
+
+        :return: A dictionary with the number of `retries` made, and requests that `failed` for good.
+        :rtype: Dict[str, int]
+        """
+
+        return {"retries": self.retries, "failed": self.failures}
+
+
+class CircuitBreaker:
+    """
+    Pauses traffic to a host that keeps failing, instead of hammering it with requests.
+
+    Each host's circuit opens after `failure_threshold` consecutive failures. While it is open,
+    requests to that host wait for `recovery_timeout` seconds, after which a single probe request is
+    let through. The circuit closes again if the probe succeeds, and re-opens if it fails.
+    """
+
+    def __init__(self, failure_threshold: int = 5, recovery_timeout: float = 30.0):
+        """
+        Initialises the circuit breaker.
+
+        :param failure_threshold: Consecutive failures after which a host's circuit opens. Defaults to 5.
+        :type failure_threshold: int
+        :param recovery_timeout: Seconds to pause a host's traffic for once its circuit opens. Defaults to 30.0.
+        :type recovery_timeout: float
+        """
+
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.trips: int = 0
+        self._hosts: Dict[str, SimpleNamespace] = {}
+
+    def state(self, host: str) -> Literal["closed", "open", "half_open"]:
+        """
+        Gets the state of a host's circuit.
+
+        :param host: Hostname of the circuit.
+        :type host: str
+        :return: "closed" if requests flow freely, "open" if they are paused, or "half_open" if
+            a probe request may be (or is being) sent.
+        :rtype: Literal[str]
+        """
+
+        circuit = self._hosts.get(host)
+        if circuit is None or circuit.opened_until is None:
+            return "closed"
+
+        return "open" if circuit.opened_until > time.monotonic() else "half_open"
+
+    async def wait(self, host: str):
+        """
+        Asynchronously waits until a request may be sent to the specified host.
+
+        :param host: Hostname the request is for.
+        :type host: str
+        """
+
+        while True:
+            circuit = self._hosts.get(host)
+            if circuit is None or circuit.opened_until is None:
+                return
+
+            delay: float = circuit.opened_until - time.monotonic()
+            if delay <= 0 and not circuit.probing:
+                circuit.probing = True
+                return
+
+            # Either the circuit is still open, or another request is probing the host.
+            await asyncio.sleep(delay if delay > 0 else min(1.0, self.recovery_timeout))
+
+    def record_success(self, host: str):
+        """
+        Records a successful request to the specified host, closing its circuit.
+
+        :param host: Hostname the request was sent to.
+        :type host: str
+        """
+
+        self._hosts.pop(host, None)
+
+    def record_failure(self, host: str):
+        """
+        Records a failed request to the specified host, opening its circuit if it keeps failing.
+
+        :param host: Hostname the request was sent to.
+        :type host: str
+        """
+
+        circuit = self._hosts.setdefault(
+            host, SimpleNamespace(failures=0, opened_until=None, probing=False)
+        )
+        circuit.failures += 1
+
+        if circuit.probing or (
+            circuit.opened_until is None and circuit.failures >= self.failure_threshold
+        ):
+            circuit.opened_until = time.monotonic() + self.recovery_timeout
+            circuit.probing = False
+            self.trips += 1
+
+    def abandon(self, host: str):
+        """
+        Records that a request to the specified host ended without an outcome (e.g. it was cancelled),
+        so that another request may probe the host in its place.
+
+        :param host: Hostname the request was for.
+        :type host: str
+        """
+
+        circuit = self._hosts.get(host)
+        if circuit is not None:
+            circuit.probing = False
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Gets the circuit breaker statistics.
+
+        :return: A dictionary with the number of `trips` so far, and hosts whose circuit is currently `open`.
+        :rtype: Dict[str, int]
+        """
+
+        return {
+            "trips": self.trips,
+            "open": sum(self.state(host) != "closed" for host in self._hosts),
+        }
+
+
+class ClientCredentials:
+    """
+    Gets, caches and refreshes an app-only OAuth access token (the "client credentials" grant), so that
+    requests can be sent to `OAUTH_URL` instead of the unauthenticated JSON endpoints.
+
+    A token is fetched when it is first needed, reused by every request until it is about to expire,
+    and then fetched again. Concurrent requests that need a token share a single fetch.
+    """
+
+    def __init__(
+        self, client_id: str, client_secret: str, refresh_margin: float = 60.0
+    ):
+        """
+        Initialises the client credentials.
+
+        :param client_id: ID of the Reddit app (see https://www.reddit.com/prefs/apps).
+        :type client_id: str
+        :param client_secret: Secret of the Reddit app.
+        :type client_secret: str
+        :param refresh_margin: Seconds before a token expires at which a new one is fetched. Defaults to 60.0.
+        :type refresh_margin: float
+        """
+
+        self.client_id = client_id
+        self._client_secret = client_secret
+        self.refresh_margin = refresh_margin
+        self.fetches: int = 0
+        self._access_token: Optional[str] = None
+        self._expires_at: float = 0.0
+        self._lock: Optional[asyncio.Lock] = None
+        self._lock_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @property
+    def valid(self) -> bool:
+        """Whether a token has been fetched, and is not about to expire."""
+
+        return (
+            self._access_token is not None
+            and self._expires_at - self.refresh_margin > time.monotonic()
+        )
+
+    async def token(
+        self, session: ClientSession, url: str, headers: Optional[Dict] = None
+    ) -> str:
+        """
+        Asynchronously gets an access token, fetching a new one if there is none or it is about to expire.
+
+        :param session: An `aiohttp.ClientSession` to fetch the token with.
+        :type session: aiohttp.ClientSession
+        :param url: URL of the token endpoint.
+        :type url: str
+        :param headers: Headers to send with the token request (e.g. the User-Agent). Defaults to None.
+        :type headers: Optional[Dict]
+        :return: The access token.
+        :rtype: str
+        :raise aiohttp.ClientResponseError: If the token endpoint responds with an error status.
+        :raise PermissionError: If the credentials are rejected.
+        """
+
+        if self.valid:
+            return self._access_token
+
+        async with self._get_lock():
+            # Another request may have fetched a token while this one waited for the lock.
+            if self.valid:
+                return self._access_token
+
+            basic_credentials: str = base64.b64encode(
+                f"{self.client_id}:{self._client_secret}".encode("utf-8")
+            ).decode("ascii")
+            async with session.post(
+                url=url,
+                data={"grant_type": "client_credentials"},
+                headers={
+                    **(headers or {}),
+                    "Authorization": f"Basic {basic_credentials}",
+                },
+            ) as response:
+                response.raise_for_status()
+                token_data: Dict = await response.json(content_type=None)
+
+            if "access_token" not in token_data:
+                raise PermissionError(
+                    f"Reddit did not grant an access token: {token_data.get('error', token_data)}"
+                )
+
+            self.fetches += 1
+            self._access_token = token_data["access_token"]
+            self._expires_at = time.monotonic() + float(
+                token_data.get("expires_in", 3600)
+            )
+
+            return self._access_token
+
+    def invalidate(self, access_token: Optional[str] = None):
+        """
+        Forgets the current token (e.g. after it was rejected), so that a new one is fetched when next needed.
+
+        :param access_token: Only forget the current token if it is this one, so that a token that was
+            already replaced is not thrown away. Defaults to None (forget it regardless).
+        :type access_token: Optional[str]
+        """
+
+        if access_token is None or access_token == self._access_token:
+            self._access_token = None
+            self._expires_at = 0.0
+
+    def _get_lock(self) -> asyncio.Lock:
+        # Like `RateLimiter`, the credentials may be used across several event loops.
+        loop = asyncio.get_running_loop()
+        if self._lock is None or self._lock_loop is not loop:
+            self._lock = asyncio.Lock()
+            self._lock_loop = loop
+
+        return self._lock
 
 
 class Api:
     """Represents the Knew Karma API and provides methods for getting various data from the Reddit API."""
 
-    def __init__(self, headers: Optional[Dict] = None):
+    def __init__(
+        self,
+        headers: Optional[Dict] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        cache: Optional[ResponseCache] = None,
+        entity_cache: Optional[EntityCache] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        connector_options: Optional[Dict] = None,
+        json_decoder: Optional[Callable[[Union[bytes, str]], Union[Dict, List]]] = None,
+        checkpoints: Optional[CheckpointStore] = None,
+        progress: Optional[ProgressSink] = None,
+        tracer: Optional[RequestTracer] = None,
+        metrics: Optional[MetricsRegistry] = None,
+        base_url: str = BASE_URL,
+        status_url: Optional[str] = None,
+        cassette: Optional[Cassette] = None,
+        credentials: Optional[ClientCredentials] = None,
+        sync_state: Optional[SyncState] = None,
+        seen_set: Optional[SeenSet] = None,
+    ):
+        """
+        Initialises the Knew Karma API.
+
+        :param headers: Headers to send with every request. Defaults to None.
+        :type headers: Optional[Dict]
+        :param rate_limiter: A `RateLimiter` to pace requests with, which can be shared between
+            `Api` instances. Defaults to a new `RateLimiter`.
+        :type rate_limiter: Optional[RateLimiter]
+        :param cache: An optional on-disk `ResponseCache` to serve and revalidate responses from. Defaults to None.
+        :type cache: Optional[ResponseCache]
+        :param entity_cache: An optional in-memory `EntityCache` to serve repeated `get_entity()` lookups from.
+            Defaults to None.
+        :type entity_cache: Optional[EntityCache]
+        :param retry_policy: A `RetryPolicy` that decides which failed requests are retried.
+            Defaults to a new `RetryPolicy`.
+        :type retry_policy: Optional[RetryPolicy]
+        :param circuit_breaker: A `CircuitBreaker` that pauses traffic to failing hosts.
+            Defaults to a new `CircuitBreaker`.
+        :type circuit_breaker: Optional[CircuitBreaker]
+        :param connector_options: Keyword arguments for the `aiohttp.TCPConnector` of the `Api`'s own session,
+            merged over `CONNECTOR_OPTIONS`. Defaults to None.
+        :type connector_options: Optional[Dict]
+        :param json_decoder: A callable that decodes a JSON response body (bytes or str). Defaults to
+            `JSON_DECODER`, which is `orjson.loads` if orjson is installed, or `json.loads` otherwise.
+        :type json_decoder: Optional[Callable[[Union[bytes, str]], Union[Dict, List]]]
+        :param checkpoints: An optional `CheckpointStore` that paginated requests record their progress in
+            after every page, and resume from. Defaults to None.
+        :type checkpoints: Optional[CheckpointStore]
+        :param progress: A `ProgressSink` to emit progress events to (pages fetched, items so far, waits
+            and retries). Defaults to a sink that ignores them.
+        :type progress: Optional[ProgressSink]
+        :param tracer: An optional `RequestTracer` to record the phases and latency of every request with.
+            It is attached to the `Api`'s own session; other sessions need its `trace_config()`. Defaults to None.
+        :type tracer: Optional[RequestTracer]
+        :param metrics: An optional `MetricsRegistry` to record request, cache, item and queue metrics in.
+            Defaults to None.
+        :type metrics: Optional[MetricsRegistry]
+        :param base_url: Base URL that Reddit endpoints are built from, e.g. a local stand-in server's
+            (see `tools.fake_reddit.FakeReddit`). Defaults to `BASE_URL`.
+        :type base_url: str
+        :param status_url: Base URL of the Reddit status API. Defaults to `base_url` if that is overridden,
+            or `STATUS_URL` otherwise.
+        :type status_url: Optional[str]
+        :param cassette: An optional `Cassette` to record every response to, or to replay responses from
+            instead of sending requests (in which case no session is needed). Defaults to None.
+        :type cassette: Optional[Cassette]
+        :param credentials: Optional `ClientCredentials` of a Reddit app, to send requests to `OAUTH_URL`
+            with an app-only access token, for a higher rate limit. If `base_url` is overridden, requests
+            (and the token request) are sent there instead. Defaults to None.
+        :type credentials: Optional[ClientCredentials]
+        :param sync_state: An optional `SyncState` of listing high-water marks. If set, paginated listings
+            only return the items that are newer than their mark, listings sorted by "new" stop paginating
+            as soon as they reach it, and the mark is moved up to the newest item. Defaults to None.
+        :type sync_state: Optional[SyncState]
+        :param seen_set: An optional `SeenSet` shared by every paginated request, so that an item is only
+            returned once across listings (and, if it is saved, across runs). Without one, items are still
+            only returned once within each listing. Defaults to None.
+        :type seen_set: Optional[SeenSet]
+
+        Note:
+            The `Api` can own a long-lived, pooled `aiohttp.ClientSession`, so that connections (and their
+            TLS handshakes) are reused across requests. It is opened with `open()` or `async with api:`,
+            and is used by every method that is not given a session explicitly.
+        """
+
         self._headers = headers
         self._sanitise = Sanitise()
+        self._rate_limiter = rate_limiter or RateLimiter()
+        self.cache = cache
+        self.entity_cache = entity_cache
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.circuit_breaker = circuit_breaker or CircuitBreaker()
+        self._in_flight_requests: Dict[tuple, asyncio.Future] = {}
+        self._connector_options: Dict = {
+            **CONNECTOR_OPTIONS,
+            **(connector_options or {}),
+        }
+        self._session: Optional[ClientSession] = None
+        self._json_decoder = json_decoder or JSON_DECODER
+        self.checkpoints = checkpoints
+        self.progress = progress or ProgressSink()
+        self.tracer = tracer
+        self._items_started_at: Dict[str, float] = {}
+        self._metrics: Optional[MetricsRegistry] = None
+        self.metrics = metrics
+        self.base_url = base_url
+        self.status_url = status_url
+        self.cassette = cassette
+        self.credentials = credentials
+        self.sync_state = sync_state
+        self.seen_set = seen_set
+
+    @property
+    def api_url(self) -> str:
+        """Base URL that API requests are sent to: `OAUTH_URL` if credentials are set, or `base_url` otherwise."""
+
+        base: str = self.base_url.rstrip("/")
+        return OAUTH_URL if self.credentials and base == BASE_URL else base
+
+    @property
+    def metrics(self) -> Optional[MetricsRegistry]:
+        """The `MetricsRegistry` that metrics are recorded in, if any."""
+
+        return self._metrics
+
+    @metrics.setter
+    def metrics(self, metrics: Optional[MetricsRegistry]):
+        self._metrics = metrics
+        if metrics is not None:
+            metrics.add_collector(self._collect_metrics)
+
+    def _collect_metrics(self) -> Iterator[Tuple[str, float, Dict[str, str]]]:
+        yield "knewkarma_requests_in_flight", self._rate_limiter.in_flight, {}
+        yield "knewkarma_coalesced_requests_in_flight", len(
+            self._in_flight_requests
+        ), {}
+        if self._rate_limiter.remaining is not None:
+            yield "knewkarma_rate_limit_remaining", self._rate_limiter.remaining, {}
+        yield "knewkarma_retries_total", self.retry_policy.retries, {}
+        yield "knewkarma_circuit_breaker_trips_total", self.circuit_breaker.trips, {}
+
+        if self.entity_cache is not None:
+            yield "knewkarma_entity_cache_lookups_total", self.entity_cache.hits, {
+                "result": "hit"
+            }
+            yield "knewkarma_entity_cache_lookups_total", self.entity_cache.misses, {
+                "result": "miss"
+            }
+
+        lookups: Dict[str, float] = {
+            result: self._metrics.value("knewkarma_cache_lookups_total", result=result)
+            for result in ("hit", "stale", "revalidated", "miss")
+        }
+        if any(lookups.values()):
+            yield "knewkarma_cache_hit_ratio", (
+                lookups["hit"] + lookups["revalidated"]
+            ) / (lookups["hit"] + lookups["stale"] + lookups["miss"]), {}
+
+        now: float = time.monotonic()
+        for listing, started_at in self._items_started_at.items():
+            if now > started_at:
+                yield "knewkarma_items_per_second", self._metrics.value(
+                    "knewkarma_items_total", listing=listing
+                ) / (now - started_at), {"listing": listing}
+
+    async def __aenter__(self) -> "Api":
+        await self.open()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    @property
+    def session(self) -> ClientSession:
+        """
+        The `Api`'s own pooled session.
 
-    @staticmethod
+        :raise RuntimeError: If the session has not been opened with `open()` or `async with api:`.
+        """
+
+        if self._session is None or self._session.closed:
+            raise RuntimeError(
+                "No session was given, and the Api's own session is not open. "
+                "Pass a session, or open one with `await api.open()` or `async with api:`."
+            )
+
+        return self._session
+
+    async def open(self) -> ClientSession:
+        """
+        Asynchronously opens the `Api`'s own pooled session, if it is not open already.
+
+        :return: The `Api`'s own session.
+        :rtype: aiohttp.ClientSession
+        """
+
+        if self._session is None or self._session.closed:
+            self._session = ClientSession(
+                connector=TCPConnector(**self._connector_options),
+                trace_configs=[self.tracer.trace_config()] if self.tracer else None,
+            )
+
+        return self._session
+
+    async def close(self):
+        """
+        Asynchronously closes the `Api`'s own pooled session and its connections.
+        """
+
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    @default_instance_method
     def endpoint(
+        self,
         kind: Literal[
             "base",
             "user",
@@ -32,38 +821,83 @@ class Api:
             "reddit_status",
             "reddit_status_components",
             "username_available",
-        ]
+            "more_children",
+            "info",
+            "access_token",
+        ],
     ) -> str:
         """
-        A static method that contains endpoints for the specified `kind` of data.
+        Gets the endpoint for the specified `kind` of data, built from the `Api`'s base URL (or from
+        `OAUTH_URL`, if credentials are set).
 
         :param kind: Kind of data to get endpoint from.
         :type kind: Literal[str]
         :return: An endpoint of the specified `kind`.
         :rtype: str
         """
-        base = "https://www.reddit.com"
+        base: str = self.api_url
+        www_base: str = self.base_url.rstrip("/")
+        status_base = (
+            self.status_url or (www_base if www_base != BASE_URL else STATUS_URL)
+        ).rstrip("/")
         endpoint_map = {
             "base": base,
             "user": f"{base}/user",
             "users": f"{base}/users",
             "subreddit": f"{base}/r",
             "subreddits": f"{base}/subreddits",
-            "reddit_status": "https://www.redditstatus.com/api/v2/status.json",
-            "reddit_status_components": "https://www.redditstatus.com/api/v2/components.json",
+            "reddit_status": f"{status_base}/api/v2/status.json",
+            "reddit_status_components": f"{status_base}/api/v2/components.json",
             "username_available": f"{base}/api/username_available.json",
+            "more_children": f"{base}/api/morechildren.json",
+            "info": f"{base}/api/info.json",
+            "access_token": f"{www_base}/api/v1/access_token",
         }
 
         return endpoint_map.get(kind)
 
+    @staticmethod
+    def endpoint_kind(endpoint: str) -> ENDPOINT_KIND:
+        """
+        A static method that classifies an endpoint by the kind of data it returns.
+
+        :param endpoint: The endpoint to classify.
+        :type endpoint: str
+        :return: The kind of the endpoint.
+        :rtype: Literal[str]
+        """
+
+        url = urlparse(endpoint)
+
+        if (
+            url.hostname and url.hostname.endswith("redditstatus.com")
+        ) or url.path.startswith("/api/v2/"):
+            return "status"
+        if url.path.endswith("/about.json"):
+            return "about"
+        if "/wiki/" in url.path:
+            return "wiki"
+        if url.path.endswith("/search.json"):
+            return "search"
+        if "/comments/" in url.path or url.path.endswith("/morechildren.json"):
+            return "comments"
+        if url.path.endswith(".json") and "/api/" not in url.path:
+            return "listing"
+
+        return "other"
+
+    @session_first
     async def send_request(
-        self, session: ClientSession, endpoint: str, params: Optional[Dict] = None
+        self,
+        endpoint: str,
+        session: Optional[ClientSession] = None,
+        params: Optional[Dict] = None,
     ) -> Union[Dict, List, bool, None]:
         """
         Asynchronously sends a GET request to the specified API endpoint and returns JSON or list response.
 
-        :param session: An `aiohttp.ClientSession` for making the HTTP request.
-        :type session: aiohttp.ClientSession
+        :param session: An `aiohttp.ClientSession` for making the HTTP request. Defaults to the `Api`'s own session.
+        :type session: Optional[aiohttp.ClientSession]
         :param endpoint: The API endpoint to fetch data from.
         :type endpoint: str
         :param params: A dictionary containing requests parameters. Defaults to None.
@@ -71,24 +905,265 @@ class Api:
         :return: JSON data as a dictionary or list or a boolean value. Raises an exception if fetching fails.
         :rtype: Union[Dict, List, bool]
         :raise Exception: If any is encountered.
+
+        Note:
+            Identical requests (same endpoint and params) that are in flight at the same time share a single
+            HTTP request, and every caller receives the same decoded response object.
         """
 
-        try:
-            async with session.get(
-                url=endpoint, headers=self._headers, params=params
-            ) as response:
-                response.raise_for_status()
-                response_data: Union[Dict, List] = await response.json()
-                return response_data
+        # Replayed responses come from the cassette, so they need no session.
+        if session is None and not self._replaying:
+            session = self.session
+        request_key: tuple = (
+            endpoint,
+            json.dumps(params or {}, sort_keys=True, default=str),
+        )
+        in_flight_request = self._in_flight_requests.get(request_key)
+
+        if (
+            in_flight_request is None
+            or in_flight_request.get_loop() is not asyncio.get_running_loop()
+        ):
+            in_flight_request = asyncio.ensure_future(
+                self._send_request(
+                    session=session,
+                    endpoint=endpoint,
+                    params=dict(params) if params else params,
+                )
+            )
+            self._in_flight_requests[request_key] = in_flight_request
+
+            def forget_request(request: asyncio.Future):
+                if self._in_flight_requests.get(request_key) is request:
+                    del self._in_flight_requests[request_key]
+
+            in_flight_request.add_done_callback(forget_request)
+
+        # Shielded, so that one caller being cancelled does not cancel the request for the others.
+        return await asyncio.shield(in_flight_request)
+
+    async def _send_request(
+        self,
+        endpoint: str,
+        session: Optional[ClientSession] = None,
+        params: Optional[Dict] = None,
+    ) -> Union[Dict, List, bool, None]:
+        """
+        Asynchronously sends a GET request (see `send_request()`), serving it from the response cache
+        when possible and pacing it with the rate limiter otherwise. Transient failures are retried as
+        the retry policy allows, and requests to a host whose circuit is open wait until it recovers.
+
+        :param session: An `aiohttp.ClientSession` for making the HTTP request. Defaults to the `Api`'s own session.
+        :type session: Optional[aiohttp.ClientSession]
+        :param endpoint: The API endpoint to fetch data from.
+        :type endpoint: str
+        :param params: A dictionary containing requests parameters. Defaults to None.
+        :type params: Dict
+        :return: JSON data as a dictionary or list or a boolean value.
+        :rtype: Union[Dict, List, bool]
+        """
+
+        if self._replaying:
+            return self._json_decoder(
+                await self.cassette.replay(endpoint=endpoint, params=params)
+            )
+
+        headers: Dict = dict(self._headers or {})
+        cached_response = None
+
+        if self.cache:
+            endpoint_kind: ENDPOINT_KIND = self.endpoint_kind(endpoint=endpoint)
+            cached_response = self.cache.lookup(
+                url=endpoint, params=params, kind=endpoint_kind
+            )
+            if self._metrics:
+                self._metrics.inc(
+                    "knewkarma_cache_lookups_total",
+                    result=(
+                        "miss"
+                        if not cached_response
+                        else "hit" if cached_response.fresh else "stale"
+                    ),
+                )
+            if cached_response:
+                if cached_response.fresh:
+                    self._record(
+                        endpoint=endpoint, params=params, body=cached_response.body
+                    )
+                    return self._json_decoder(cached_response.body)
+
+                # Ask the server to only send the response if it has changed since it was cached.
+                if cached_response.etag:
+                    headers["If-None-Match"] = cached_response.etag
+                if cached_response.last_modified:
+                    headers["If-Modified-Since"] = cached_response.last_modified
+
+        host: str = urlparse(endpoint).hostname or ""
+        attempt: int = 0
+        access_token: Optional[str] = None
+        reauthorised: bool = False
+        while True:
+            await self.circuit_breaker.wait(host=host)
+            if self.credentials and endpoint.startswith(self.api_url):
+                try:
+                    access_token = await self.credentials.token(
+                        session=session,
+                        url=self.endpoint(kind="access_token"),
+                        headers=self._headers,
+                    )
+                except BaseException:
+                    # The request never reached the host, so let another request probe it instead.
+                    self.circuit_breaker.abandon(host=host)
+                    raise
+                headers["Authorization"] = f"bearer {access_token}"
+            rate_limit_delay: float = self._rate_limiter.delay()
+            if rate_limit_delay > 0:
+                self.progress.sleeping_until(
+                    until=time.time() + rate_limit_delay, reason="rate_limit"
+                )
+            await self._rate_limiter.acquire()
+            response_headers, response_status = None, 0
+            trace: Optional[RequestTrace] = (
+                self.tracer.start(endpoint=endpoint, kind=self.endpoint_kind(endpoint))
+                if self.tracer
+                else None
+            )
+            trace_error: Optional[BaseException] = None
+            started_at: float = time.perf_counter()
+            try:
+                async with session.get(
+                    url=endpoint,
+                    headers=headers,
+                    params=params,
+                    trace_request_ctx=trace,
+                ) as response:
+                    response_headers, response_status = (
+                        response.headers,
+                        response.status,
+                    )
+                    if self._metrics:
+                        self._metrics.inc(
+                            "knewkarma_requests_total",
+                            kind=self.endpoint_kind(endpoint),
+                            status=str(response.status),
+                        )
+                        if response.status == 429:
+                            self._metrics.inc("knewkarma_rate_limited_total")
+                    if response.status == 401 and access_token and not reauthorised:
+                        # The token was revoked, or expired early, so get a new one and try again once.
+                        # The host answered, so it is up.
+                        self.circuit_breaker.record_success(host=host)
+                        self.credentials.invalidate(access_token=access_token)
+                        reauthorised = True
+                        continue
+                    if response.status == 304 and cached_response:
+                        if self._metrics:
+                            self._metrics.inc(
+                                "knewkarma_cache_lookups_total", result="revalidated"
+                            )
+                        self.circuit_breaker.record_success(host=host)
+                        self.cache.refresh(url=endpoint, params=params)
+                        self._record(
+                            endpoint=endpoint,
+                            params=params,
+                            body=cached_response.body,
+                            elapsed=time.perf_counter() - started_at,
+                        )
+                        return self._json_decoder(cached_response.body)
+
+                    response.raise_for_status()
+                    response_body: bytes = await response.read()
+                    self.circuit_breaker.record_success(host=host)
+                    if trace:
+                        trace.size = len(response_body)
+                        trace.mark(phase="body_read")
+                    response_data: Union[Dict, List] = self._json_decoder(response_body)
+                    if trace:
+                        trace.mark(phase="decoded")
+
+                    self._record(
+                        endpoint=endpoint,
+                        params=params,
+                        body=response_body,
+                        elapsed=time.perf_counter() - started_at,
+                    )
+                    if self.cache:
+                        self.cache.store(
+                            url=endpoint,
+                            params=params,
+                            kind=endpoint_kind,
+                            body=response_body,
+                            etag=response.headers.get("ETag"),
+                            last_modified=response.headers.get("Last-Modified"),
+                        )
 
-        except Exception as error:
-            raise error
+                    return response_data
+
+            except asyncio.CancelledError as error:
+                trace_error = error
+                self.circuit_breaker.abandon(host=host)
+                raise
+            except Exception as error:
+                trace_error = error
+                # Being rate limited, or any other response that is not a transient failure,
+                # means that the host is up, so only transient failures trip the breaker.
+                if (
+                    self.retry_policy.is_retryable(error=error)
+                    and response_status != 429
+                ):
+                    self.circuit_breaker.record_failure(host=host)
+                elif response_status:
+                    self.circuit_breaker.record_success(host=host)
+                else:
+                    self.circuit_breaker.abandon(host=host)
+
+                if not self.retry_policy.should_retry(error=error, attempt=attempt):
+                    raise error
+
+                failed_with: Exception = error
+                delay: float = self.retry_policy.backoff(
+                    attempt=attempt,
+                    retry_after=RateLimiter.header_value(
+                        response_headers or {}, "Retry-After"
+                    ),
+                )
+            finally:
+                self._rate_limiter.release(
+                    headers=response_headers, status=response_status
+                )
+                if trace:
+                    self.tracer.finish(
+                        trace=trace, status=response_status, error=trace_error
+                    )
+
+            self.progress.retrying(
+                endpoint=endpoint, attempt=attempt + 2, delay=delay, error=failed_with
+            )
+            self.progress.sleeping_until(until=time.time() + delay, reason="retry")
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    @property
+    def _replaying(self) -> bool:
+        return self.cassette is not None and self.cassette.mode == "replay"
+
+    def _record(
+        self,
+        endpoint: str,
+        params: Optional[Dict],
+        body: bytes,
+        elapsed: float = 0.0,
+    ):
+        if self.cassette is not None and self.cassette.mode == "record":
+            self.cassette.record(
+                endpoint=endpoint, params=params, body=body, elapsed=elapsed
+            )
 
     async def _paginate_items(
         self,
-        session: ClientSession,
         sanitiser: Callable,
         limit: int,
+        session: Optional[ClientSession] = None,
         status: Optional[Status] = None,
         **kwargs: Union[str, bool, Dict],
     ) -> List[Dict]:
@@ -98,8 +1173,8 @@ class Api:
         of items is reached or there are no more items to fetch. It uses a specified processing function
         to handle the data from each request, ensuring no duplicates are returned.
 
-        :param session: An Aiohttp session to use for the request.
-        :type session: aiohttp.ClientSession
+        :param session: An Aiohttp session to use for the request. Defaults to the `Api`'s own session.
+        :type session: Optional[aiohttp.ClientSession]
         :param sanitiser: A callable used to sanitise response data.
         :type sanitiser: Callable
         :param limit: Maximum number of results to return.
@@ -108,21 +1183,115 @@ class Api:
         :rtype: List[Dict]
         """
 
-        # Initialise an empty list to store all items across paginated requests.
-        all_items: List = []
+        # Collect every page yielded by the paginator into one list.
+        all_items: List[Dict] = [
+            item
+            async for page in self._iter_items(
+                session=session,
+                sanitiser=sanitiser,
+                limit=limit,
+                status=status,
+                **kwargs,
+            )
+            for item in page
+        ]
+
+        # Return the list of all fetched and processed items.
+        return all_items
+
+    async def _iter_items(
+        self,
+        sanitiser: Callable,
+        limit: int,
+        session: Optional[ClientSession] = None,
+        status: Optional[Status] = None,
+        **kwargs: Union[str, bool, Dict],
+    ) -> AsyncIterator[List[Dict]]:
+        """
+        Asynchronously fetches and processes data in a paginated manner from a specified endpoint,
+        yielding each page of sanitised items as soon as it is fetched, until the specified limit
+        of items is reached or there are no more items to fetch.
+
+        :param session: An Aiohttp session to use for the request. Defaults to the `Api`'s own session.
+        :type session: Optional[aiohttp.ClientSession]
+        :param sanitiser: A callable used to sanitise response data.
+        :type sanitiser: Callable
+        :param limit: Maximum number of results to yield.
+        :type limit: int
+        :return: An asynchronous iterator of lists of dict objects, each list holding one page of data.
+        :rtype: AsyncIterator[List[Dict]]
+        """
+
+        # Keep count of the items yielded so far, instead of holding on to them.
+        items_count: int = 0
         # Initialise the ID of the last item fetched to None (used for pagination).
         last_item_id = None
 
-        params: Dict = kwargs.get("params")
+        params: Dict = kwargs.get("params") or {}
+
+        # Listings shift while they are paginated, so the same item can turn up on two pages. Each item is
+        # only yielded once, and not at all if the `Api`'s seen-set already holds it.
+        seen: SeenSet = self.seen_set if self.seen_set is not None else SeenSet()
+
+        # In sync mode, only items newer than the listing's high-water mark are yielded.
+        sync_key: Optional[str] = None
+        sync_mark: Optional[SimpleNamespace] = None
+        newest_item: Optional[Dict] = None
+        # Whether every item newer than the mark has been fetched, so that the mark can be moved up.
+        is_synced: bool = False
+        # Only listings served from a "new" path are known to be in time order, since Reddit ignores the
+        # `sort` parameter of some listings (e.g. a subreddit's), and serves their stickies first.
+        is_chronological: bool = urlparse(kwargs.get("endpoint")).path.endswith(
+            "/new.json"
+        )
+        if self.sync_state and not kwargs.get("is_comments_from_a_post"):
+            sync_key = self.sync_state.key(
+                endpoint=kwargs.get("endpoint"), params=params
+            )
+            sync_mark = self.sync_state.mark(key=sync_key)
+
+        # Post comments come in a single response, so only paginated listings are checkpointed.
+        checkpoint_key: Optional[str] = None
+        if self.checkpoints and not kwargs.get("is_comments_from_a_post"):
+            checkpoint_key = self.checkpoints.key(
+                endpoint=kwargs.get("endpoint"), params=params, limit=limit
+            )
+            checkpoint = (
+                self.checkpoints.load(key=checkpoint_key)
+                if self.checkpoints.resume
+                else None
+            )
+            if checkpoint:
+                if status:
+                    status.update(
+                        f"Resuming from checkpoint ({len(checkpoint.items)} items)"
+                    )
+                last_item_id, items_count = checkpoint.after, checkpoint.count
+                if checkpoint.items:
+                    for item in checkpoint.items:
+                        seen.add(seen.fullname(item))
+                    # Items fetched before the interruption count towards the listing's new mark.
+                    if sync_key:
+                        newest_item = self.sync_state.newest(checkpoint.items)
+                    yield checkpoint.items
+            else:
+                self.checkpoints.discard(key=checkpoint_key)
+
+        # Items created before `since`, or at or after `until`, are left out.
+        since: Optional[float] = kwargs.get("since")
+        until: Optional[float] = kwargs.get("until")
+
+        def created_at(item: Dict) -> float:
+            return item.get("data", {}).get("created_utc", 0.0)
 
         # Continue fetching data until the limit is reached or no more items are available.
-        while len(all_items) < limit:
+        while items_count < limit:
             # Make an asynchronous request to the endpoint.
             response = await self.send_request(
                 session=session,
                 endpoint=kwargs.get("endpoint"),
                 params=(
-                    params.update({"after": last_item_id, "count": len(all_items)})
+                    {**params, "after": last_item_id, "count": items_count}
                     if last_item_id
                     else params
                 ),
@@ -136,127 +1305,192 @@ class Api:
                 # Iterate over the children in the response to extract comments or "more" items.
                 for item in response[1].get("data").get("children"):
                     if self._sanitise.kind(item) == "t1":
-                        sanitised_item = sanitiser(item)
                         # If the item is a comment (kind == "t1"), add it to the items list.
-                        items.append(sanitised_item)
+                        items.append(item)
                     elif self._sanitise.kind(item) == "more":
                         # If the item is of kind "more", extract the IDs for additional comments.
-                        more_items_ids.extend(item)
+                        more_items_ids.extend(item.get("data", {}).get("children", []))
 
-                # If there are more items to fetch (kind == "more"), make additional requests.
+                # If there are more items to fetch (kind == "more"), expand them in batches.
                 if more_items_ids:
                     await self._paginate_more_items(
                         session=session,
                         fetched_items=items,
                         more_items_ids=more_items_ids,
-                        endpoint=kwargs.get("endpoint"),
+                        link_id=kwargs.get("link_id"),
+                        limit=limit - items_count,
+                        sort=params.get("sort"),
                     )
-
-            # If not handling comments, simply extract the items from the response.
-            items = sanitiser(response)
+            else:
+                # If not handling comments, simply extract the items from the response.
+                items = sanitiser(response)
 
             # If no items are found, break the loop as there's nothing more to fetch.
             if not items:
+                is_synced = True
                 break
 
-            # Determine how many more items are needed to reach the limit.
-            items_to_limit = limit - len(all_items)
-
-            # Add the processed items to the all_items list, up to the specified limit.
-            all_items.extend(items[:items_to_limit])
+            # Drop the items that were seen on an earlier run. "New" listings hold nothing
+            # newer past the first of them, so they need not be paginated any further.
+            reached_mark: bool = False
+            if sync_key:
+                new_items: List[Dict] = [
+                    item
+                    for item in items
+                    if not self.sync_state.is_seen(mark=sync_mark, item=item)
+                ]
+                reached_mark = is_chronological and len(new_items) < len(items)
+                items = new_items
+
+            # "New" listings hold nothing newer than `since` past the first item older than it,
+            # so they need not be paginated any further either.
+            reached_since: bool = False
+            if since is not None or until is not None:
+                items_in_window: List[Dict] = [
+                    item
+                    for item in items
+                    if (since is None or created_at(item) >= since)
+                    and (until is None or created_at(item) < until)
+                ]
+                reached_since = (
+                    is_chronological
+                    and since is not None
+                    and any(created_at(item) < since for item in items)
+                )
+                items = items_in_window
+
+            # Keep the processed items that have not been seen yet, up to the specified limit.
+            window: List[Dict] = items[: limit - items_count]
+            page: List[Dict] = seen.filter(window)
+            items_count += len(page)
+            if sync_key:
+                newest_item = self.sync_state.newest(
+                    [newest_item, *page] if newest_item else page
+                )
 
             # Update the last_item_id to the ID of the last fetched item for pagination.
             last_item_id = (
                 self._sanitise.pagination_id(response=response[1])
-                if kwargs.get("is_post_comments")
+                if kwargs.get("is_comments_from_a_post")
                 else self._sanitise.pagination_id(response=response)
             )
 
-            # If we've reached the specified limit, break the loop.
-            if len(all_items) == limit:
+            # Persist the page before handing it out, so a crash while it is processed does not lose it.
+            if checkpoint_key and items_count < limit and last_item_id:
+                self.checkpoints.save(
+                    key=checkpoint_key,
+                    items=page,
+                    after=last_item_id,
+                    count=items_count,
+                    endpoint=kwargs.get("endpoint"),
+                )
+
+            if self._metrics:
+                listing: str = kwargs.get("listing", "other")
+                self._items_started_at.setdefault(listing, time.monotonic())
+                self._metrics.inc("knewkarma_items_total", len(page), listing=listing)
+
+            self.progress.page_fetched(endpoint=kwargs.get("endpoint"), count=len(page))
+            self.progress.items_so_far(count=items_count, limit=limit)
+            # Pages whose items were all left out are skipped, but pagination carries on past them.
+            if page:
+                yield page
+
+            # If we've reached the high-water mark, the last page or the specified limit, break the loop.
+            if reached_mark or reached_since or not last_item_id:
+                # Unless the limit cut the page short, which leaves newer items unfetched.
+                is_synced = len(window) == len(items)
+                break
+            if items_count == limit:
                 break
 
-            # Introduce a random sleep duration between 1 and 5 seconds to avoid rate-limiting.
-            sleep_duration = randint(1, 5)
+        # The request was paginated to its end, so there is nothing left to resume.
+        if checkpoint_key:
+            self.checkpoints.discard(key=checkpoint_key)
 
-            # If a status object is provided, use it to display a countdown timer.
-            if status:
-                await self._pagination_countdown_timer(
-                    status=status,
-                    duration=sleep_duration,
-                    current_count=len(all_items),
-                    overall_count=limit,
-                )
-            else:
-                # Otherwise, just sleep for the calculated duration.
-                await asyncio.sleep(sleep_duration)
-
-        # Return the list of all fetched and processed items.
-        return all_items
+        # A mark is only moved up once everything newer than it has been fetched; otherwise, items
+        # cut off by the limit would never be fetched by later runs.
+        if sync_key and newest_item and (is_synced or sync_mark is None):
+            self.sync_state.advance(key=sync_key, item=newest_item)
 
     async def _paginate_more_items(
         self,
-        session: ClientSession,
         more_items_ids: List[str],
-        endpoint: str,
+        link_id: str,
         fetched_items: List[Dict],
+        limit: int,
+        session: Optional[ClientSession] = None,
+        sort: Optional[SORT_CRITERION] = None,
     ):
-        for more_id in more_items_ids:
-            # Construct the endpoint for each additional comment ID.
-            more_endpoint = f"{endpoint}&comment={more_id}"
-            # Make an asynchronous request to fetch the additional comments.
-            more_response = await self.send_request(
-                session=session, endpoint=more_endpoint
-            )
-            # Extract the items (comments) from the response.
-            more_items, _ = self._sanitise.comments(
-                response=more_response[1].get("data", {}).get("children", [])
-            )
-
-            # Add the fetched items to the main items list.
-            fetched_items.extend(more_items)
-
-    @staticmethod
-    async def _pagination_countdown_timer(
-        status: Status, duration: int, current_count: int, overall_count: int
-    ):
         """
-        A static method handles the live countdown during pagination, updating the status bar with the remaining time.
+        Asynchronously expands collapsed ("more") comments by sending their IDs to `/api/morechildren`
+        in batches of up to `MORE_CHILDREN_BATCH_SIZE`, concurrently and under the shared rate-limit budget.
+        Any "more" stubs found in the expanded comments are expanded in turn, until the limit is reached.
+
+        :param session: An `aiohttp.ClientSession` for making the HTTP request. Defaults to the `Api`'s own session.
+        :type session: Optional[aiohttp.ClientSession]
+        :param more_items_ids: IDs of the collapsed comments to expand.
+        :type more_items_ids: List[str]
+        :param link_id: Fullname (`t3_` prefixed ID) of the post that the comments belong to.
+        :type link_id: str
+        :param fetched_items: A list of already fetched comments, which the expanded comments are added to.
+        :type fetched_items: List[Dict]
+        :param limit: Maximum number of comments that `fetched_items` should hold.
+        :type limit: int
+        :param sort: Sort criterion for the expanded comments. Defaults to None.
+        :type sort: Optional[SORT_CRITERION]
+        """
 
-        :param status: A Status object used to display the countdown.
-        :type status: rich.status.Status
-        :param duration: The duration for which to run the countdown.
-        :type duration: int
-        :param current_count: Current number of items fetched.
-        :type current_count: int
-        :param overall_count: Overall number of items to fetch.
-        :type overall_count: int
-        """
-
-        from .tools.shared import style
-
-        end_time: float = time.time() + duration
-        while time.time() < end_time:
-            remaining_time: float = end_time - time.time()
-            remaining_seconds: int = int(remaining_time)
-            remaining_milliseconds: int = int(
-                (remaining_time - remaining_seconds) * 100
+        # Drop duplicate IDs while keeping their original order.
+        pending_ids: List[str] = list(dict.fromkeys(more_items_ids))
+
+        while pending_ids and len(fetched_items) < limit:
+            # Each ID expands to at least one comment, so only send as many batches as the limit needs.
+            batch_count: int = -(
+                -(limit - len(fetched_items)) // MORE_CHILDREN_BATCH_SIZE
             )
+            batch_ids: List[str] = pending_ids[: batch_count * MORE_CHILDREN_BATCH_SIZE]
+            pending_ids = pending_ids[len(batch_ids) :]
 
-            status.update(
-                f"{style.cyan}{current_count}{style.reset} (of {style.cyan}{overall_count}{style.reset}) items retrieved so far. "
-                f"Resuming in {style.cyan}{remaining_seconds}.{remaining_milliseconds:02}{style.reset} seconds",
+            responses = await asyncio.gather(
+                *[
+                    self.send_request(
+                        session=session,
+                        endpoint=self.endpoint(kind="more_children"),
+                        params={
+                            "api_type": "json",
+                            "link_id": link_id,
+                            "children": ",".join(
+                                batch_ids[index : index + MORE_CHILDREN_BATCH_SIZE]
+                            ),
+                            "raw_json": 1,
+                            **({"sort": sort} if sort in MORE_CHILDREN_SORTS else {}),
+                        },
+                    )
+                    for index in range(0, len(batch_ids), MORE_CHILDREN_BATCH_SIZE)
+                ]
             )
-            await asyncio.sleep(0.01)  # Sleep for 10 milliseconds
+
+            for response in responses:
+                things: List[Dict] = (
+                    response.get("json", {}).get("data", {}).get("things", [])
+                )
+                for thing in things:
+                    if self._sanitise.kind(thing) == "t1":
+                        fetched_items.append(thing)
+                    elif self._sanitise.kind(thing) == "more":
+                        pending_ids.extend(thing.get("data", {}).get("children", []))
+
+        del fetched_items[limit:]
 
     async def check_reddit_status(
-        self, session: ClientSession, status: Optional[Status] = None
+        self, session: Optional[ClientSession] = None, status: Optional[Status] = None
     ):
         """
         Asynchronously checks Reddit API and infrastructure status.
 
-        :param session: An `aiohttp.ClientSession` for making the HTTP request.
-        :type session: aiohttp.ClientSession
+        :param session: An `aiohttp.ClientSession` for making the HTTP request. Defaults to the `Api`'s own session.
+        :type session: Optional[aiohttp.ClientSession]
         :param status: An optional `Status` object for displaying status messages.
         :type status: Optional[rich.status.Status]
         """
@@ -324,18 +1558,19 @@ class Api:
 
                         console.print(table)
 
+    @session_first
     async def get_entity(
         self,
-        session: ClientSession,
         kind: Literal["comment", "post", "subreddit", "user", "wikipage"],
+        session: Optional[ClientSession] = None,
         status: Optional[Status] = None,
         **kwargs: str,
     ) -> Dict:
         """
         Asynchronously gets data from the specified entity.
 
-        :param session: An `aiohttp.ClientSession` for making the HTTP request.
-        :type session: aiohttp.ClientSession
+        :param session: An `aiohttp.ClientSession` for making the HTTP request. Defaults to the `Api`'s own session.
+        :type session: Optional[aiohttp.ClientSession]
         :param kind: The type of entity to get data from
         :type kind: str
         :param status: An optional `rich.status.Status` object for displaying status messages. Defaults to None.
@@ -376,46 +1611,389 @@ class Api:
         }
 
         if status:
-            status.update(
-                f"Retrieving {kind} data",
-            )
+            status.update(
+                f"Retrieving {kind} data",
+            )
+
+        identity: Dict = {
+            "username": username,
+            "subreddit": subreddit,
+            "id": post_id,
+            "page_name": kwargs.get("page_name"),
+        }
+        if self.entity_cache is not None:
+            cached_entity = self.entity_cache.get(kind, **identity)
+            if cached_entity is not None:
+                return cached_entity
+
+        endpoint = entity_mapping.get(kind).get("endpoint")
+        sanitiser = entity_mapping.get(kind).get("sanitiser")
+
+        response = await self.send_request(endpoint=endpoint, session=session)
+        sanitised_response = sanitiser(response)
+
+        if self.entity_cache is not None and sanitised_response:
+            self.entity_cache.set(kind, sanitised_response, **identity)
+
+        return sanitised_response
+
+    @session_first
+    async def get_info(
+        self,
+        fullnames: List[str],
+        session: Optional[ClientSession] = None,
+        status: Optional[Status] = None,
+    ) -> List[Dict]:
+        """
+        Asynchronously looks up posts, comments and subreddits by their fullnames (e.g. "t3_abc123"),
+        sending them to `/api/info` in batches of up to `INFO_BATCH_SIZE`, concurrently and under the
+        shared rate-limit budget.
+
+        :param session: An `aiohttp.ClientSession` for making the HTTP request. Defaults to the `Api`'s own session.
+        :type session: Optional[aiohttp.ClientSession]
+        :param fullnames: Fullnames of the posts (`t3_`), comments (`t1_`) and subreddits (`t5_`) to look up.
+        :type fullnames: List[str]
+        :param status: An optional `rich.status.Status` object for displaying status messages. Defaults to None.
+        :type status: Optional[rich.status.Status]
+        :return: The things that were found, in the same order as `fullnames`. Fullnames that do not exist
+            (or have been removed) are left out.
+        :rtype: List[Dict]
+        :raise ValueError: If a fullname is not of a post, comment or subreddit.
+        """
+
+        # Drop duplicate fullnames while keeping their original order.
+        unique_fullnames: List[str] = list(dict.fromkeys(fullnames))
+        for fullname in unique_fullnames:
+            if fullname[:3] not in ("t1_", "t3_", "t5_"):
+                raise ValueError(
+                    f"{fullname!r} is not the fullname of a post (t3_), comment (t1_) or subreddit (t5_)"
+                )
+
+        if status:
+            status.update(f"Retrieving {len(unique_fullnames)} items by fullname")
+
+        responses = await asyncio.gather(
+            *[
+                self.send_request(
+                    session=session,
+                    endpoint=self.endpoint(kind="info"),
+                    params={
+                        "id": ",".join(
+                            unique_fullnames[index : index + INFO_BATCH_SIZE]
+                        ),
+                        "raw_json": 1,
+                    },
+                )
+                for index in range(0, len(unique_fullnames), INFO_BATCH_SIZE)
+            ]
+        )
+
+        # Batches can come back in any order, with missing fullnames left out, so the things are
+        # matched back to the fullnames they were asked for.
+        things: Dict[str, Dict] = {}
+        for response in responses:
+            for thing in self._sanitise.posts(response) or []:
+                data: Dict = thing.get("data", {})
+                things[data.get("name") or f"{thing.get('kind')}_{data.get('id')}"] = (
+                    thing
+                )
+
+        return [things[fullname] for fullname in unique_fullnames if fullname in things]
+
+    def _posts_or_comments_request(
+        self,
+        kind: POSTS_OR_COMMENTS_KIND,
+        limit: int,
+        timeframe: TIMEFRAME = "all",
+        sort: SORT_CRITERION = "all",
+        since: Optional[float] = None,
+        until: Optional[float] = None,
+        **kwargs: str,
+    ) -> Dict:
+        """
+        Builds the pagination arguments (endpoint, params and sanitiser) for getting posts or comments.
+
+        :param kind: The kind of posts to be fetched.
+        :type kind: str
+        :param limit: Maximum number of posts to get.
+        :type limit: int
+        :param timeframe: Timeframe from which to get posts.
+        :type timeframe: Literal
+        :param sort: Posts' sort criterion.
+        :type sort: str
+        :param since: Unix time that items must have been created at or after. Defaults to None.
+        :type since: Optional[float]
+        :param until: Unix time that items must have been created before. Defaults to None.
+        :type until: Optional[float]
+        :return: A dictionary of keyword arguments for `_iter_items()` or `_paginate_items()`.
+        :rtype: Dict
+        """
+
+        username = kwargs.get("username")
+        subreddit = kwargs.get("subreddit")
+
+        posts_or_comments_mapping = {
+            "best": f"{self.endpoint(kind='base')}/r/{kind}.json",
+            "controversial": f"{self.endpoint(kind='base')}/r/{kind}.json",
+            "front_page": f"{self.endpoint(kind='base')}/.json",
+            "new": f"{self.endpoint(kind='base')}/new.json",
+            "popular": f"{self.endpoint(kind='base')}/r/{kind}.json",
+            "rising": f"{self.endpoint(kind='base')}/r/{kind}.json",
+            "posts_from_a_subreddit": (
+                f"{self.endpoint(kind='subreddit')}/{subreddit}/{sort}.json"
+                if sort in SUBREDDIT_SORTS
+                else f"{self.endpoint(kind='subreddit')}/{subreddit}.json"
+            ),
+            "posts_from_a_user": f"{self.endpoint(kind='user')}/{username}/submitted.json",
+            "overview_of_a_user": f"{self.endpoint(kind='user')}/{username}/overview.json",
+            "comments_from_a_user": f"{self.endpoint(kind='user')}/{username}/comments.json",
+            "comments_from_a_post": f"{self.endpoint(kind='subreddit')}/{subreddit}"
+            f"/comments/{kwargs.get('id')}.json",
+            "search_from_a_subreddit": f"{self.endpoint(kind='subreddit')}/{subreddit}"
+            f"/search.json",
+        }
+
+        endpoint = posts_or_comments_mapping.get(kind)
+        params = {"limit": limit, "sort": sort, "t": timeframe, "raw_json": 1}
+        params.update(
+            {"q": kwargs.get("query"), "restrict_sr": 1}
+            if kind == "search_from_a_subreddit"
+            else {}
+        )
+
+        sanitiser = (
+            self._sanitise.comments
+            if kind in ["user_comments", "user_overview", "post_comments"]
+            else self._sanitise.posts
+        )
+
+        return {
+            "endpoint": endpoint,
+            "params": params,
+            "sanitiser": sanitiser,
+            "limit": limit,
+            "is_comments_from_a_post": (
+                True if kind == "comments_from_a_post" else False
+            ),
+            "link_id": f"t3_{kwargs.get('id')}",
+            "listing": kind,
+            "since": since,
+            "until": until,
+        }
+
+    @session_first
+    async def get_posts_or_comments(
+        self,
+        kind: POSTS_OR_COMMENTS_KIND,
+        limit: int,
+        session: Optional[ClientSession] = None,
+        timeframe: TIMEFRAME = "all",
+        sort: SORT_CRITERION = "all",
+        status: Optional[Status] = None,
+        since: Optional[float] = None,
+        until: Optional[float] = None,
+        **kwargs: str,
+    ) -> List[Dict]:
+        """
+        Asynchronously gets a specified number of posts or comments, with a specified sorting criterion, from the specified source.
+
+        :param session: An `aiohttp.ClientSession` for making the HTTP request. Defaults to the `Api`'s own session.
+        :type session: Optional[aiohttp.ClientSession]
+        :param kind: The kind of posts to be fetched.
+        :type kind: str
+        :param limit: Maximum number of posts to get.
+        :type limit: int
+        :param sort: Posts' sort criterion.
+        :type sort: str
+        :param timeframe: Timeframe from which to get posts.
+        :type timeframe: Literal
+        :param status: An optional `rich.status.Status` object for displaying status messages. Defaults to None.
+        :type status: rich.status.Status
+        :param since: Unix time that items must have been created at or after. Listings sorted by "new" stop
+            paginating at the first item created before it. Defaults to None.
+        :type since: Optional[float]
+        :param until: Unix time that items must have been created before. Defaults to None.
+        :type until: Optional[float]
+        :return: A list of dictionaries, each containing post data.
+        :rtype: List[Dict]
+        """
+
+        if status:
+            status.update(f"Retrieving {limit} {kind} (posts/comments)")
+
+        posts = await self._paginate_items(
+            session=session,
+            status=status,
+            **self._posts_or_comments_request(
+                kind=kind,
+                limit=limit,
+                timeframe=timeframe,
+                sort=sort,
+                since=since,
+                until=until,
+                **kwargs,
+            ),
+        )
+
+        return posts
+
+    @session_first
+    async def harvest_posts_or_comments(
+        self,
+        kind: POSTS_OR_COMMENTS_KIND,
+        limit: Optional[int] = None,
+        session: Optional[ClientSession] = None,
+        sorts: tuple[str, ...] = HARVEST_SORTS,
+        timeframes: tuple[str, ...] = get_args(TIMEFRAME),
+        status: Optional[Status] = None,
+        **kwargs: Union[str, float, None],
+    ) -> Tuple[List[Dict], List[Dict]]:
+        """
+        Asynchronously gets posts or comments from every sort (and, for sorts ranked within a timeframe,
+        every timeframe) of the specified source at once, and merges them by fullname, to get past the
+        ~1,000-item cap that Reddit puts on each listing. Once `limit` unique items have been fetched,
+        every listing stops paginating.
+
+        :param session: An `aiohttp.ClientSession` for making the HTTP request. Defaults to the `Api`'s own session.
+        :type session: Optional[aiohttp.ClientSession]
+        :param kind: The kind of posts or comments to be fetched, e.g. "posts_from_a_subreddit".
+        :type kind: str
+        :param limit: Maximum number of unique items to get from all the listings together. Defaults to
+            None (every item of every listing).
+        :type limit: Optional[int]
+        :param sorts: Sorts to get listings of. Defaults to `HARVEST_SORTS`.
+        :type sorts: tuple[str, ...]
+        :param timeframes: Timeframes to get the listings of `TIMEFRAME_SORTS` in. Defaults to every timeframe.
+        :type timeframes: tuple[str, ...]
+        :param status: An optional `rich.status.Status` object for displaying status messages. Defaults to None.
+        :type status: rich.status.Status
+        :param kwargs: Further arguments for `get_posts_or_comments()`, e.g. `subreddit`, `username`,
+            `since` and `until`.
+        :return: Up to `limit` merged items, and the coverage of each listing: its sort, timeframe, number of
+            items, number of items that no listing before it had ("new_items"), running total of unique items
+            and error (if it could not be retrieved). Listings are ordered by how many new items they add.
+        :rtype: Tuple[List[Dict], List[Dict]]
+
+        Note:
+            Listings that share the `Api`'s `seen_set` leave out each other's items, which makes their
+            coverage depend on which of them got to an item first.
+        """
+
+        listings: List[Tuple[str, str]] = [
+            (sort, timeframe)
+            for sort in sorts
+            for timeframe in (timeframes if sort in TIMEFRAME_SORTS else ("all",))
+        ]
+        if status:
+            status.update(f"Harvesting {len(listings)} listings of {kind}")
 
-        endpoint = entity_mapping.get(kind).get("endpoint")
-        sanitiser = entity_mapping.get(kind).get("sanitiser")
+        results: List[Union[List[Dict], BaseException]] = [[] for _ in listings]
+        fetched: Set[str] = set()
 
-        response = await self.send_request(endpoint=endpoint, session=session)
-        sanitised_response = sanitiser(response)
+        def is_budget_spent() -> bool:
+            return limit is not None and len(fetched) >= limit
 
-        return sanitised_response
+        async def harvest_listing(index: int, sort: str, timeframe: str):
+            try:
+                async with aclosing(
+                    self.iter_posts_or_comments(
+                        session=session,
+                        kind=kind,
+                        limit=(
+                            min(limit, LISTING_CAP)
+                            if limit is not None
+                            else LISTING_CAP
+                        ),
+                        sort=sort,
+                        timeframe=timeframe,
+                        **kwargs,
+                    )
+                ) as pages:
+                    # Every listing stops at the end of its current page once the budget is spent.
+                    async for page in pages:
+                        results[index].extend(page)
+                        fetched.update(SeenSet.fullname(item) for item in page)
+                        if is_budget_spent():
+                            break
+            except Exception as error:
+                results[index] = error
+
+        await asyncio.gather(
+            *[
+                harvest_listing(index=index, sort=sort, timeframe=timeframe)
+                for index, (sort, timeframe) in enumerate(listings)
+            ]
+        )
 
-    async def get_posts_or_comments(
+        # Listings are merged greedily, the one adding the most unseen items first, so that the coverage
+        # shows how little the last listings add.
+        merged: Dict[str, Dict] = {}
+        pending: List[int] = [
+            index
+            for index, result in enumerate(results)
+            if not isinstance(result, BaseException)
+        ]
+        coverage: List[Dict] = []
+        while pending:
+            best: int = max(
+                pending,
+                key=lambda index: sum(
+                    SeenSet.fullname(item) not in merged for item in results[index]
+                ),
+            )
+            pending.remove(best)
+            new_items: int = 0
+            for item in results[best]:
+                fullname: str = SeenSet.fullname(item)
+                if fullname not in merged:
+                    merged[fullname] = item
+                    new_items += 1
+
+            coverage.append(
+                {
+                    "sort": listings[best][0],
+                    "timeframe": listings[best][1],
+                    "items": len(results[best]),
+                    "new_items": new_items,
+                    "total_items": len(merged),
+                    "error": None,
+                }
+            )
+
+        coverage.extend(
+            {
+                "sort": listings[index][0],
+                "timeframe": listings[index][1],
+                "items": 0,
+                "new_items": 0,
+                "total_items": len(merged),
+                "error": str(result) or type(result).__name__,
+            }
+            for index, result in enumerate(results)
+            if isinstance(result, BaseException)
+        )
+
+        return list(merged.values())[:limit], coverage
+
+    @session_first
+    async def iter_posts_or_comments(
         self,
-        session: ClientSession,
-        kind: Literal[
-            "best",
-            "controversial",
-            "front_page",
-            "new",
-            "popular",
-            "rising",
-            "posts_from_a_subreddit",
-            "search_from_a_subreddit",
-            "posts_from_a_user",
-            "overview_of_a_user",
-            "comments_from_a_user",
-            "comments_from_a_post",
-        ],
+        kind: POSTS_OR_COMMENTS_KIND,
         limit: int,
+        session: Optional[ClientSession] = None,
         timeframe: TIMEFRAME = "all",
         sort: SORT_CRITERION = "all",
         status: Optional[Status] = None,
+        since: Optional[float] = None,
+        until: Optional[float] = None,
         **kwargs: str,
-    ) -> List[Dict]:
+    ) -> AsyncIterator[List[Dict]]:
         """
-        Asynchronously gets a specified number of posts or comments, with a specified sorting criterion, from the specified source.
+        Asynchronously iterates over a specified number of posts or comments from the specified source,
+        yielding each page of results as soon as it is fetched.
 
-        :param session: An `aiohttp.ClientSession` for making the HTTP request.
-        :type session: aiohttp.ClientSession
+        :param session: An `aiohttp.ClientSession` for making the HTTP request. Defaults to the `Api`'s own session.
+        :type session: Optional[aiohttp.ClientSession]
         :param kind: The kind of posts to be fetched.
         :type kind: str
         :param limit: Maximum number of posts to get.
@@ -426,64 +2004,73 @@ class Api:
         :type timeframe: Literal
         :param status: An optional `rich.status.Status` object for displaying status messages. Defaults to None.
         :type status: rich.status.Status
-        :return: A list of dictionaries, each containing post data.
-        :rtype: List[Dict]
+        :param since: Unix time that items must have been created at or after. Listings sorted by "new" stop
+            paginating at the first item created before it. Defaults to None.
+        :type since: Optional[float]
+        :param until: Unix time that items must have been created before. Defaults to None.
+        :type until: Optional[float]
+        :return: An asynchronous iterator of lists of dictionaries, each list holding one page of post data.
+        :rtype: AsyncIterator[List[Dict]]
         """
 
-        username = kwargs.get("username")
-        subreddit = kwargs.get("subreddit")
-
-        posts_or_comments_mapping = {
-            "best": f"{self.endpoint(kind='base')}/r/{kind}.json",
-            "controversial": f"{self.endpoint(kind='base')}/r/{kind}.json",
-            "front_page": f"{self.endpoint(kind='base')}/.json",
-            "new": f"{self.endpoint(kind='base')}/new.json",
-            "popular": f"{self.endpoint(kind='base')}/r/{kind}.json",
-            "rising": f"{self.endpoint(kind='base')}/r/{kind}.json",
-            "posts_from_a_subreddit": f"{self.endpoint(kind='subreddit')}/{subreddit}.json",
-            "posts_from_a_user": f"{self.endpoint(kind='user')}/{username}/submitted.json",
-            "overview_of_a_user": f"{self.endpoint(kind='user')}/{username}/overview.json",
-            "comments_from_a_user": f"{self.endpoint(kind='user')}/{username}/comments.json",
-            "comments_from_a_post": f"{self.endpoint(kind='subreddit')}/{subreddit}"
-            f"/comments/{kwargs.get('id')}.json",
-            "search_from_a_subreddit": f"{self.endpoint(kind='subreddit')}/{subreddit}"
-            f"/search.json",
-        }
-
         if status:
             status.update(f"Retrieving {limit} {kind} (posts/comments)")
 
-        endpoint = posts_or_comments_mapping.get(kind)
-        params = {"limit": limit, "sort": sort, "t": timeframe, "raw_json": 1}
-        params.update(
-            {"q": kwargs.get("query"), "restrict_sr": 1}
-            if kind == "search_from_a_subreddit"
-            else {}
-        )
-
-        sanitiser = (
-            self._sanitise.comments
-            if kind in ["user_comments", "user_overview", "post_comments"]
-            else self._sanitise.posts
-        )
-
-        posts = await self._paginate_items(
+        async for page in self._iter_items(
             session=session,
-            endpoint=endpoint,
-            params=params,
             status=status,
-            sanitiser=sanitiser,
-            limit=limit,
-            is_comments_from_a_post=True if kind == "comments_from_a_post" else False,
-        )
+            **self._posts_or_comments_request(
+                kind=kind,
+                limit=limit,
+                timeframe=timeframe,
+                sort=sort,
+                since=since,
+                until=until,
+                **kwargs,
+            ),
+        ):
+            yield page
+
+    def _subreddits_request(
+        self,
+        kind: Literal["all", "default", "new", "popular"],
+        limit: int,
+        timeframe: TIMEFRAME = "all",
+    ) -> Dict:
+        """
+        Builds the pagination arguments (endpoint, params and sanitiser) for getting subreddits.
 
-        return posts
+        :param kind: The kind of subreddits to get.
+        :type kind: str
+        :param limit: Maximum number of subreddits to return.
+        :type limit: int
+        :param timeframe: Timeframe from which to get subreddits.
+        :type timeframe: Literal
+        :return: A dictionary of keyword arguments for `_iter_items()` or `_paginate_items()`.
+        :rtype: Dict
+        """
+
+        subreddits_mapping = {
+            "all": f"{self.endpoint(kind='subreddits')}.json",
+            "default": f"{self.endpoint(kind='subreddits')}/default.json",
+            "new": f"{self.endpoint(kind='subreddits')}/new.json",
+            "popular": f"{self.endpoint(kind='subreddits')}/popular.json",
+        }
+
+        return {
+            "endpoint": subreddits_mapping.get(kind, ""),
+            "params": {"raw_json": 1, "limit": limit, "t": timeframe},
+            "sanitiser": self._sanitise.subreddits_or_users,
+            "limit": limit,
+            "listing": f"{kind}_subreddits",
+        }
 
+    @session_first
     async def get_subreddits(
         self,
-        session: ClientSession,
         kind: Literal["all", "default", "new", "popular", "user_moderated"],
         limit: int,
+        session: Optional[ClientSession] = None,
         timeframe: TIMEFRAME = "all",
         status: Optional[Status] = None,
         **kwargs: str,
@@ -491,8 +2078,8 @@ class Api:
         """
         Asynchronously gets the specified type of subreddits.
 
-        :param session: An `aiohttp.ClientSession` for making the HTTP request.
-        :type session: aiohttp.ClientSession
+        :param session: An `aiohttp.ClientSession` for making the HTTP request. Defaults to the `Api`'s own session.
+        :type session: Optional[aiohttp.ClientSession]
         :param kind: The kind of subreddits to get.
         :type kind: str
         :param limit: Maximum number of subreddits to return.
@@ -506,43 +2093,102 @@ class Api:
         :rtype: Union[List[Dict], Dict]
         """
 
-        subreddits_mapping = {
-            "all": f"{self.endpoint(kind='subreddits')}.json",
-            "default": f"{self.endpoint(kind='subreddits')}/default.json",
-            "new": f"{self.endpoint(kind='subreddits')}/new.json",
-            "popular": f"{self.endpoint(kind='subreddits')}/popular.json",
-            "user_moderated": f"{self.endpoint(kind='user')}/{kwargs.get('username')}/moderated_subreddits.json",
-        }
-
         if status:
             status.update(f"Retrieving {limit} {kind} subreddits")
 
-        endpoint = subreddits_mapping.get(kind, "")
-        params = {"raw_json": 1}
-
         if kind == "user_moderated":
             subreddits = await self.send_request(
-                endpoint=endpoint,
+                endpoint=f"{self.endpoint(kind='user')}/{kwargs.get('username')}/moderated_subreddits.json",
                 session=session,
             )
         else:
-            params.update({"limit": limit, "t": timeframe})
             subreddits = await self._paginate_items(
                 session=session,
-                params=params,
-                endpoint=endpoint,
-                sanitiser=self._sanitise.subreddits_or_users,
-                limit=limit,
                 status=status,
+                **self._subreddits_request(kind=kind, limit=limit, timeframe=timeframe),
             )
 
         return subreddits
 
+    @session_first
+    async def iter_subreddits(
+        self,
+        kind: Literal["all", "default", "new", "popular"],
+        limit: int,
+        session: Optional[ClientSession] = None,
+        timeframe: TIMEFRAME = "all",
+        status: Optional[Status] = None,
+    ) -> AsyncIterator[List[Dict]]:
+        """
+        Asynchronously iterates over the specified type of subreddits,
+        yielding each page of results as soon as it is fetched.
+
+        :param session: An `aiohttp.ClientSession` for making the HTTP request. Defaults to the `Api`'s own session.
+        :type session: Optional[aiohttp.ClientSession]
+        :param kind: The kind of subreddits to get.
+        :type kind: str
+        :param limit: Maximum number of subreddits to return.
+        :type limit: int
+        :param timeframe: Timeframe from which to get subreddits.
+        :type timeframe: Literal
+        :param status: An optional `rich.status.Status` object for displaying status messages. Defaults to None.
+        :type status: rich.status.Status
+        :return: An asynchronous iterator of lists of dictionaries, each list holding one page of subreddit data.
+        :rtype: AsyncIterator[List[Dict]]
+        """
+
+        if status:
+            status.update(f"Retrieving {limit} {kind} subreddits")
+
+        async for page in self._iter_items(
+            session=session,
+            status=status,
+            **self._subreddits_request(kind=kind, limit=limit, timeframe=timeframe),
+        ):
+            yield page
+
+    def _users_request(
+        self,
+        kind: Literal["all", "popular", "new"],
+        limit: int,
+        timeframe: TIMEFRAME = "all",
+    ) -> Dict:
+        """
+        Builds the pagination arguments (endpoint, params and sanitiser) for getting users.
+
+        :param kind: The kind of users to get.
+        :type kind: str
+        :param limit: Maximum number of users to return.
+        :type limit: int
+        :param timeframe: Timeframe from which to get users.
+        :type timeframe: Literal
+        :return: A dictionary of keyword arguments for `_iter_items()` or `_paginate_items()`.
+        :rtype: Dict
+        """
+
+        users_mapping = {
+            "all": f"{self.endpoint(kind='users')}.json",
+            "new": f"{self.endpoint(kind='users')}/new.json",
+            "popular": f"{self.endpoint(kind='users')}/popular.json",
+        }
+
+        return {
+            "endpoint": users_mapping.get(kind),
+            "params": {
+                "limit": limit,
+                "t": timeframe,
+            },
+            "sanitiser": self._sanitise.subreddits_or_users,
+            "limit": limit,
+            "listing": f"{kind}_users",
+        }
+
+    @session_first
     async def get_users(
         self,
-        session: ClientSession,
         kind: Literal["all", "popular", "new"],
         limit: int,
+        session: Optional[ClientSession] = None,
         timeframe: TIMEFRAME = "all",
         status: Optional[Status] = None,
     ) -> List[Dict]:
@@ -555,54 +2201,72 @@ class Api:
         :type limit: int
         :param timeframe: Timeframe from which to get users.
         :type timeframe: Literal
-        :param session: An `aiohttp.ClientSession` for making the HTTP request.
-        :type session: aiohttp.ClientSession
+        :param session: An `aiohttp.ClientSession` for making the HTTP request. Defaults to the `Api`'s own session.
+        :type session: Optional[aiohttp.ClientSession]
         :param status: An optional `rich.status.Status` object for displaying status messages. Defaults to None.
         :type status: Optional[rich.status.Status]
         :return: A list of dictionaries, each containing user data.
         :rtype: List[Dict]
         """
 
-        users_mapping = {
-            "all": f"{self.endpoint(kind='users')}.json",
-            "new": f"{self.endpoint(kind='users')}/new.json",
-            "popular": f"{self.endpoint(kind='users')}/popular.json",
-        }
-
         if status:
             status.update(f"Retrieving {limit} {kind} users")
 
-        endpoint = users_mapping.get(kind)
-        params = {
-            "limit": limit,
-            "t": timeframe,
-        }
-
         users = await self._paginate_items(
             session=session,
-            params=params,
-            endpoint=endpoint,
-            sanitiser=self._sanitise.subreddits_or_users,
-            limit=limit,
             status=status,
+            **self._users_request(kind=kind, limit=limit, timeframe=timeframe),
         )
 
         return users
 
-    async def search_entities(
+    @session_first
+    async def iter_users(
+        self,
+        kind: Literal["all", "popular", "new"],
+        limit: int,
+        session: Optional[ClientSession] = None,
+        timeframe: TIMEFRAME = "all",
+        status: Optional[Status] = None,
+    ) -> AsyncIterator[List[Dict]]:
+        """
+        Asynchronously iterates over the specified type of users,
+        yielding each page of results as soon as it is fetched.
+
+        :param session: An `aiohttp.ClientSession` for making the HTTP request. Defaults to the `Api`'s own session.
+        :type session: Optional[aiohttp.ClientSession]
+        :param kind: The kind of users to get.
+        :type kind: str
+        :param limit: Maximum number of users to return.
+        :type limit: int
+        :param timeframe: Timeframe from which to get users.
+        :type timeframe: Literal
+        :param status: An optional `rich.status.Status` object for displaying status messages. Defaults to None.
+        :type status: Optional[rich.status.Status]
+        :return: An asynchronous iterator of lists of dictionaries, each list holding one page of user data.
+        :rtype: AsyncIterator[List[Dict]]
+        """
+
+        if status:
+            status.update(f"Retrieving {limit} {kind} users")
+
+        async for page in self._iter_items(
+            session=session,
+            status=status,
+            **self._users_request(kind=kind, limit=limit, timeframe=timeframe),
+        ):
+            yield page
+
+    def _search_request(
         self,
-        session: ClientSession,
         kind: Literal["users", "subreddits", "posts"],
         query: str,
         limit: int,
         sort: SORT_CRITERION = "all",
-        status: Optional[Status] = None,
-    ) -> List[Dict]:
+    ) -> Dict:
         """
-        Asynchronously searches specified entities that match the specified query.
+        Builds the pagination arguments (endpoint, params and sanitiser) for searching entities.
 
-        :param session: An `aiohttp.ClientSession` for making the HTTP request.
-        :type session: aiohttp.ClientSession
         :param kind: The kind of entity to search for.
         :type kind: Literal[str]
         :param query: Search query.
@@ -611,10 +2275,8 @@ class Api:
         :type limit: int
         :param sort: Posts' sort criterion.
         :type sort: str
-        :param status: An optional `rich.status.Status` object for displaying status messages. Defaults to None.
-        :type status: rich.status.Status
-        :return: A list of dictionaries, each containing search result data.
-        :rtype: List[Dict]
+        :return: A dictionary of keyword arguments for `_iter_items()` or `_paginate_items()`.
+        :rtype: Dict
         """
 
         search_mapping = {
@@ -625,7 +2287,6 @@ class Api:
 
         endpoint = search_mapping.get(kind)
         endpoint += f"/search.json"
-        params = {"q": query, "limit": limit, "sort": sort, "raw_json": 1}
 
         sanitiser = (
             self._sanitise.posts
@@ -633,19 +2294,93 @@ class Api:
             else self._sanitise.subreddits_or_users
         )
 
+        return {
+            "endpoint": endpoint,
+            "params": {"q": query, "limit": limit, "sort": sort, "raw_json": 1},
+            "sanitiser": sanitiser,
+            "limit": limit,
+            "listing": f"search_{kind}",
+        }
+
+    @session_first
+    async def search_entities(
+        self,
+        kind: Literal["users", "subreddits", "posts"],
+        query: str,
+        limit: int,
+        session: Optional[ClientSession] = None,
+        sort: SORT_CRITERION = "all",
+        status: Optional[Status] = None,
+    ) -> List[Dict]:
+        """
+        Asynchronously searches specified entities that match the specified query.
+
+        :param session: An `aiohttp.ClientSession` for making the HTTP request. Defaults to the `Api`'s own session.
+        :type session: Optional[aiohttp.ClientSession]
+        :param kind: The kind of entity to search for.
+        :type kind: Literal[str]
+        :param query: Search query.
+        :type query: str
+        :param limit: Maximum number of results to get.
+        :type limit: int
+        :param sort: Posts' sort criterion.
+        :type sort: str
+        :param status: An optional `rich.status.Status` object for displaying status messages. Defaults to None.
+        :type status: rich.status.Status
+        :return: A list of dictionaries, each containing search result data.
+        :rtype: List[Dict]
+        """
+
         if status:
             status.update(f"Searching for '{query}' in {limit} {kind}")
 
         search_results = await self._paginate_items(
             session=session,
-            params=params,
-            endpoint=endpoint,
             status=status,
-            sanitiser=sanitiser,
-            limit=limit,
+            **self._search_request(kind=kind, query=query, limit=limit, sort=sort),
         )
 
         return search_results
 
+    @session_first
+    async def iter_search(
+        self,
+        kind: Literal["users", "subreddits", "posts"],
+        query: str,
+        limit: int,
+        session: Optional[ClientSession] = None,
+        sort: SORT_CRITERION = "all",
+        status: Optional[Status] = None,
+    ) -> AsyncIterator[List[Dict]]:
+        """
+        Asynchronously iterates over specified entities that match the specified query,
+        yielding each page of results as soon as it is fetched.
+
+        :param session: An `aiohttp.ClientSession` for making the HTTP request. Defaults to the `Api`'s own session.
+        :type session: Optional[aiohttp.ClientSession]
+        :param kind: The kind of entity to search for.
+        :type kind: Literal[str]
+        :param query: Search query.
+        :type query: str
+        :param limit: Maximum number of results to get.
+        :type limit: int
+        :param sort: Posts' sort criterion.
+        :type sort: str
+        :param status: An optional `rich.status.Status` object for displaying status messages. Defaults to None.
+        :type status: rich.status.Status
+        :return: An asynchronous iterator of lists of dictionaries, each list holding one page of search results.
+        :rtype: AsyncIterator[List[Dict]]
+        """
+
+        if status:
+            status.update(f"Searching for '{query}' in {limit} {kind}")
+
+        async for page in self._iter_items(
+            session=session,
+            status=status,
+            **self._search_request(kind=kind, query=query, limit=limit, sort=sort),
+        ):
+            yield page
+
 
 # -------------------------------- END ----------------------------------------- #
@@ -1,21 +1,43 @@
 import asyncio
 import os
 from datetime import datetime
-from typing import get_args, Union, Callable, Literal, List, Dict
+from types import SimpleNamespace
+from typing import (
+    get_args,
+    Awaitable,
+    Union,
+    Callable,
+    Literal,
+    Optional,
+    List,
+    Dict,
+    Tuple,
+)
 
 import aiohttp
 import rich_click as click
+from rich import box
 from rich.status import Status
+from rich.table import Table
 
+from .api import BASE_URL, ClientCredentials
 from .core import Post, Posts, Search, Subreddit, Subreddits, User, Users
 from .meta import about, version
+from .tools.cache import ResponseCache
+from .tools.cassette import Cassette
+from .tools.checkpoint import CheckpointStore
+from .tools.dedup import SeenSet
 from .tools.data import (
     create_dataframe,
     export_dataframe,
     EXPORT_FORMATS,
 )
-from .tools.miscellaneous import filename_timestamp, pathfinder
+from .tools.metrics import MetricsRegistry
+from .tools.miscellaneous import filename_timestamp, parse_time_bound, pathfinder
 from .tools.package import check_for_updates, is_snap_package
+from .tools.progress import JsonLinesProgress, RichProgress
+from .tools.sync import SyncState
+from .tools.tracing import RequestTracer
 from .tools.shared import (
     api,
     console,
@@ -24,11 +46,44 @@ from .tools.shared import (
     SORT_CRITERION,
     TIMEFRAME,
     TIME_FORMAT,
+    CACHE_DIR,
     OUTPUT_PARENT_DIR,
 )
 
 __all__ = ["start"]
 
+RESPONSE_CACHE_PATH: str = os.path.join(CACHE_DIR, "responses.sqlite3")
+CHECKPOINTS_DIR: str = os.path.join(OUTPUT_PARENT_DIR, "checkpoints")
+SYNC_STATE_PATH: str = os.path.join(OUTPUT_PARENT_DIR, "sync.json")
+
+
+def time_bound_callback(
+    ctx: click.Context, option: click.Option, value: Optional[str]
+) -> Optional[float]:
+    """
+    Callback function that converts the value of a time bound option (e.g. '--since') to a Unix timestamp.
+
+    :param ctx: The Click context object.
+    :type ctx: click.Context
+    :param option: The Click option that triggered this callback.
+    :type option: click.Option
+    :param value: A Unix timestamp, an ISO 8601 date or datetime, or a relative time such as "6h".
+    :type value: Optional[str]
+    :return: The Unix timestamp, or None if the option was not given.
+    :rtype: Optional[float]
+    :raise click.BadParameter: If the value is not in any of the supported formats.
+    """
+
+    if value is None:
+        return None
+
+    try:
+        return parse_time_bound(value=value)
+    except ValueError:
+        raise click.BadParameter(
+            f"{value!r} is not a Unix timestamp, an ISO 8601 date or a relative time such as '6h'."
+        )
+
 
 def help_callback(ctx: click.Context, option: click.Option, value: bool):
     """
@@ -100,6 +155,111 @@ def help_callback(ctx: click.Context, option: click.Option, value: bool):
     type=click.Choice(["concise", "locale"]),
     help=f"Determines the format of the output time",
 )
+@click.option(
+    "--cache",
+    is_flag=True,
+    help="Cache responses on disk, and revalidate them instead of downloading them again on later runs",
+)
+@click.option(
+    "--checkpoint",
+    is_flag=True,
+    help="<bulk/semi-bulk> Record progress after every page, so that an interrupted run can be resumed with --resume",
+)
+@click.option(
+    "--resume",
+    is_flag=True,
+    help="<bulk/semi-bulk> Resume an interrupted run of the same command from its last checkpoint "
+    "(and keep recording progress)",
+)
+@click.option(
+    "--since",
+    type=str,
+    callback=time_bound_callback,
+    help="<bulk/semi-bulk> Only get items created at or after this time: a Unix timestamp, an ISO 8601 date "
+    "(UTC unless it has an offset) or a relative time such as 30m, 6h, 2d or 1w (new listings stop paginating there)",
+)
+@click.option(
+    "--until",
+    type=str,
+    callback=time_bound_callback,
+    help="<bulk/semi-bulk> Only get items created before this time (same formats as --since)",
+)
+@click.option(
+    "--harvest",
+    is_flag=True,
+    help="<bulk/semi-bulk> Get past the ~1,000-item cap of a listing by merging every sort and timeframe of it "
+    "(subreddit --posts and user --posts/--comments), up to --limit items in total",
+)
+@click.option(
+    "--sync",
+    is_flag=True,
+    help="<bulk/semi-bulk> Only get the items that are new since the last --sync run of the same command "
+    "(sorts by new, unless --sort is given, and stops paginating at the first item seen before)",
+)
+@click.option(
+    "--seen-file",
+    type=click.Path(dir_okay=False, writable=True),
+    help="<bulk/semi-bulk> Skip items that are recorded in this file by earlier runs, and record the new ones "
+    "in it when the run completes (a Bloom filter keeps it to a fixed size for multi-million-item crawls)",
+)
+@click.option(
+    "--progress-file",
+    type=click.Path(dir_okay=False, writable=True),
+    help="Write progress events to this file as JSON lines, instead of showing them in the terminal (for headless runs)",
+)
+@click.option(
+    "--trace",
+    type=click.Path(dir_okay=False, writable=True),
+    help="Trace every request's phases (DNS, connect, TTFB, body) to this file as JSON lines, "
+    "and show latency histograms when the session closes",
+)
+@click.option(
+    "--metrics-port",
+    type=int,
+    help="Serve Prometheus metrics (request rate, 429s, retries, cache hit ratio, items per second, "
+    "queue depths and memory usage) on http://127.0.0.1:<port>/metrics while running",
+)
+@click.option(
+    "--metrics-file",
+    type=click.Path(dir_okay=False, writable=True),
+    help="Write Prometheus metrics to this file on exit",
+)
+@click.option(
+    "--base-url",
+    default=BASE_URL,
+    show_default=True,
+    help="Base URL to send Reddit requests to, e.g. a local stand-in server for offline testing",
+)
+@click.option(
+    "--client-id",
+    envvar="KNEWKARMA_CLIENT_ID",
+    type=str,
+    help="Client ID of a Reddit app, to send requests to oauth.reddit.com with an app-only token "
+    "for a higher rate limit (or set KNEWKARMA_CLIENT_ID)",
+)
+@click.option(
+    "--client-secret",
+    envvar="KNEWKARMA_CLIENT_SECRET",
+    type=str,
+    help="Client secret of the Reddit app (prefer setting KNEWKARMA_CLIENT_SECRET)",
+)
+@click.option(
+    "--record",
+    type=click.Path(dir_okay=False, writable=True),
+    help="Record every response to this gzip-compressed cassette file, so that the run can be replayed later",
+)
+@click.option(
+    "--replay",
+    type=click.Path(exists=True, dir_okay=False),
+    help="Replay responses from this cassette file (see --record) instead of sending requests",
+)
+@click.option(
+    "--replay-latency",
+    type=float,
+    default=0.0,
+    show_default=True,
+    help="Seconds to wait before each replayed response, to simulate network latency",
+)
 @click.option(
     "-h",
     "--help",
@@ -123,6 +283,24 @@ def cli(
     limit: int,
     time_format: str,
     export: List[EXPORT_FORMATS],
+    cache: bool,
+    checkpoint: bool,
+    resume: bool,
+    since: Optional[float],
+    until: Optional[float],
+    harvest: bool,
+    sync: bool,
+    seen_file: Optional[str],
+    progress_file: Optional[str],
+    trace: Optional[str],
+    metrics_port: Optional[int],
+    metrics_file: Optional[str],
+    base_url: str,
+    client_id: Optional[str],
+    client_secret: Optional[str],
+    record: Optional[str],
+    replay: Optional[str],
+    replay_latency: float,
 ):
     """
     Main CLI group for Knew Karma.
@@ -139,14 +317,96 @@ def cli(
     :type time_format: Literal[str]
     :param export: Option to set data export file types.
     :type export: Literal[str]
+    :param cache: Option to cache responses on disk.
+    :type cache: bool
+    :param checkpoint: Option to record the progress of paginated requests, so that they can be resumed.
+    :type checkpoint: bool
+    :param resume: Option to resume paginated requests from their last checkpoint.
+    :type resume: bool
+    :param since: Option to only get items created at or after this Unix time.
+    :type since: Optional[float]
+    :param until: Option to only get items created before this Unix time.
+    :type until: Optional[float]
+    :param harvest: Option to merge every sort and timeframe of a listing.
+    :type harvest: bool
+    :param sync: Option to only get items that are newer than each listing's high-water mark.
+    :type sync: bool
+    :param seen_file: Option to skip items seen by earlier runs, and record the new ones in a file.
+    :type seen_file: Optional[str]
+    :param progress_file: Option to write progress events to a JSON-lines file.
+    :type progress_file: Optional[str]
+    :param trace: Option to trace requests to a JSON-lines file.
+    :type trace: Optional[str]
+    :param metrics_port: Option to serve Prometheus metrics on a local port.
+    :type metrics_port: Optional[int]
+    :param metrics_file: Option to write Prometheus metrics to a file on exit.
+    :type metrics_file: Optional[str]
+    :param base_url: Option to send Reddit requests to a different base URL.
+    :type base_url: str
+    :param client_id: Option to authenticate requests with a Reddit app's client ID.
+    :type client_id: Optional[str]
+    :param client_secret: Option to authenticate requests with a Reddit app's client secret.
+    :type client_secret: Optional[str]
+    :param record: Option to record responses to a cassette file.
+    :type record: Optional[str]
+    :param replay: Option to replay responses from a cassette file.
+    :type replay: Optional[str]
+    :param replay_latency: Option to simulate latency for replayed responses.
+    :type replay_latency: float
     """
 
+    if record and replay:
+        raise click.UsageError("--record and --replay cannot be used together.")
+
+    if bool(client_id) != bool(client_secret):
+        raise click.UsageError("--client-id and --client-secret must be used together.")
+
+    api.base_url = base_url
+
+    if client_id:
+        api.credentials = ClientCredentials(
+            client_id=client_id, client_secret=client_secret
+        )
+
+    if record:
+        api.cassette = Cassette(path=record, mode="record")
+    elif replay:
+        api.cassette = Cassette(path=replay, mode="replay", latency=replay_latency)
+
+    if cache:
+        api.cache = ResponseCache(path=RESPONSE_CACHE_PATH)
+
+    if trace:
+        api.tracer = RequestTracer(path=trace)
+
+    if metrics_port or metrics_file:
+        api.metrics = MetricsRegistry()
+
+    # Saving a checkpoint syncs it to disk after every page, so progress is only recorded when asked for.
+    if checkpoint or resume:
+        api.checkpoints = CheckpointStore(directory=CHECKPOINTS_DIR, resume=resume)
+
+    if seen_file:
+        api.seen_set = SeenSet(path=seen_file)
+
+    if sync:
+        api.sync_state = SyncState(path=SYNC_STATE_PATH)
+        # Only listings sorted by "new" can stop at the high-water mark, so make that the default.
+        if ctx.get_parameter_source("sort") is click.core.ParameterSource.DEFAULT:
+            sort = "new"
+
     ctx.ensure_object(Dict)
     ctx.obj["timeframe"] = timeframe
     ctx.obj["sort"] = sort
     ctx.obj["limit"] = limit
+    ctx.obj["since"] = since
+    ctx.obj["until"] = until
+    ctx.obj["harvest"] = harvest
     ctx.obj["time_format"] = time_format
     ctx.obj["export"] = export
+    ctx.obj["progress_file"] = progress_file
+    ctx.obj["metrics_port"] = metrics_port
+    ctx.obj["metrics_file"] = metrics_file
 
 
 @cli.command(
@@ -251,6 +511,8 @@ def posts(
     limit: int = ctx.obj["limit"]
     export: str = ctx.obj["export"]
     time_format: TIME_FORMAT = ctx.obj["time_format"]
+    since: Optional[float] = ctx.obj["since"]
+    until: Optional[float] = ctx.obj["until"]
 
     posts_instance = Posts(time_format=time_format)
     method_map: Dict = {
@@ -264,7 +526,12 @@ def posts(
             limit=limit, sort=sort, status=status, session=session
         ),
         "new": lambda session, status=None: posts_instance.new(
-            limit=limit, sort=sort, status=status, session=session
+            limit=limit,
+            sort=sort,
+            since=since,
+            until=until,
+            status=status,
+            session=session,
         ),
         "popular": lambda session, status=None: posts_instance.popular(
             timeframe=timeframe, limit=limit, status=status, session=session
@@ -357,6 +624,14 @@ def search(ctx: click.Context, query: str, posts: bool, subreddits: bool, users:
     type=int,
     help="To be used when getting comments with `--comments`",
 )
+@click.option(
+    "--concurrency",
+    default=10,
+    show_default=True,
+    type=int,
+    help="Maximum number of posts to get comments from at the same time, "
+    "when getting comments with `--comments` or `--search-comments`",
+)
 @click.option("--profile", is_flag=True, help="Get a subreddit's profile")
 @click.option("--posts", is_flag=True, help="Get a subreddit's posts")
 @click.option("--search-comments", type=str, help="Search comments in a subreddit")
@@ -371,6 +646,7 @@ def subreddit(
     subreddit_name: str,
     comments: bool,
     comments_per_post: int,
+    concurrency: int,
     posts: bool,
     profile: bool,
     search_comments: str,
@@ -389,6 +665,8 @@ def subreddit(
     :type comments: bool
     :param comments_per_post: Number of comments per post to retrieve.
     :type comments_per_post: int
+    :param concurrency: Maximum number of posts to get comments from at the same time.
+    :type concurrency: int
     :param posts: Flag to get the subreddit's posts.
     :type posts: bool
     :param profile: Flag to get the subreddit's profile.
@@ -408,6 +686,8 @@ def subreddit(
     limit: int = ctx.obj["limit"]
     export: str = ctx.obj["export"]
     time_format: TIME_FORMAT = ctx.obj["time_format"]
+    since: Optional[float] = ctx.obj["since"]
+    until: Optional[float] = ctx.obj["until"]
 
     subreddit_instance = Subreddit(name=subreddit_name, time_format=time_format)
     method_map: Dict = {
@@ -417,10 +697,29 @@ def subreddit(
             comments_per_post=comments_per_post,
             sort=sort,
             timeframe=timeframe,
+            concurrency=concurrency,
             status=status,
         ),
-        "posts": lambda session, status=None: subreddit_instance.posts(
-            limit=limit, sort=sort, timeframe=timeframe, status=status, session=session
+        "posts": lambda session, status=None: (
+            harvest_listings(
+                harvest=subreddit_instance.harvest_posts(
+                    limit=limit,
+                    since=since,
+                    until=until,
+                    status=status,
+                    session=session,
+                ),
+            )
+            if ctx.obj["harvest"]
+            else subreddit_instance.posts(
+                limit=limit,
+                sort=sort,
+                timeframe=timeframe,
+                since=since,
+                until=until,
+                status=status,
+                session=session,
+            )
         ),
         "profile": lambda session, status=None: subreddit_instance.profile(
             status=status, session=session
@@ -431,6 +730,7 @@ def subreddit(
             comments_per_post=comments_per_post,
             sort=sort,
             timeframe=timeframe,
+            concurrency=concurrency,
             status=status,
             session=session,
         ),
@@ -619,20 +919,58 @@ def user(
     limit: int = ctx.obj["limit"]
     export: str = ctx.obj["export"]
     time_format: TIME_FORMAT = ctx.obj["time_format"]
+    since: Optional[float] = ctx.obj["since"]
+    until: Optional[float] = ctx.obj["until"]
 
     user_instance: User = User(name=username, time_format=time_format)
     method_map: Dict = {
-        "comments": lambda session, status=None: user_instance.comments(
-            session=session, limit=limit, sort=sort, timeframe=timeframe, status=status
+        "comments": lambda session, status=None: (
+            harvest_listings(
+                harvest=user_instance.harvest_comments(
+                    limit=limit,
+                    since=since,
+                    until=until,
+                    status=status,
+                    session=session,
+                ),
+            )
+            if ctx.obj["harvest"]
+            else user_instance.comments(
+                session=session,
+                limit=limit,
+                sort=sort,
+                timeframe=timeframe,
+                since=since,
+                until=until,
+                status=status,
+            )
         ),
         "moderated_subreddits": lambda session, status=None: user_instance.moderated_subreddits(
             session=session, status=status
         ),
         "overview": lambda session, status=None: user_instance.overview(
-            limit=limit, session=session, status=status
+            limit=limit, since=since, until=until, session=session, status=status
         ),
-        "posts": lambda session, status=None: user_instance.posts(
-            session=session, limit=limit, sort=sort, timeframe=timeframe, status=status
+        "posts": lambda session, status=None: (
+            harvest_listings(
+                harvest=user_instance.harvest_posts(
+                    limit=limit,
+                    since=since,
+                    until=until,
+                    status=status,
+                    session=session,
+                ),
+            )
+            if ctx.obj["harvest"]
+            else user_instance.posts(
+                session=session,
+                limit=limit,
+                sort=sort,
+                timeframe=timeframe,
+                since=since,
+                until=until,
+                status=status,
+            )
         ),
         "profile": lambda session, status=None: user_instance.profile(
             session=session, status=status
@@ -742,6 +1080,240 @@ def users(ctx: click.Context, all: bool, new: bool, popular: bool):
     )
 
 
+@cli.command(
+    name="cache",
+    help="Use this command to view the on-disk response cache's hit rates (enabled with `--cache`), "
+    "and to prune its entries.",
+)
+@click.option("--stats", is_flag=True, help="Show cache entries, size and hit rates")
+@click.option("--prune", is_flag=True, help="Remove expired cache entries")
+@click.option("--clear", is_flag=True, help="Remove all cache entries and statistics")
+@click.pass_context
+def cache_command(ctx: click.Context, stats: bool, prune: bool, clear: bool):
+    """
+    View or prune the on-disk response cache.
+
+    :param ctx: The Click context object.
+    :type ctx: click.Context
+    :param stats: Flag to show the cache's statistics.
+    :type stats: bool
+    :param prune: Flag to remove expired cache entries.
+    :type prune: bool
+    :param clear: Flag to remove all cache entries.
+    :type clear: bool
+    """
+
+    if not any([stats, prune, clear]):
+        click.echo(ctx.get_usage())
+        return
+
+    response_cache = api.cache or ResponseCache(path=RESPONSE_CACHE_PATH)
+
+    if prune or clear:
+        removed: int = response_cache.prune(expired_only=not clear)
+        notify.ok(f"Removed {style.cyan}{removed}{style.reset} cache entries")
+
+    if stats:
+        from rich.table import Table
+        from rich import box
+
+        cache_stats: Dict[str, int] = response_cache.stats()
+        lookups: int = (
+            cache_stats["hits"] + cache_stats["stale"] + cache_stats["misses"]
+        )
+        served: int = cache_stats["hits"] + cache_stats["revalidated"]
+
+        table = Table(title="Response Cache", box=box.ROUNDED)
+        table.add_column("Statistic", justify="right", style="dim")
+        table.add_column("Value", style=style.cyan.strip("[,]"))
+
+        table.add_row("Location", response_cache.path)
+        table.add_row("Entries", str(cache_stats["entries"]))
+        table.add_row("Size", f"{cache_stats['size'] / 1024 / 1024:.2f} MB")
+        table.add_row("Fresh hits", str(cache_stats["hits"]))
+        table.add_row("Revalidated (304)", str(cache_stats["revalidated"]))
+        table.add_row("Misses", str(cache_stats["misses"]))
+        table.add_row("Hit rate", f"{served / lookups:.1%}" if lookups else "n/a")
+
+        console.print(table)
+
+    response_cache.close()
+
+
+@cli.command(
+    name="bench",
+    help="Use this command to time each CPU-bound stage (decoding, sanitising, parsing, building a dataframe, "
+    "exporting it and rendering it) on synthetic listings, without sending any requests.",
+)
+@click.option(
+    "--items",
+    default=100000,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help="Number of synthetic items per listing",
+)
+@click.option(
+    "--kind",
+    "kinds",
+    multiple=True,
+    default=["posts", "comments"],
+    show_default=True,
+    type=click.Choice(["posts", "comments"]),
+    help="Kind of listing to benchmark (can be repeated)",
+)
+@click.option(
+    "--rounds",
+    default=1,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help="Timed runs per listing (the median is reported)",
+)
+@click.option("--seed", default=0, show_default=True, help="Seed of the synthetic data")
+@click.option(
+    "--no-memory",
+    is_flag=True,
+    help="Skip measuring allocated memory (which takes an extra, slower run)",
+)
+@click.option("--output", type=str, help="Write the results to a JSON file")
+@click.option(
+    "--compare",
+    type=str,
+    help="Compare items per second with the results in a JSON file written with `--output`",
+)
+@click.pass_context
+def bench(
+    ctx: click.Context,
+    items: int,
+    kinds: List[str],
+    rounds: int,
+    seed: int,
+    no_memory: bool,
+    output: Optional[str],
+    compare: Optional[str],
+):
+    """
+    Benchmark the CPU path on synthetic listings.
+
+    :param ctx: The Click context object.
+    :type ctx: click.Context
+    :param items: Number of synthetic items per listing.
+    :type items: int
+    :param kinds: Kinds of listings to benchmark.
+    :type kinds: List[str]
+    :param rounds: Number of timed runs per listing.
+    :type rounds: int
+    :param seed: Seed of the synthetic data.
+    :type seed: int
+    :param no_memory: Flag to skip measuring allocated memory.
+    :type no_memory: bool
+    :param output: Path of a JSON file to write the results to.
+    :type output: Optional[str]
+    :param compare: Path of a JSON file with results to compare against.
+    :type compare: Optional[str]
+    """
+
+    import json
+    import platform
+    import time
+
+    from .tools.benchmark import results_table, run_benchmark
+
+    with Status(
+        status="Preparing benchmark",
+        spinner="dots",
+        spinner_style=style.yellow.strip("[,]"),
+        console=console,
+    ) as status:
+        results: List[Dict] = run_benchmark(
+            kinds=list(kinds),
+            items=items,
+            rounds=rounds,
+            seed=seed,
+            time_format=ctx.obj["time_format"],
+            trace_memory=not no_memory,
+            status=status,
+        )
+
+    previous: Optional[List[Dict]] = None
+    if compare:
+        with open(compare, encoding="utf-8") as compare_file:
+            previous = json.load(compare_file)["results"]
+
+    console.print(results_table(results=results, previous=previous))
+
+    if output:
+        with open(output, "w", encoding="utf-8") as output_file:
+            json.dump(
+                {
+                    "version": version.release,
+                    "python": platform.python_version(),
+                    "platform": platform.platform(),
+                    "time": time.time(),
+                    "options": {
+                        "items": items,
+                        "rounds": rounds,
+                        "seed": seed,
+                        "time_format": ctx.obj["time_format"],
+                    },
+                    "results": results,
+                },
+                output_file,
+                indent=2,
+            )
+        notify.ok(f"Results written to [link file://{output}]{output}")
+
+
+def coverage_table(coverage: List[SimpleNamespace]) -> Table:
+    """
+    Makes a table of the coverage of each listing of a harvest.
+
+    :param coverage: Coverage of each listing, as returned by the `harvest_*` methods.
+    :type coverage: List[SimpleNamespace]
+    :return: A `rich.table.Table` with a row for each listing.
+    :rtype: rich.table.Table
+    """
+
+    table = Table(title="Harvest coverage", box=box.ROUNDED)
+    for column in ("Sort", "Timeframe", "Items", "New", "Total", "Gain"):
+        table.add_column(
+            column, justify="left" if column in ("Sort", "Timeframe") else "right"
+        )
+
+    for listing in coverage:
+        table.add_row(
+            listing.sort,
+            listing.timeframe,
+            str(listing.items) if not listing.error else f"[red]{listing.error}[/red]",
+            str(listing.new_items),
+            str(listing.total_items),
+            (
+                f"{listing.new_items / (listing.total_items - listing.new_items):+.0%}"
+                if listing.total_items > listing.new_items
+                else "-"
+            ),
+        )
+
+    return table
+
+
+async def harvest_listings(
+    harvest: Awaitable[Tuple[List[SimpleNamespace], List[SimpleNamespace]]],
+) -> List[SimpleNamespace]:
+    """
+    Awaits a harvest, shows how much each of its listings added, and returns its items.
+
+    :param harvest: A call to one of the `harvest_*` methods.
+    :type harvest: Awaitable[Tuple[List[SimpleNamespace], List[SimpleNamespace]]]
+    :return: The harvested items.
+    :rtype: List[SimpleNamespace]
+    """
+
+    items, coverage = await harvest
+    console.print(coverage_table(coverage=coverage))
+
+    return items
+
+
 async def call_method(
     method: Callable,
     session: aiohttp.ClientSession,
@@ -797,6 +1369,7 @@ async def call_method(
                     filename=filename_timestamp(),
                     directory=output_child_dir,
                     formats=export_to,
+                    metrics=api.metrics,
                 )
 
 
@@ -818,45 +1391,93 @@ async def handle_method_calls(
     :param kwargs: Additional keyword arguments.
     :type kwargs: Union[str, int, bool]
     """
-    is_valid_arg: bool = False
-
-    for argument, method in method_map.items():
-        if kwargs.get(argument):
-            is_valid_arg = True
-            start_time: datetime = datetime.now()
-            try:
-                with Status(
-                    status=f"Opening new client session",
-                    spinner="dots",
-                    spinner_style=style.yellow.strip("[,]"),
-                    console=console,
-                ) as status:
-                    async with aiohttp.ClientSession() as session:
-                        notify.ok("New client session opened")
-                        await api.check_reddit_status(session=session, status=status)
-                        await check_for_updates(session=session, status=status)
-                        await call_method(
-                            method=method,
-                            session=session,
-                            status=status,
-                            ctx=ctx,
-                            export=export,
-                            argument=argument,
-                        )
-            except aiohttp.ClientConnectionError as connection_error:
-                notify.exception(title="An HTTP error occurred", error=connection_error)
-            except aiohttp.ClientResponseError as response_error:
-                notify.exception(title="An API error occurred", error=response_error)
-            except Exception as unexpected_error:
-                notify.exception(error=unexpected_error)
-            finally:
-                elapsed_time = datetime.now() - start_time
-                notify.ok(
-                    f"Session closed. {elapsed_time.total_seconds():.2f} seconds elapsed."
-                )
-
-    if not is_valid_arg:
+    if not any(kwargs.get(argument) for argument in method_map):
         ctx.get_usage()
+        return
+
+    start_time: datetime = datetime.now()
+    try:
+        with Status(
+            status=f"Opening new client session",
+            spinner="dots",
+            spinner_style=style.yellow.strip("[,]"),
+            console=console,
+        ) as status:
+            progress_file: Optional[str] = ctx.obj.get("progress_file")
+            api.progress = (
+                JsonLinesProgress(path=progress_file)
+                if progress_file
+                else RichProgress(status=status)
+            )
+
+            # A single pooled session is shared by every requested method, so that
+            # connections are reused instead of being set up again for each of them.
+            async with api:
+                notify.ok("New client session opened")
+                if ctx.obj.get("metrics_port"):
+                    await api.metrics.serve(port=ctx.obj["metrics_port"])
+                    notify.ok(
+                        f"Serving metrics on http://127.0.0.1:{ctx.obj['metrics_port']}/metrics"
+                    )
+                await api.check_reddit_status(status=status)
+                # Runs against a stand-in server or a cassette are usually offline,
+                # so only check for updates against Reddit.
+                if api.base_url == BASE_URL and not api.cassette:
+                    await check_for_updates(session=api.session, status=status)
+                # Each requested method is called on its own, so that one failing
+                # does not stop the others from running.
+                has_failed: bool = False
+                for argument, method in method_map.items():
+                    if kwargs.get(argument):
+                        try:
+                            await call_method(
+                                method=method,
+                                session=api.session,
+                                status=status,
+                                ctx=ctx,
+                                export=export,
+                                argument=argument,
+                            )
+                        except aiohttp.ClientConnectionError as connection_error:
+                            has_failed = True
+                            notify.exception(
+                                title="An HTTP error occurred", error=connection_error
+                            )
+                        except aiohttp.ClientResponseError as response_error:
+                            has_failed = True
+                            notify.exception(
+                                title="An API error occurred", error=response_error
+                            )
+                        except Exception as unexpected_error:
+                            has_failed = True
+                            notify.exception(error=unexpected_error)
+                # Only saved once everything has been retrieved, so that the items of a failed run are
+                # not skipped by the next one.
+                if api.seen_set is not None and not has_failed:
+                    api.seen_set.save()
+    except aiohttp.ClientConnectionError as connection_error:
+        notify.exception(title="An HTTP error occurred", error=connection_error)
+    except aiohttp.ClientResponseError as response_error:
+        notify.exception(title="An API error occurred", error=response_error)
+    except Exception as unexpected_error:
+        notify.exception(error=unexpected_error)
+    finally:
+        api.progress.close()
+        if api.cache:
+            api.cache.close()
+        if api.cassette:
+            api.cassette.close()
+        if api.tracer:
+            console.print(api.tracer.table())
+            api.tracer.close()
+        if api.metrics:
+            await api.metrics.stop()
+            if ctx.obj.get("metrics_file"):
+                api.metrics.dump(path=ctx.obj["metrics_file"])
+        elapsed_time = datetime.now() - start_time
+        notify.ok(
+            f"Session closed. {elapsed_time.total_seconds():.2f} seconds elapsed."
+        )
 
 
 def start():
@@ -1,14 +1,23 @@
+import asyncio
 import re
 from collections import Counter
 from types import SimpleNamespace
-from typing import Literal, Union, Optional, List
+from typing import AsyncIterator, Literal, Union, Optional, List, Tuple
 
 from aiohttp import ClientSession
 from karmakaze import Parse
 from rich.status import Status
 
 from .tools.data import plot_bar_chart, visualisation_dependency_installed
-from .tools.shared import api, SORT_CRITERION, TIMEFRAME, TIME_FORMAT
+from .api import Api
+from .tools.compat import session_first
+from .tools.shared import (
+    api as default_api,
+    notify,
+    SORT_CRITERION,
+    TIMEFRAME,
+    TIME_FORMAT,
+)
 
 __all__ = [
     "Post",
@@ -30,7 +39,13 @@ class Comment:
 class Post:
     """Represents a Reddit post and provides methods for fetching post data and comments."""
 
-    def __init__(self, id: str, subreddit: str, time_format: TIME_FORMAT = "locale"):
+    def __init__(
+        self,
+        id: str,
+        subreddit: str,
+        time_format: TIME_FORMAT = "locale",
+        api: Optional[Api] = None,
+    ):
         """
         Initialises a `Post` instance to fetch the post's data and comments.
 
@@ -40,27 +55,31 @@ class Post:
         :type subreddit: str
         :param time_format: Format for displaying time, either 'concise' or 'locale'. Defaults to 'locale'.
         :type time_format: Literal["concise", "locale"]
+        :param api: The `Api` to send requests with, e.g. one that owns a pooled session.
+            Defaults to the shared `Api` instance.
+        :type api: Optional[Api]
         """
 
         self._id = id
         self._subreddit = subreddit
         self._parse = Parse(time_format=time_format)
+        self._api = api or default_api
 
     async def data(
-        self, session: ClientSession, status: Optional[Status] = None
+        self, session: Optional[ClientSession] = None, status: Optional[Status] = None
     ) -> SimpleNamespace:
         """
         Asynchronously retrieves data for a Reddit post, excluding comments.
 
-        :param session: An `aiohttp.ClientSession` for making the HTTP request.
-        :type session: aiohttp.ClientSession
+        :param session: An `aiohttp.ClientSession` for making the HTTP request. Defaults to the `Api`'s own session.
+        :type session: Optional[aiohttp.ClientSession]
         :param status: An optional `rich.status.Status` object for displaying status messages. Defaults to None.
         :type status: Optional[rich.status.Status]
         :return: A `SimpleNamespace` object containing parsed post data.
         :rtype: SimpleNamespace
         """
 
-        post_data = await api.get_entity(
+        post_data = await self._api.get_entity(
             session=session,
             kind="post",
             status=status,
@@ -72,18 +91,19 @@ class Post:
 
         return parsed_post if post_data else SimpleNamespace
 
+    @session_first
     async def comments(
         self,
-        session: ClientSession,
         limit: int,
+        session: Optional[ClientSession] = None,
         sort: SORT_CRITERION = "all",
         status: Optional[Status] = None,
     ) -> List[SimpleNamespace]:
         """
         Asynchronously retrieves comments for a Reddit post.
 
-        :param session: An `aiohttp.ClientSession` for making the HTTP request.
-        :type session: aiohttp.ClientSession
+        :param session: An `aiohttp.ClientSession` for making the HTTP request. Defaults to the `Api`'s own session.
+        :type session: Optional[aiohttp.ClientSession]
         :param limit: Maximum number of comments to retrieve.
         :type limit: int
         :param sort: The sorting criterion for the comments. Defaults to "all".
@@ -94,7 +114,7 @@ class Post:
         :rtype: List[SimpleNamespace]
         """
 
-        comments_data = await api.get_posts_or_comments(
+        comments_data = await self._api.get_posts_or_comments(
             session=session,
             kind="comments_from_a_post",
             status=status,
@@ -112,28 +132,72 @@ class Post:
 class Posts:
     """Represents Reddit posts and provides methods for retrieving posts from various sources."""
 
-    def __init__(self, time_format: TIME_FORMAT = "locale"):
+    def __init__(
+        self,
+        time_format: TIME_FORMAT = "locale",
+        api: Optional[Api] = None,
+    ):
         """
         Initialises a `Posts` instance for retrieving posts such as 'best', 'controversial',
         'front-page', 'new', 'popular', and 'rising'.
 
         :param time_format: Format for displaying time, either 'concise' or 'locale'. Defaults to 'locale'.
         :type time_format: Literal["concise", "locale"]
+        :param api: The `Api` to send requests with, e.g. one that owns a pooled session.
+            Defaults to the shared `Api` instance.
+        :type api: Optional[Api]
         """
         self._parse = Parse(time_format=time_format)
+        self._api = api or default_api
+
+    @session_first
+    async def by_ids(
+        self,
+        ids: List[str],
+        session: Optional[ClientSession] = None,
+        status: Optional[Status] = None,
+    ) -> List[SimpleNamespace]:
+        """
+        Asynchronously retrieves posts by their IDs, a hundred per request, which is far cheaper than
+        retrieving each post's page with `Post.data()`.
+
+        :param session: An `aiohttp.ClientSession` for making the HTTP request. Defaults to the `Api`'s own session.
+        :type session: Optional[aiohttp.ClientSession]
+        :param ids: IDs of the posts, with or without their "t3_" prefix.
+        :type ids: List[str]
+        :param status: An optional `rich.status.Status` object for displaying status messages. Defaults to None.
+        :type status: Optional[rich.status.Status]
+        :return: A list of `SimpleNamespace` objects, each containing parsed post data, in the same order
+            as `ids`. Posts that do not exist are left out.
+        :rtype: List[SimpleNamespace]
+        """
+
+        found_posts = await self._api.get_info(
+            session=session,
+            fullnames=[
+                post_id if post_id.startswith("t3_") else f"t3_{post_id}"
+                for post_id in ids
+            ],
+            status=status,
+        )
+
+        parsed_posts = self._parse.posts(found_posts)
+
+        return parsed_posts if found_posts else [SimpleNamespace]
 
+    @session_first
     async def best(
         self,
-        session: ClientSession,
         limit: int,
+        session: Optional[ClientSession] = None,
         timeframe: TIMEFRAME = "all",
         status: Optional[Status] = None,
     ) -> List[SimpleNamespace]:
         """
         Asynchronously retrieves the best posts.
 
-        :param session: An `aiohttp.ClientSession` for making the HTTP request.
-        :type session: aiohttp.ClientSession
+        :param session: An `aiohttp.ClientSession` for making the HTTP request. Defaults to the `Api`'s own session.
+        :type session: Optional[aiohttp.ClientSession]
         :param limit: Maximum number of posts to retrieve.
         :type limit: int
         :param timeframe: The timeframe from which to retrieve posts. Defaults to "all".
@@ -144,7 +208,7 @@ class Posts:
         :rtype: List[SimpleNamespace]
         """
 
-        best_posts = await api.get_posts_or_comments(
+        best_posts = await self._api.get_posts_or_comments(
             session=session,
             kind="best",
             status=status,
@@ -156,18 +220,19 @@ class Posts:
 
         return parsed_posts if best_posts else [SimpleNamespace]
 
+    @session_first
     async def controversial(
         self,
-        session: ClientSession,
         limit: int,
+        session: Optional[ClientSession] = None,
         timeframe: TIMEFRAME = "all",
         status: Optional[Status] = None,
     ) -> List[SimpleNamespace]:
         """
         Asynchronously retrieves the controversial posts.
 
-        :param session: An `aiohttp.ClientSession` for making the HTTP request.
-        :type session: aiohttp.ClientSession
+        :param session: An `aiohttp.ClientSession` for making the HTTP request. Defaults to the `Api`'s own session.
+        :type session: Optional[aiohttp.ClientSession]
         :param limit: Maximum number of posts to retrieve.
         :type limit: int
         :param timeframe: The timeframe from which to retrieve posts. Defaults to "all".
@@ -178,7 +243,7 @@ class Posts:
         :rtype: List[SimpleNamespace]
         """
 
-        controversial_posts = await api.get_posts_or_comments(
+        controversial_posts = await self._api.get_posts_or_comments(
             session=session,
             kind="controversial",
             status=status,
@@ -190,10 +255,11 @@ class Posts:
 
         return parsed_posts if controversial_posts else [SimpleNamespace]
 
+    @session_first
     async def front_page(
         self,
-        session: ClientSession,
         limit: int,
+        session: Optional[ClientSession] = None,
         timeframe: TIMEFRAME = "all",
         sort: SORT_CRITERION = "all",
         status: Optional[Status] = None,
@@ -201,8 +267,8 @@ class Posts:
         """
         Asynchronously retrieves the front-page posts.
 
-        :param session: An `aiohttp.ClientSession` for making the HTTP request.
-        :type session: aiohttp.ClientSession
+        :param session: An `aiohttp.ClientSession` for making the HTTP request. Defaults to the `Api`'s own session.
+        :type session: Optional[aiohttp.ClientSession]
         :param limit: Maximum number of posts to retrieve.
         :type limit: int
         :param timeframe: The timeframe from which to retrieve posts. Defaults to "all".
@@ -215,7 +281,7 @@ class Posts:
         :rtype: List[SimpleNamespace]
         """
 
-        front_page_posts = await api.get_posts_or_comments(
+        front_page_posts = await self._api.get_posts_or_comments(
             session=session,
             kind="front_page",
             status=status,
@@ -228,19 +294,22 @@ class Posts:
 
         return parsed_posts if front_page_posts else [SimpleNamespace]
 
+    @session_first
     async def new(
         self,
-        session: ClientSession,
         limit: int,
+        session: Optional[ClientSession] = None,
         timeframe: TIMEFRAME = "all",
         sort: SORT_CRITERION = "all",
         status: Optional[Status] = None,
+        since: Optional[float] = None,
+        until: Optional[float] = None,
     ) -> List[SimpleNamespace]:
         """
         Asynchronously retrieves the new posts.
 
-        :param session: An `aiohttp.ClientSession` for making the HTTP request.
-        :type session: aiohttp.ClientSession
+        :param session: An `aiohttp.ClientSession` for making the HTTP request. Defaults to the `Api`'s own session.
+        :type session: Optional[aiohttp.ClientSession]
         :param limit: Maximum number of posts to retrieve.
         :type limit: int
         :param timeframe: The timeframe from which to retrieve posts. Defaults to "all".
@@ -249,14 +318,21 @@ class Posts:
         :type sort: SORT_CRITERION, optional
         :param status: An optional `rich.status.Status` object for displaying status messages. Defaults to None.
         :type status: Optional[rich.status.Status]
+        :param since: Unix time that items must have been created at or after. Listings sorted by "new"
+            stop paginating at the first item created before it. Defaults to None.
+        :type since: Optional[float]
+        :param until: Unix time that items must have been created before. Defaults to None.
+        :type until: Optional[float]
         :return: A list of `SimpleNamespace` objects, each containing parsed post data.
         :rtype: List[SimpleNamespace]
         """
 
-        new_posts = await api.get_posts_or_comments(
+        new_posts = await self._api.get_posts_or_comments(
             session=session,
             kind="new",
             status=status,
+            since=since,
+            until=until,
             limit=limit,
             timeframe=timeframe,
             sort=sort,
@@ -266,18 +342,19 @@ class Posts:
 
         return parsed_posts if new_posts else [SimpleNamespace]
 
+    @session_first
     async def popular(
         self,
-        session: ClientSession,
         limit: int,
+        session: Optional[ClientSession] = None,
         timeframe: TIMEFRAME = "all",
         status: Optional[Status] = None,
     ) -> List[SimpleNamespace]:
         """
         Asynchronously retrieves the popular posts.
 
-        :param session: An `aiohttp.ClientSession` for making the HTTP request.
-        :type session: aiohttp.ClientSession
+        :param session: An `aiohttp.ClientSession` for making the HTTP request. Defaults to the `Api`'s own session.
+        :type session: Optional[aiohttp.ClientSession]
         :param limit: Maximum number of posts to retrieve.
         :type limit: int
         :param timeframe: The timeframe from which to retrieve posts. Defaults to "all".
@@ -287,7 +364,7 @@ class Posts:
         :return: A list of `SimpleNamespace` objects, each containing parsed post data.
         :rtype: List[SimpleNamespace]
         """
-        popular_posts = await api.get_posts_or_comments(
+        popular_posts = await self._api.get_posts_or_comments(
             session=session,
             kind="popular",
             status=status,
@@ -299,18 +376,19 @@ class Posts:
 
         return parsed_posts if popular_posts else [SimpleNamespace]
 
+    @session_first
     async def rising(
         self,
-        session: ClientSession,
         limit: int,
+        session: Optional[ClientSession] = None,
         timeframe: TIMEFRAME = "all",
         status: Optional[Status] = None,
     ) -> List[SimpleNamespace]:
         """
         Asynchronously retrieves the rising posts.
 
-        :param session: An `aiohttp.ClientSession` for making the HTTP request.
-        :type session: aiohttp.ClientSession
+        :param session: An `aiohttp.ClientSession` for making the HTTP request. Defaults to the `Api`'s own session.
+        :type session: Optional[aiohttp.ClientSession]
         :param limit: Maximum number of posts to retrieve.
         :type limit: int
         :param timeframe: The timeframe from which to retrieve posts. Defaults to "all".
@@ -321,7 +399,7 @@ class Posts:
         :rtype: List[SimpleNamespace]
         """
 
-        rising_posts = await api.get_posts_or_comments(
+        rising_posts = await self._api.get_posts_or_comments(
             session=session,
             kind="rising",
             status=status,
@@ -333,6 +411,58 @@ class Posts:
 
         return parsed_posts if rising_posts else [SimpleNamespace]
 
+    @session_first
+    async def iter_posts(
+        self,
+        kind: Literal[
+            "best", "controversial", "front_page", "new", "popular", "rising"
+        ],
+        limit: int,
+        session: Optional[ClientSession] = None,
+        timeframe: TIMEFRAME = "all",
+        sort: SORT_CRITERION = "all",
+        status: Optional[Status] = None,
+        since: Optional[float] = None,
+        until: Optional[float] = None,
+    ) -> AsyncIterator[SimpleNamespace]:
+        """
+        Asynchronously iterates over posts from the specified listing, yielding each post as soon as
+        the page it belongs to has been fetched.
+
+        :param session: An `aiohttp.ClientSession` for making the HTTP request. Defaults to the `Api`'s own session.
+        :type session: Optional[aiohttp.ClientSession]
+        :param kind: The listing to retrieve posts from.
+        :type kind: Literal["best", "controversial", "front_page", "new", "popular", "rising"]
+        :param limit: Maximum number of posts to retrieve.
+        :type limit: int
+        :param timeframe: The timeframe from which to retrieve posts. Defaults to "all".
+        :type timeframe: TIMEFRAME, optional
+        :param sort: Sorting criterion for posts. Defaults to "all".
+        :type sort: SORT_CRITERION, optional
+        :param status: An optional `rich.status.Status` object for displaying status messages. Defaults to None.
+        :type status: Optional[rich.status.Status]
+        :param since: Unix time that items must have been created at or after. Listings sorted by "new"
+            stop paginating at the first item created before it. Defaults to None.
+        :type since: Optional[float]
+        :param until: Unix time that items must have been created before. Defaults to None.
+        :type until: Optional[float]
+        :return: An asynchronous iterator of `SimpleNamespace` objects, each containing parsed post data.
+        :rtype: AsyncIterator[SimpleNamespace]
+        """
+
+        async for page in self._api.iter_posts_or_comments(
+            session=session,
+            kind=kind,
+            status=status,
+            since=since,
+            until=until,
+            timeframe=timeframe,
+            sort=sort,
+            limit=limit,
+        ):
+            for post in self._parse.posts(page):
+                yield post
+
 
 class Search:
     """
@@ -340,7 +470,12 @@ class Search:
     from different entities.
     """
 
-    def __init__(self, query: str, time_format: TIME_FORMAT = "locale"):
+    def __init__(
+        self,
+        query: str,
+        time_format: TIME_FORMAT = "locale",
+        api: Optional[Api] = None,
+    ):
         """
         Initialises the `Search` instance for searching posts, subreddits, and users.
 
@@ -348,23 +483,28 @@ class Search:
         :type query: str
         :param time_format: Format for displaying time, either 'concise' or 'locale'. Defaults to 'locale'.
         :type time_format: Literal["concise", "locale"]
+        :param api: The `Api` to send requests with, e.g. one that owns a pooled session.
+            Defaults to the shared `Api` instance.
+        :type api: Optional[Api]
         """
 
         self._query = query
         self._parse = Parse(time_format=time_format)
+        self._api = api or default_api
 
+    @session_first
     async def posts(
         self,
-        session: ClientSession,
         limit: int,
+        session: Optional[ClientSession] = None,
         sort: SORT_CRITERION = "all",
         status: Optional[Status] = None,
     ) -> List[SimpleNamespace]:
         """
         Asynchronously retrieves posts that match with the specified query.
 
-        :param session: An `aiohttp.ClientSession` for making the HTTP request.
-        :type session: aiohttp.ClientSession
+        :param session: An `aiohttp.ClientSession` for making the HTTP request. Defaults to the `Api`'s own session.
+        :type session: Optional[aiohttp.ClientSession]
         :param limit: Maximum number of posts to retrieve.
         :type limit: int
         :param sort: Sorting criterion for posts. Defaults to "all".
@@ -375,7 +515,7 @@ class Search:
         :rtype: List[SimpleNamespace]
         """
 
-        search_results = await api.search_entities(
+        search_results = await self._api.search_entities(
             session=session,
             kind="posts",
             status=status,
@@ -388,18 +528,54 @@ class Search:
 
         return parsed_posts if search_results else [SimpleNamespace]
 
+    @session_first
+    async def iter_posts(
+        self,
+        limit: int,
+        session: Optional[ClientSession] = None,
+        sort: SORT_CRITERION = "all",
+        status: Optional[Status] = None,
+    ) -> AsyncIterator[SimpleNamespace]:
+        """
+        Asynchronously iterates over posts that match with the specified query, yielding each post
+        as soon as the page it belongs to has been fetched.
+
+        :param session: An `aiohttp.ClientSession` for making the HTTP request. Defaults to the `Api`'s own session.
+        :type session: Optional[aiohttp.ClientSession]
+        :param limit: Maximum number of posts to retrieve.
+        :type limit: int
+        :param sort: Sorting criterion for posts. Defaults to "all".
+        :type sort: SORT_CRITERION, optional
+        :param status: An optional `rich.status.Status` object for displaying status messages. Defaults to None.
+        :type status: Optional[rich.status.Status]
+        :return: An asynchronous iterator of `SimpleNamespace` objects, each containing parsed post data.
+        :rtype: AsyncIterator[SimpleNamespace]
+        """
+
+        async for page in self._api.iter_search(
+            session=session,
+            kind="posts",
+            status=status,
+            query=self._query,
+            sort=sort,
+            limit=limit,
+        ):
+            for post in self._parse.posts(page):
+                yield post
+
+    @session_first
     async def subreddits(
         self,
-        session: ClientSession,
         limit: int,
+        session: Optional[ClientSession] = None,
         sort: SORT_CRITERION = "all",
         status: Optional[Status] = None,
     ) -> List[SimpleNamespace]:
         """
         Asynchronously retrieves subreddits that match with the specified query.
 
-        :param session: An `aiohttp.ClientSession` for making the HTTP request.
-        :type session: aiohttp.ClientSession
+        :param session: An `aiohttp.ClientSession` for making the HTTP request. Defaults to the `Api`'s own session.
+        :type session: Optional[aiohttp.ClientSession]
         :param limit: Maximum number of subreddits to retrieve.
         :type limit: int
         :param sort: Sorting criterion for subreddits. Defaults to "all".
@@ -410,7 +586,7 @@ class Search:
         :rtype: List[SimpleNamespace]
         """
 
-        search_results = await api.search_entities(
+        search_results = await self._api.search_entities(
             session=session,
             kind="subreddits",
             status=status,
@@ -423,18 +599,54 @@ class Search:
 
         return parsed_subreddits if search_results else [SimpleNamespace]
 
+    @session_first
+    async def iter_subreddits(
+        self,
+        limit: int,
+        session: Optional[ClientSession] = None,
+        sort: SORT_CRITERION = "all",
+        status: Optional[Status] = None,
+    ) -> AsyncIterator[SimpleNamespace]:
+        """
+        Asynchronously iterates over subreddits that match with the specified query, yielding each subreddit
+        as soon as the page it belongs to has been fetched.
+
+        :param session: An `aiohttp.ClientSession` for making the HTTP request. Defaults to the `Api`'s own session.
+        :type session: Optional[aiohttp.ClientSession]
+        :param limit: Maximum number of subreddits to retrieve.
+        :type limit: int
+        :param sort: Sorting criterion for subreddits. Defaults to "all".
+        :type sort: SORT_CRITERION, optional
+        :param status: An optional `rich.status.Status` object for displaying status messages. Defaults to None.
+        :type status: Optional[rich.status.Status]
+        :return: An asynchronous iterator of `SimpleNamespace` objects, each containing parsed subreddit data.
+        :rtype: AsyncIterator[SimpleNamespace]
+        """
+
+        async for page in self._api.iter_search(
+            session=session,
+            kind="subreddits",
+            status=status,
+            query=self._query,
+            sort=sort,
+            limit=limit,
+        ):
+            for subreddit in self._parse.subreddits(page):
+                yield subreddit
+
+    @session_first
     async def users(
         self,
-        session: ClientSession,
         limit: int,
+        session: Optional[ClientSession] = None,
         sort: SORT_CRITERION = "all",
         status: Optional[Status] = None,
     ) -> List[SimpleNamespace]:
         """
         Asynchronously retrieves users that match with the specified query.
 
-        :param session: An `aiohttp.ClientSession` for making the HTTP request.
-        :type session: aiohttp.ClientSession
+        :param session: An `aiohttp.ClientSession` for making the HTTP request. Defaults to the `Api`'s own session.
+        :type session: Optional[aiohttp.ClientSession]
         :param limit: Maximum number of users to retrieve.
         :type limit: int
         :param sort: Sorting criterion for users. Defaults to "all".
@@ -445,7 +657,7 @@ class Search:
         :rtype: List[SimpleNamespace]
         """
 
-        search_results = await api.search_entities(
+        search_results = await self._api.search_entities(
             session=session,
             kind="users",
             status=status,
@@ -458,11 +670,51 @@ class Search:
 
         return parsed_users if search_results else [SimpleNamespace]
 
+    @session_first
+    async def iter_users(
+        self,
+        limit: int,
+        session: Optional[ClientSession] = None,
+        sort: SORT_CRITERION = "all",
+        status: Optional[Status] = None,
+    ) -> AsyncIterator[SimpleNamespace]:
+        """
+        Asynchronously iterates over users that match with the specified query, yielding each user
+        as soon as the page it belongs to has been fetched.
+
+        :param session: An `aiohttp.ClientSession` for making the HTTP request. Defaults to the `Api`'s own session.
+        :type session: Optional[aiohttp.ClientSession]
+        :param limit: Maximum number of users to retrieve.
+        :type limit: int
+        :param sort: Sorting criterion for users. Defaults to "all".
+        :type sort: SORT_CRITERION, optional
+        :param status: An optional `rich.status.Status` object for displaying status messages. Defaults to None.
+        :type status: Optional[rich.status.Status]
+        :return: An asynchronous iterator of `SimpleNamespace` objects, each containing parsed user data.
+        :rtype: AsyncIterator[SimpleNamespace]
+        """
+
+        async for page in self._api.iter_search(
+            session=session,
+            kind="users",
+            status=status,
+            query=self._query,
+            sort=sort,
+            limit=limit,
+        ):
+            for user in self._parse.users(page):
+                yield user
+
 
 class Subreddit:
     """Represents a Reddit community (subreddit) and provides methods for retrieving its data."""
 
-    def __init__(self, name: str, time_format: TIME_FORMAT = "locale"):
+    def __init__(
+        self,
+        name: str,
+        time_format: TIME_FORMAT = "locale",
+        api: Optional[Api] = None,
+    ):
         """
         Initialises a `Subreddit` instance to get a subreddit's profile, wiki pages, and posts data,
         and to search for posts containing a specified query.
@@ -471,6 +723,9 @@ class Subreddit:
         :type name: str
         :param time_format: Format for displaying time, either 'concise' or 'locale'. Defaults to 'locale'.
         :type time_format: Literal["concise", "locale"]
+        :param api: The `Api` to send requests with, e.g. one that owns a pooled session.
+            Defaults to the shared `Api` instance.
+        :type api: Optional[Api]
         """
 
         self._name = name
@@ -478,21 +733,24 @@ class Subreddit:
             time_format  # This will also be accessed in the comments method
         )
         self._parse = Parse(time_format=self._time_format)
+        self._api = api or default_api
 
+    @session_first
     async def comments(
         self,
-        session: ClientSession,
         posts_limit: int,
         comments_per_post: int,
+        session: Optional[ClientSession] = None,
         sort: SORT_CRITERION = "all",
         timeframe: TIMEFRAME = "all",
         status: Optional[Status] = None,
+        concurrency: int = 10,
     ) -> List[SimpleNamespace]:
         """
         Asynchronously retrieves comments from a subreddit.
 
-        :param session: An `aiohttp.ClientSession` for making the HTTP request.
-        :type session: aiohttp.ClientSession
+        :param session: An `aiohttp.ClientSession` for making the HTTP request. Defaults to the `Api`'s own session.
+        :type session: Optional[aiohttp.ClientSession]
         :param posts_limit: Maximum number of posts to retrieve comments from.
         :type posts_limit: int
         :param comments_per_post: Maximum number of comments to retrieve per post.
@@ -503,6 +761,8 @@ class Subreddit:
         :type timeframe: TIMEFRAME, optional
         :param status: An optional `rich.status.Status` object for displaying status messages. Defaults to None.
         :type status: Optional[rich.status.Status]
+        :param concurrency: Maximum number of posts to retrieve comments from at the same time. Defaults to 10.
+        :type concurrency: int
         :return: A list of `SimpleNamespace` objects, each containing parsed comment data.
         :rtype: List[SimpleNamespace]
         """
@@ -514,34 +774,102 @@ class Subreddit:
             sort=sort,
             timeframe=timeframe,
         )
-        all_comments: List = []
-        for post in posts:
-            post = Post(
-                id=post.get("id"),
-                subreddit=post.get("subreddit"),
-                time_format=self._time_format,
-            )
-            post_comments = await post.comments(
-                session=session, limit=comments_per_post, sort=sort, status=status
-            )
 
-            all_comments.extend(post_comments)
+        all_comments: List[SimpleNamespace] = await self._comments_from_posts(
+            session=session,
+            posts=posts,
+            comments_per_post=comments_per_post,
+            sort=sort,
+            concurrency=concurrency,
+            status=status,
+        )
+
+        return all_comments
+
+    async def _comments_from_posts(
+        self,
+        posts: List[SimpleNamespace],
+        comments_per_post: int,
+        sort: SORT_CRITERION,
+        concurrency: int,
+        session: Optional[ClientSession] = None,
+        status: Optional[Status] = None,
+    ) -> List[SimpleNamespace]:
+        """
+        Asynchronously retrieves the comments of each of the given posts, with at most `concurrency`
+        posts being fetched at the same time.
+
+        Comments are returned in the same order as the posts. A post whose comments could not be retrieved
+        is skipped, without discarding the comments retrieved from the other posts.
+
+        :param session: An `aiohttp.ClientSession` for making the HTTP request. Defaults to the `Api`'s own session.
+        :type session: Optional[aiohttp.ClientSession]
+        :param posts: Parsed posts to retrieve comments from.
+        :type posts: List[SimpleNamespace]
+        :param comments_per_post: Maximum number of comments to retrieve per post.
+        :type comments_per_post: int
+        :param sort: Sorting criterion for the comments.
+        :type sort: SORT_CRITERION
+        :param concurrency: Maximum number of posts to retrieve comments from at the same time.
+        :type concurrency: int
+        :param status: An optional `rich.status.Status` object for displaying status messages. Defaults to None.
+        :type status: Optional[rich.status.Status]
+        :return: A list of `SimpleNamespace` objects, each containing parsed comment data.
+        :rtype: List[SimpleNamespace]
+        """
+
+        semaphore = asyncio.Semaphore(max(concurrency, 1))
+
+        async def post_comments(post: SimpleNamespace) -> List[SimpleNamespace]:
+            async with semaphore:
+                return await Post(
+                    id=post.id,
+                    subreddit=getattr(post, "subreddit", self._name),
+                    time_format=self._time_format,
+                    api=self._api,
+                ).comments(
+                    session=session, limit=comments_per_post, sort=sort, status=status
+                )
+
+        results = await asyncio.gather(
+            *[
+                post_comments(post=post)
+                for post in posts
+                if isinstance(post, SimpleNamespace)
+            ],
+            return_exceptions=True,
+        )
+
+        all_comments: List[SimpleNamespace] = []
+        for result in results:
+            if isinstance(result, BaseException):
+                notify.warning(
+                    f"Skipping a post whose comments could not be retrieved: {result}"
+                )
+                continue
+
+            all_comments.extend(
+                comment for comment in result if isinstance(comment, SimpleNamespace)
+            )
 
         return all_comments
 
+    @session_first
     async def posts(
         self,
-        session: ClientSession,
         limit: int,
+        session: Optional[ClientSession] = None,
         sort: SORT_CRITERION = "all",
         timeframe: TIMEFRAME = "all",
         status: Optional[Status] = None,
+        since: Optional[float] = None,
+        until: Optional[float] = None,
     ) -> List[SimpleNamespace]:
         """
         Asynchronously retrieves posts from a subreddit.
 
-        :param session: An `aiohttp.ClientSession` for making the HTTP request.
-        :type session: aiohttp.ClientSession
+        :param session: An `aiohttp.ClientSession` for making the HTTP request. Defaults to the `Api`'s own session.
+        :type session: Optional[aiohttp.ClientSession]
         :param limit: Maximum number of posts to retrieve.
         :type limit: int
         :param sort: Sorting criterion for the posts. Defaults to "all".
@@ -550,15 +878,22 @@ class Subreddit:
         :type timeframe: TIMEFRAME, optional
         :param status: An optional `rich.status.Status` object for displaying status messages. Defaults to None.
         :type status: Optional[rich.status.Status]
+        :param since: Unix time that items must have been created at or after. Listings sorted by "new"
+            stop paginating at the first item created before it. Defaults to None.
+        :type since: Optional[float]
+        :param until: Unix time that items must have been created before. Defaults to None.
+        :type until: Optional[float]
         :return: A list of `SimpleNamespace` objects, each containing parsed post data.
         :rtype: List[SimpleNamespace]
         """
 
-        subreddit_posts = await api.get_posts_or_comments(
+        subreddit_posts = await self._api.get_posts_or_comments(
             session=session,
             kind="posts_from_a_subreddit",
             subreddit=self._name,
             status=status,
+            since=since,
+            until=until,
             limit=limit,
             sort=sort,
             timeframe=timeframe,
@@ -568,21 +903,112 @@ class Subreddit:
 
         return parsed_posts if subreddit_posts else [SimpleNamespace]
 
+    @session_first
+    async def iter_posts(
+        self,
+        limit: int,
+        session: Optional[ClientSession] = None,
+        sort: SORT_CRITERION = "all",
+        timeframe: TIMEFRAME = "all",
+        status: Optional[Status] = None,
+        since: Optional[float] = None,
+        until: Optional[float] = None,
+    ) -> AsyncIterator[SimpleNamespace]:
+        """
+        Asynchronously iterates over posts from a subreddit, yielding each post as soon as
+        the page it belongs to has been fetched.
+
+        :param session: An `aiohttp.ClientSession` for making the HTTP request. Defaults to the `Api`'s own session.
+        :type session: Optional[aiohttp.ClientSession]
+        :param limit: Maximum number of posts to retrieve.
+        :type limit: int
+        :param sort: Sorting criterion for the posts. Defaults to "all".
+        :type sort: SORT_CRITERION, optional
+        :param timeframe: The timeframe from which to retrieve posts. Defaults to "all".
+        :type timeframe: TIMEFRAME, optional
+        :param status: An optional `rich.status.Status` object for displaying status messages. Defaults to None.
+        :type status: Optional[rich.status.Status]
+        :param since: Unix time that items must have been created at or after. Listings sorted by "new"
+            stop paginating at the first item created before it. Defaults to None.
+        :type since: Optional[float]
+        :param until: Unix time that items must have been created before. Defaults to None.
+        :type until: Optional[float]
+        :return: An asynchronous iterator of `SimpleNamespace` objects, each containing parsed post data.
+        :rtype: AsyncIterator[SimpleNamespace]
+        """
+
+        async for page in self._api.iter_posts_or_comments(
+            session=session,
+            kind="posts_from_a_subreddit",
+            subreddit=self._name,
+            status=status,
+            since=since,
+            until=until,
+            limit=limit,
+            sort=sort,
+            timeframe=timeframe,
+        ):
+            for post in self._parse.posts(page):
+                yield post
+
+    @session_first
+    async def harvest_posts(
+        self,
+        limit: Optional[int] = None,
+        session: Optional[ClientSession] = None,
+        since: Optional[float] = None,
+        until: Optional[float] = None,
+        status: Optional[Status] = None,
+    ) -> Tuple[List[SimpleNamespace], List[SimpleNamespace]]:
+        """
+        Asynchronously retrieves the subreddit's posts from every sort and timeframe at once,
+        merged without duplicates, to get past the ~1,000-item cap that Reddit puts on each listing.
+
+        :param session: An `aiohttp.ClientSession` for making the HTTP request. Defaults to the `Api`'s own session.
+        :type session: Optional[aiohttp.ClientSession]
+        :param limit: Maximum number of unique posts to retrieve from all the listings together.
+            Defaults to None (every post of every listing).
+        :type limit: Optional[int]
+        :param since: Unix time that posts must have been created at or after. Defaults to None.
+        :type since: Optional[float]
+        :param until: Unix time that posts must have been created before. Defaults to None.
+        :type until: Optional[float]
+        :param status: An optional `rich.status.Status` object for displaying status messages. Defaults to None.
+        :type status: Optional[rich.status.Status]
+        :return: A list of `SimpleNamespace` objects, each containing parsed post data, and the
+            coverage of each listing (see `Api.harvest_posts_or_comments()`), as `SimpleNamespace` objects.
+        :rtype: Tuple[List[SimpleNamespace], List[SimpleNamespace]]
+        """
+
+        harvested, coverage = await self._api.harvest_posts_or_comments(
+            session=session,
+            kind="posts_from_a_subreddit",
+            subreddit=self._name,
+            limit=limit,
+            since=since,
+            until=until,
+            status=status,
+        )
+
+        return self._parse.posts(harvested), [
+            SimpleNamespace(**listing) for listing in coverage
+        ]
+
     async def profile(
-        self, session: ClientSession, status: Optional[Status] = None
+        self, session: Optional[ClientSession] = None, status: Optional[Status] = None
     ) -> SimpleNamespace:
         """
         Asynchronously retrieves a subreddit's profile data.
 
-        :param session: An `aiohttp.ClientSession` for making the HTTP request.
-        :type session: aiohttp.ClientSession
+        :param session: An `aiohttp.ClientSession` for making the HTTP request. Defaults to the `Api`'s own session.
+        :type session: Optional[aiohttp.ClientSession]
         :param status: An optional `rich.status.Status` object for displaying status messages. Defaults to None.
         :type status: Optional[rich.status.Status]
         :return: A `SimpleNamespace` object containing the parsed subreddit profile data.
         :rtype: SimpleNamespace
         """
 
-        subreddit_profile = await api.get_entity(
+        subreddit_profile = await self._api.get_entity(
             session=session,
             status=status,
             kind="subreddit",
@@ -593,21 +1019,23 @@ class Subreddit:
 
         return parsed_profile if subreddit_profile else SimpleNamespace
 
+    @session_first
     async def search_comments(
         self,
-        session: ClientSession,
         query: str,
         posts_limit: int,
         comments_per_post: int,
+        session: Optional[ClientSession] = None,
         sort: SORT_CRITERION = "all",
         timeframe: TIMEFRAME = "all",
         status: Optional[Status] = None,
+        concurrency: int = 10,
     ) -> List[SimpleNamespace]:
         """
         Asynchronously retrieves comments that contain the specified query from a subreddit.
 
-        :param session: An `aiohttp.ClientSession` for making the HTTP request.
-        :type session: aiohttp.ClientSession
+        :param session: An `aiohttp.ClientSession` for making the HTTP request. Defaults to the `Api`'s own session.
+        :type session: Optional[aiohttp.ClientSession]
         :param query: Search query.
         :type query: str
         :param posts_limit: Maximum number of posts to retrieve comments from.
@@ -620,6 +1048,8 @@ class Subreddit:
         :type timeframe: TIMEFRAME, optional
         :param status: An optional `rich.status.Status` object for displaying status messages. Defaults to None.
         :type: Optional[rich.status.Status]
+        :param concurrency: Maximum number of posts to retrieve comments from at the same time. Defaults to 10.
+        :type concurrency: int
         :return: A list of `SimpleNamespace` objects, each containing comment data.
         :rtype: List[SimpleNamespace]
         """
@@ -631,20 +1061,15 @@ class Subreddit:
             sort=sort,
             timeframe=timeframe,
         )
-        all_comments: List = []
+        all_comments: List[SimpleNamespace] = await self._comments_from_posts(
+            session=session,
+            posts=posts,
+            comments_per_post=comments_per_post,
+            sort="all",
+            concurrency=concurrency,
+            status=status,
+        )
         found_comments: List = []
-        for post in posts:
-            post = Post(
-                id=post.get("id"),
-                subreddit=self._name,
-                time_format=self._time_format,
-            )
-
-            comments = await post.comments(
-                session=session, limit=comments_per_post, status=status
-            )
-
-            all_comments.extend(comments)
 
         pattern = rf"(?i)\b{re.escape(query)}\b"
         regex: re.Pattern = re.compile(pattern, re.IGNORECASE)
@@ -657,11 +1082,12 @@ class Subreddit:
         if found_comments:
             return found_comments
 
+    @session_first
     async def search_posts(
         self,
-        session: ClientSession,
         query: str,
         limit: int,
+        session: Optional[ClientSession] = None,
         sort: SORT_CRITERION = "all",
         timeframe: TIMEFRAME = "all",
         status: Optional[Status] = None,
@@ -669,8 +1095,8 @@ class Subreddit:
         """
         Asynchronously get posts that contain the specified query string from a subreddit.
 
-        :param session: An `aiohttp.ClientSession` for making the HTTP request.
-        :type session: aiohttp.ClientSession
+        :param session: An `aiohttp.ClientSession` for making the HTTP request. Defaults to the `Api`'s own session.
+        :type session: Optional[aiohttp.ClientSession]
         :param query: Search query.
         :type query: str
         :param limit: Maximum number of posts to return.
@@ -685,7 +1111,7 @@ class Subreddit:
         :rtype: List[SimpleNamespace]
         """
 
-        search_results = await api.get_posts_or_comments(
+        search_results = await self._api.get_posts_or_comments(
             session=session,
             kind="search_from_a_subreddit",
             status=status,
@@ -700,14 +1126,57 @@ class Subreddit:
 
         return parsed_posts if search_results else [SimpleNamespace]
 
+    @session_first
+    async def iter_search_posts(
+        self,
+        query: str,
+        limit: int,
+        session: Optional[ClientSession] = None,
+        sort: SORT_CRITERION = "all",
+        timeframe: TIMEFRAME = "all",
+        status: Optional[Status] = None,
+    ) -> AsyncIterator[SimpleNamespace]:
+        """
+        Asynchronously iterates over posts that contain the specified query string from a subreddit,
+        yielding each post as soon as the page it belongs to has been fetched.
+
+        :param session: An `aiohttp.ClientSession` for making the HTTP request. Defaults to the `Api`'s own session.
+        :type session: Optional[aiohttp.ClientSession]
+        :param query: Search query.
+        :type query: str
+        :param limit: Maximum number of posts to return.
+        :type limit: int
+        :param sort: Sort criterion for the posts.
+        :type sort: str
+        :param timeframe: Timeframe from which to get posts.
+        :type timeframe: Literal[str]
+        :param status: An optional `rich.status.Status` object for displaying status messages. Defaults to None.
+        :type status: Optional[rich.status.Status]
+        :return: An asynchronous iterator of `SimpleNamespace` objects, each containing post data.
+        :rtype: AsyncIterator[SimpleNamespace]
+        """
+
+        async for page in self._api.iter_posts_or_comments(
+            session=session,
+            kind="search_from_a_subreddit",
+            status=status,
+            subreddit=self._name,
+            query=query,
+            limit=limit,
+            sort=sort,
+            timeframe=timeframe,
+        ):
+            for post in self._parse.posts(page):
+                yield post
+
     async def wiki_pages(
-        self, session: ClientSession, status: Optional[Status] = None
+        self, session: Optional[ClientSession] = None, status: Optional[Status] = None
     ) -> List[str]:
         """
         Asynchronously get a subreddit's wiki pages.
 
-        :param session: An `aiohttp.ClientSession` for making the HTTP request.
-        :type session: aiohttp.ClientSession
+        :param session: An `aiohttp.ClientSession` for making the HTTP request. Defaults to the `Api`'s own session.
+        :type session: Optional[aiohttp.ClientSession]
         :param status: An optional `rich.status.Status` object for displaying status messages. Defaults to None.
         :type status: Optional[rich.status.Status]
         :return: A list of strings, each representing a wiki page.
@@ -719,17 +1188,18 @@ class Subreddit:
                 f"Retrieving wiki pages from subreddit ({self._name})",
             )
 
-        pages = await api.send_request(
-            endpoint=f"{api.subreddit_endpoint}/{self._name}/wiki/pages.json",
+        pages = await self._api.send_request(
+            endpoint=f"{self._api.endpoint(kind='subreddit')}/{self._name}/wiki/pages.json",
             session=session,
         )
 
         return pages.get("data")
 
+    @session_first
     async def wiki_page(
         self,
         page_name: str,
-        session: ClientSession,
+        session: Optional[ClientSession] = None,
         status: Optional[Status] = None,
     ) -> SimpleNamespace:
         """
@@ -737,15 +1207,15 @@ class Subreddit:
 
         :param page_name: Wiki page to get data from.
         :type page_name: str
-        :param session: An `aiohttp.ClientSession` for making the HTTP request.
-        :type session: aiohttp.ClientSession
+        :param session: An `aiohttp.ClientSession` for making the HTTP request. Defaults to the `Api`'s own session.
+        :type session: Optional[aiohttp.ClientSession]
         :param status: An optional `rich.status.Status` object for displaying status messages. Defaults to None.
         :type status: Optional[rich.status.Status]
         :return: A `SimpleNamespace` object containing the parsed wiki page data.
         :rtype: SimpleNamespace
         """
 
-        wiki_page = await api.get_entity(
+        wiki_page = await self._api.get_entity(
             session=session,
             kind="wikipage",
             status=status,
@@ -761,29 +1231,38 @@ class Subreddit:
 class Subreddits:
     """Represents Reddit subreddits and provides methods for getting related data."""
 
-    def __init__(self, time_format: TIME_FORMAT = "locale"):
+    def __init__(
+        self,
+        time_format: TIME_FORMAT = "locale",
+        api: Optional[Api] = None,
+    ):
         """
         Initialises the `Subreddits()` instance for getting `all`, `default`, `new` and `popular` subreddits.
 
         :param time_format: Time format of the output data. Use `concise` for a human-readable
                         time difference, or `locale` for a localized datetime string. Defaults to `locale`.
         :type time_format: Literal["concise", "locale"]
+        :param api: The `Api` to send requests with, e.g. one that owns a pooled session.
+            Defaults to the shared `Api` instance.
+        :type api: Optional[Api]
         """
 
         self._parse = Parse(time_format=time_format)
+        self._api = api or default_api
 
+    @session_first
     async def all(
         self,
-        session: ClientSession,
         limit: int,
+        session: Optional[ClientSession] = None,
         timeframe: TIMEFRAME = "all",
         status: Optional[Status] = None,
     ) -> List[SimpleNamespace]:
         """
         Asynchronously get all subreddits.
 
-        :param session: An `aiohttp.ClientSession` for making the HTTP request.
-        :type session: aiohttp.ClientSession
+        :param session: An `aiohttp.ClientSession` for making the HTTP request. Defaults to the `Api`'s own session.
+        :type session: Optional[aiohttp.ClientSession]
         :param limit: Maximum number of subreddits to return.
         :type limit: int
         :param timeframe: Timeframe from which to get all subreddits.
@@ -797,7 +1276,7 @@ class Subreddits:
             Items will most likely be limited to 1000, per Reddit's API policy.
         """
 
-        all_subreddits = await api.get_subreddits(
+        all_subreddits = await self._api.get_subreddits(
             session=session,
             kind="all",
             status=status,
@@ -809,10 +1288,11 @@ class Subreddits:
 
         return parsed_subreddits if all_subreddits else [SimpleNamespace]
 
+    @session_first
     async def default(
         self,
         limit: int,
-        session: ClientSession,
+        session: Optional[ClientSession] = None,
         status: Optional[Status] = None,
     ) -> List[SimpleNamespace]:
         """
@@ -820,15 +1300,15 @@ class Subreddits:
 
         :param limit: Maximum number of subreddits to return.
         :type limit: int
-        :param session: An `aiohttp.ClientSession` for making the HTTP request.
-        :type session: aiohttp.ClientSession
+        :param session: An `aiohttp.ClientSession` for making the HTTP request. Defaults to the `Api`'s own session.
+        :type session: Optional[aiohttp.ClientSession]
         :param status: An optional `rich.status.Status` object for displaying status messages. Defaults to None.
         :type status: Optional[rich.status.Status]
         :return: A list of `SimpleNamespace` objects, each containing subreddit data.
         :rtype: List[SimpleNamespace]
         """
 
-        default_subreddits = await api.get_subreddits(
+        default_subreddits = await self._api.get_subreddits(
             session=session,
             kind="default",
             status=status,
@@ -840,18 +1320,19 @@ class Subreddits:
 
         return parsed_subreddits if default_subreddits else [SimpleNamespace]
 
+    @session_first
     async def new(
         self,
-        session: ClientSession,
         limit: int,
+        session: Optional[ClientSession] = None,
         timeframe: TIMEFRAME = "all",
         status: Optional[Status] = None,
     ) -> List[SimpleNamespace]:
         """
         Asynchronously get new subreddits.
 
-        :param session: An `aiohttp.ClientSession` for making the HTTP request.
-        :type session: aiohttp.ClientSession
+        :param session: An `aiohttp.ClientSession` for making the HTTP request. Defaults to the `Api`'s own session.
+        :type session: Optional[aiohttp.ClientSession]
         :param limit: Maximum number of subreddits to return.
         :type limit: int
         :param timeframe: Timeframe from which to get new subreddits.
@@ -861,7 +1342,7 @@ class Subreddits:
         :return: A list of `SimpleNamespace` objects, each containing subreddit data.
         :rtype: List[SimpleNamespace]
         """
-        new_subreddits = await api.get_subreddits(
+        new_subreddits = await self._api.get_subreddits(
             session=session,
             status=status,
             kind="new",
@@ -873,18 +1354,19 @@ class Subreddits:
 
         return parsed_subreddits if new_subreddits else [SimpleNamespace]
 
+    @session_first
     async def popular(
         self,
-        session: ClientSession,
         limit: int,
+        session: Optional[ClientSession] = None,
         timeframe: TIMEFRAME = "all",
         status: Optional[Status] = None,
     ) -> List[SimpleNamespace]:
         """
         Asynchronously get popular subreddits.
 
-        :param session: An `aiohttp.ClientSession` for making the HTTP request.
-        :type session: aiohttp.ClientSession
+        :param session: An `aiohttp.ClientSession` for making the HTTP request. Defaults to the `Api`'s own session.
+        :type session: Optional[aiohttp.ClientSession]
         :param limit: Maximum number of subreddits to return.
         :type limit: int
         :param timeframe: Timeframe from which to get popular subreddits.
@@ -895,7 +1377,7 @@ class Subreddits:
         :rtype: List[SimpleNamespace]
         """
 
-        popular_subreddits = await api.get_subreddits(
+        popular_subreddits = await self._api.get_subreddits(
             session=session,
             kind="popular",
             status=status,
@@ -911,7 +1393,12 @@ class Subreddits:
 class User:
     """Represents a Reddit user and provides methods for getting data from the specified user."""
 
-    def __init__(self, name: str, time_format: TIME_FORMAT = "locale"):
+    def __init__(
+        self,
+        name: str,
+        time_format: TIME_FORMAT = "locale",
+        api: Optional[Api] = None,
+    ):
         """
         Initialises a `User()` instance for getting a user's `profile`, `posts` and `comments` data.
 
@@ -920,24 +1407,31 @@ class User:
         :param time_format: Time format of the output data. Use "concise" for a human-readable
                         time difference, or "locale" for a localized datetime string. Defaults to "locale".
         :type time_format: Literal["concise", "locale"]
+        :param api: The `Api` to send requests with, e.g. one that owns a pooled session.
+            Defaults to the shared `Api` instance.
+        :type api: Optional[Api]
         """
 
         self._name = name
         self._parse = Parse(time_format=time_format)
+        self._api = api or default_api
 
+    @session_first
     async def comments(
         self,
-        session: ClientSession,
         limit: int,
+        session: Optional[ClientSession] = None,
         sort: SORT_CRITERION = "all",
         timeframe: TIMEFRAME = "all",
         status: Optional[Status] = None,
+        since: Optional[float] = None,
+        until: Optional[float] = None,
     ) -> List[SimpleNamespace]:
         """
         Asynchronously get a user's comments.
 
-        :param session: An `aiohttp.ClientSession` for making the HTTP request.
-        :type session: aiohttp.ClientSession
+        :param session: An `aiohttp.ClientSession` for making the HTTP request. Defaults to the `Api`'s own session.
+        :type session: Optional[aiohttp.ClientSession]
         :param limit: Maximum number of comments to return.
         :type limit: int
         :param sort: Sort criterion for the comments.
@@ -946,14 +1440,20 @@ class User:
         :type timeframe: Literal[str]
         :param status: An optional `rich.status.Status` object for displaying status messages. Defaults to None.
         :type status: Optional[rich.status.Status]
+        :param since: Unix time that items must have been created at or after. Defaults to None.
+        :type since: Optional[float]
+        :param until: Unix time that items must have been created before. Defaults to None.
+        :type until: Optional[float]
         :return: A list of `SimpleNamespace` objects, each containing comment data.
         :rtype: List[SimpleNamespace]
         """
 
-        user_comments = await api.get_posts_or_comments(
+        user_comments = await self._api.get_posts_or_comments(
             session=session,
             kind="comments_from_a_user",
             status=status,
+            since=since,
+            until=until,
             username=self._name,
             limit=limit,
             sort=sort,
@@ -964,21 +1464,111 @@ class User:
 
         return parsed_comments if user_comments else [SimpleNamespace]
 
+    @session_first
+    async def iter_comments(
+        self,
+        limit: int,
+        session: Optional[ClientSession] = None,
+        sort: SORT_CRITERION = "all",
+        timeframe: TIMEFRAME = "all",
+        status: Optional[Status] = None,
+        since: Optional[float] = None,
+        until: Optional[float] = None,
+    ) -> AsyncIterator[SimpleNamespace]:
+        """
+        Asynchronously iterates over a user's comments, yielding each comment as soon as
+        the page it belongs to has been fetched.
+
+        :param session: An `aiohttp.ClientSession` for making the HTTP request. Defaults to the `Api`'s own session.
+        :type session: Optional[aiohttp.ClientSession]
+        :param limit: Maximum number of comments to return.
+        :type limit: int
+        :param sort: Sort criterion for the comments.
+        :type sort: str
+        :param timeframe: Timeframe from which to get comments.
+        :type timeframe: Literal[str]
+        :param status: An optional `rich.status.Status` object for displaying status messages. Defaults to None.
+        :type status: Optional[rich.status.Status]
+        :param since: Unix time that items must have been created at or after. Defaults to None.
+        :type since: Optional[float]
+        :param until: Unix time that items must have been created before. Defaults to None.
+        :type until: Optional[float]
+        :return: An asynchronous iterator of `SimpleNamespace` objects, each containing comment data.
+        :rtype: AsyncIterator[SimpleNamespace]
+        """
+
+        async for page in self._api.iter_posts_or_comments(
+            session=session,
+            kind="comments_from_a_user",
+            status=status,
+            since=since,
+            until=until,
+            username=self._name,
+            limit=limit,
+            sort=sort,
+            timeframe=timeframe,
+        ):
+            for comment in self._parse.comments(page):
+                yield comment
+
+    @session_first
+    async def harvest_comments(
+        self,
+        limit: Optional[int] = None,
+        session: Optional[ClientSession] = None,
+        since: Optional[float] = None,
+        until: Optional[float] = None,
+        status: Optional[Status] = None,
+    ) -> Tuple[List[SimpleNamespace], List[SimpleNamespace]]:
+        """
+        Asynchronously retrieves a user's comments from every sort and timeframe at once,
+        merged without duplicates, to get past the ~1,000-item cap that Reddit puts on each listing.
+
+        :param session: An `aiohttp.ClientSession` for making the HTTP request. Defaults to the `Api`'s own session.
+        :type session: Optional[aiohttp.ClientSession]
+        :param limit: Maximum number of unique comments to retrieve from all the listings together.
+            Defaults to None (every comment of every listing).
+        :type limit: Optional[int]
+        :param since: Unix time that comments must have been created at or after. Defaults to None.
+        :type since: Optional[float]
+        :param until: Unix time that comments must have been created before. Defaults to None.
+        :type until: Optional[float]
+        :param status: An optional `rich.status.Status` object for displaying status messages. Defaults to None.
+        :type status: Optional[rich.status.Status]
+        :return: A list of `SimpleNamespace` objects, each containing parsed comment data, and the
+            coverage of each listing (see `Api.harvest_posts_or_comments()`), as `SimpleNamespace` objects.
+        :rtype: Tuple[List[SimpleNamespace], List[SimpleNamespace]]
+        """
+
+        harvested, coverage = await self._api.harvest_posts_or_comments(
+            session=session,
+            kind="comments_from_a_user",
+            username=self._name,
+            limit=limit,
+            since=since,
+            until=until,
+            status=status,
+        )
+
+        return self._parse.comments(harvested), [
+            SimpleNamespace(**listing) for listing in coverage
+        ]
+
     async def moderated_subreddits(
-        self, session: ClientSession, status: Optional[Status] = None
+        self, session: Optional[ClientSession] = None, status: Optional[Status] = None
     ) -> List[SimpleNamespace]:
         """
         Asynchronously get subreddits moderated by user.
 
-        :param session: An `aiohttp.ClientSession` for making the HTTP request.
-        :type session: aiohttp.ClientSession
+        :param session: An `aiohttp.ClientSession` for making the HTTP request. Defaults to the `Api`'s own session.
+        :type session: Optional[aiohttp.ClientSession]
         :param status: An optional `rich.status.Status` object for displaying status messages. Defaults to None.
         :type status: Optional[rich.status.Status]
         :return: A list of `SimpleNamespace` objects, each containing subreddit data.
         :rtype: List[SimpleNamespace]
         """
 
-        subreddits = await api.get_subreddits(
+        subreddits = await self._api.get_subreddits(
             session=session,
             kind="user_moderated",
             status=status,
@@ -990,29 +1580,38 @@ class User:
 
         return parsed_subreddits if subreddits else [SimpleNamespace]
 
+    @session_first
     async def overview(
         self,
         limit: int,
-        session: ClientSession,
+        session: Optional[ClientSession] = None,
         status: Optional[Status] = None,
+        since: Optional[float] = None,
+        until: Optional[float] = None,
     ) -> List[SimpleNamespace]:
         """
         Asynchronously get a user's most recent comments.
 
         :param limit: Maximum number of comments to return.
         :type limit: int
-        :param session: An `aiohttp.ClientSession` for making the HTTP request.
-        :type session: aiohttp.ClientSession
+        :param session: An `aiohttp.ClientSession` for making the HTTP request. Defaults to the `Api`'s own session.
+        :type session: Optional[aiohttp.ClientSession]
         :param status: An optional `rich.status.Status` object for displaying status messages. Defaults to None.
         :type status: Optional[rich.status.Status]
+        :param since: Unix time that items must have been created at or after. Defaults to None.
+        :type since: Optional[float]
+        :param until: Unix time that items must have been created before. Defaults to None.
+        :type until: Optional[float]
         :return: A list of `SimpleNamespace` objects, each containing data about a recent comment.
         :rtype: List[SimpleNamespace]
         """
 
-        user_overview = await api.get_posts_or_comments(
+        user_overview = await self._api.get_posts_or_comments(
             session=session,
             kind="overview_of_a_user",
             status=status,
+            since=since,
+            until=until,
             username=self._name,
             limit=limit,
         )
@@ -1021,19 +1620,61 @@ class User:
 
         return parsed_overview if user_overview else [SimpleNamespace]
 
+    @session_first
+    async def iter_overview(
+        self,
+        limit: int,
+        session: Optional[ClientSession] = None,
+        status: Optional[Status] = None,
+        since: Optional[float] = None,
+        until: Optional[float] = None,
+    ) -> AsyncIterator[SimpleNamespace]:
+        """
+        Asynchronously iterates over a user's most recent comments, yielding each comment as soon as
+        the page it belongs to has been fetched.
+
+        :param session: An `aiohttp.ClientSession` for making the HTTP request. Defaults to the `Api`'s own session.
+        :type session: Optional[aiohttp.ClientSession]
+        :param limit: Maximum number of comments to return.
+        :type limit: int
+        :param status: An optional `rich.status.Status` object for displaying status messages. Defaults to None.
+        :type status: Optional[rich.status.Status]
+        :param since: Unix time that items must have been created at or after. Defaults to None.
+        :type since: Optional[float]
+        :param until: Unix time that items must have been created before. Defaults to None.
+        :type until: Optional[float]
+        :return: An asynchronous iterator of `SimpleNamespace` objects, each containing comment data.
+        :rtype: AsyncIterator[SimpleNamespace]
+        """
+
+        async for page in self._api.iter_posts_or_comments(
+            session=session,
+            kind="overview_of_a_user",
+            status=status,
+            since=since,
+            until=until,
+            username=self._name,
+            limit=limit,
+        ):
+            for comment in self._parse.comments(page):
+                yield comment
+
+    @session_first
     async def posts(
         self,
-        session: ClientSession,
         limit: int,
+        session: Optional[ClientSession] = None,
         sort: SORT_CRITERION = "all",
         timeframe: TIMEFRAME = "all",
         status: Optional[Status] = None,
+        since: Optional[float] = None,
+        until: Optional[float] = None,
     ) -> List[SimpleNamespace]:
         """
         Asynchronously get a user's posts.
 
-        :param session: An `aiohttp.ClientSession` for making the HTTP request.
-        :type session: aiohttp.ClientSession
+        :param session: An `aiohttp.ClientSession` for making the HTTP request. Defaults to the `Api`'s own session.
+        :type session: Optional[aiohttp.ClientSession]
         :param limit: Maximum number of posts to return.
         :type limit: int
         :param sort: Sort criterion for the posts.
@@ -1042,14 +1683,20 @@ class User:
         :type timeframe: Literal[str]
         :param status: An optional `rich.status.Status` object for displaying status messages. Defaults to None.
         :type status: Optional[rich.status.Status]
+        :param since: Unix time that items must have been created at or after. Defaults to None.
+        :type since: Optional[float]
+        :param until: Unix time that items must have been created before. Defaults to None.
+        :type until: Optional[float]
         :return: A list of `SimpleNamespace` objects, each containing post data.
         :rtype: List[SimpleNamespace]
         """
 
-        user_posts = await api.get_posts_or_comments(
+        user_posts = await self._api.get_posts_or_comments(
             session=session,
             kind="posts_from_a_user",
             status=status,
+            since=since,
+            until=until,
             username=self._name,
             limit=limit,
             sort=sort,
@@ -1060,21 +1707,111 @@ class User:
 
         return parsed_posts if user_posts else [SimpleNamespace]
 
+    @session_first
+    async def iter_posts(
+        self,
+        limit: int,
+        session: Optional[ClientSession] = None,
+        sort: SORT_CRITERION = "all",
+        timeframe: TIMEFRAME = "all",
+        status: Optional[Status] = None,
+        since: Optional[float] = None,
+        until: Optional[float] = None,
+    ) -> AsyncIterator[SimpleNamespace]:
+        """
+        Asynchronously iterates over a user's posts, yielding each post as soon as
+        the page it belongs to has been fetched.
+
+        :param session: An `aiohttp.ClientSession` for making the HTTP request. Defaults to the `Api`'s own session.
+        :type session: Optional[aiohttp.ClientSession]
+        :param limit: Maximum number of posts to return.
+        :type limit: int
+        :param sort: Sort criterion for the posts.
+        :type sort: str
+        :param timeframe: Timeframe from which to get posts.
+        :type timeframe: Literal[str]
+        :param status: An optional `rich.status.Status` object for displaying status messages. Defaults to None.
+        :type status: Optional[rich.status.Status]
+        :param since: Unix time that items must have been created at or after. Defaults to None.
+        :type since: Optional[float]
+        :param until: Unix time that items must have been created before. Defaults to None.
+        :type until: Optional[float]
+        :return: An asynchronous iterator of `SimpleNamespace` objects, each containing post data.
+        :rtype: AsyncIterator[SimpleNamespace]
+        """
+
+        async for page in self._api.iter_posts_or_comments(
+            session=session,
+            kind="posts_from_a_user",
+            status=status,
+            since=since,
+            until=until,
+            username=self._name,
+            limit=limit,
+            sort=sort,
+            timeframe=timeframe,
+        ):
+            for post in self._parse.posts(page):
+                yield post
+
+    @session_first
+    async def harvest_posts(
+        self,
+        limit: Optional[int] = None,
+        session: Optional[ClientSession] = None,
+        since: Optional[float] = None,
+        until: Optional[float] = None,
+        status: Optional[Status] = None,
+    ) -> Tuple[List[SimpleNamespace], List[SimpleNamespace]]:
+        """
+        Asynchronously retrieves a user's posts from every sort and timeframe at once,
+        merged without duplicates, to get past the ~1,000-item cap that Reddit puts on each listing.
+
+        :param session: An `aiohttp.ClientSession` for making the HTTP request. Defaults to the `Api`'s own session.
+        :type session: Optional[aiohttp.ClientSession]
+        :param limit: Maximum number of unique posts to retrieve from all the listings together.
+            Defaults to None (every post of every listing).
+        :type limit: Optional[int]
+        :param since: Unix time that posts must have been created at or after. Defaults to None.
+        :type since: Optional[float]
+        :param until: Unix time that posts must have been created before. Defaults to None.
+        :type until: Optional[float]
+        :param status: An optional `rich.status.Status` object for displaying status messages. Defaults to None.
+        :type status: Optional[rich.status.Status]
+        :return: A list of `SimpleNamespace` objects, each containing parsed post data, and the
+            coverage of each listing (see `Api.harvest_posts_or_comments()`), as `SimpleNamespace` objects.
+        :rtype: Tuple[List[SimpleNamespace], List[SimpleNamespace]]
+        """
+
+        harvested, coverage = await self._api.harvest_posts_or_comments(
+            session=session,
+            kind="posts_from_a_user",
+            username=self._name,
+            limit=limit,
+            since=since,
+            until=until,
+            status=status,
+        )
+
+        return self._parse.posts(harvested), [
+            SimpleNamespace(**listing) for listing in coverage
+        ]
+
     async def profile(
-        self, session: ClientSession, status: Optional[Status] = None
+        self, session: Optional[ClientSession] = None, status: Optional[Status] = None
     ) -> SimpleNamespace:
         """
         Asynchronously get a user's profile data.
 
-        :param session: An `aiohttp.ClientSession` for making the HTTP request.
-        :type session: aiohttp.ClientSession
+        :param session: An `aiohttp.ClientSession` for making the HTTP request. Defaults to the `Api`'s own session.
+        :type session: Optional[aiohttp.ClientSession]
         :param status: An optional `rich.status.Status` object for displaying status messages. Defaults to None.
         :type status: Optional[rich.status.Status]
         :return: A SimpleNamespace object containing user profile data.
         :rtype: SimpleNamespace
         """
 
-        user_profile = await api.get_entity(
+        user_profile = await self._api.get_entity(
             username=self._name, kind="user", status=status, session=session
         )
 
@@ -1082,11 +1819,12 @@ class User:
 
         return parsed_profile if user_profile else SimpleNamespace
 
+    @session_first
     async def search_posts(
         self,
         query: str,
         limit: int,
-        session: ClientSession,
+        session: Optional[ClientSession] = None,
         sort: SORT_CRITERION = "all",
         timeframe: TIMEFRAME = "all",
         status: Optional[Status] = None,
@@ -1096,8 +1834,8 @@ class User:
 
         :param query: Search query.
         :type query: str
-        :param session: An `aiohttp.ClientSession` for making the HTTP request.
-        :type session: aiohttp.ClientSession
+        :param session: An `aiohttp.ClientSession` for making the HTTP request. Defaults to the `Api`'s own session.
+        :type session: Optional[aiohttp.ClientSession]
         :param limit: Maximum number of posts to search from.
         :type limit: int
         :param sort: Sort criterion for the posts.
@@ -1113,7 +1851,7 @@ class User:
         pattern = rf"(?i)\b{re.escape(query)}\b"
         regex: re.Pattern = re.compile(pattern, re.IGNORECASE)
 
-        user_posts = await api.get_posts_or_comments(
+        user_posts = await self._api.get_posts_or_comments(
             session=session,
             kind="posts_from_a_user",
             status=status,
@@ -1138,11 +1876,12 @@ class User:
 
         return parsed_post if found_posts else [SimpleNamespace]
 
+    @session_first
     async def search_comments(
         self,
         query: str,
         limit: int,
-        session: ClientSession,
+        session: Optional[ClientSession] = None,
         sort: SORT_CRITERION = "all",
         timeframe: TIMEFRAME = "all",
         status: Optional[Status] = None,
@@ -1152,9 +1891,9 @@ class User:
 
         :param query: Search query.
         :type query: str
-        :param session: An `aiohttp.ClientSession` for making the HTTP request.
-        :type session: aiohttp.ClientSession
-        :type session: aiohttp.ClientSession
+        :param session: An `aiohttp.ClientSession` for making the HTTP request. Defaults to the `Api`'s own session.
+        :type session: Optional[aiohttp.ClientSession]
+        :type session: Optional[aiohttp.ClientSession]
         :param limit: Maximum number of comments to search from.
         :type limit: int
         :param sort: Sort criterion for the comments.
@@ -1170,7 +1909,7 @@ class User:
         pattern: str = rf"(?i)\b{re.escape(query)}\b"
         regex: re.Pattern = re.compile(pattern, re.IGNORECASE)
 
-        user_comments = await api.get_posts_or_comments(
+        user_comments = await self._api.get_posts_or_comments(
             session=session,
             kind="comments_from_a_user",
             status=status,
@@ -1190,11 +1929,12 @@ class User:
 
         return parsed_comments if user_comments else [SimpleNamespace]
 
+    @session_first
     async def top_subreddits(
         self,
-        session: ClientSession,
         top_n: int,
         limit: int,
+        session: Optional[ClientSession] = None,
         filename: str = None,
         timeframe: TIMEFRAME = "all",
         status: Optional[Status] = None,
@@ -1202,8 +1942,8 @@ class User:
         """
         Asynchronously get a user's top n subreddits based on subreddit frequency in n posts and saves the analysis to a file.
 
-        :param session: An `aiohttp.ClientSession` for making the HTTP request.
-        :type session: aiohttp.ClientSession
+        :param session: An `aiohttp.ClientSession` for making the HTTP request. Defaults to the `Api`'s own session.
+        :type session: Optional[aiohttp.ClientSession]
         :param top_n: Communities arranging number.
         :type top_n: int
         :param limit: Maximum number of posts to scrape.
@@ -1216,7 +1956,7 @@ class User:
         :type status: Optional[rich.status.Status]
         """
 
-        posts = await api.get_posts_or_comments(
+        posts = await self._api.get_posts_or_comments(
             session=session,
             kind="posts_from_a_user",
             status=status,
@@ -1253,13 +1993,13 @@ class User:
                 return top_subreddits
 
     async def username_available(
-        self, session: ClientSession, status: Optional[Status] = None
+        self, session: Optional[ClientSession] = None, status: Optional[Status] = None
     ) -> bool:
         """
         Checks if the given username is available or taken.
 
-        :param session: An `aiohttp.ClientSession` for making the HTTP request.
-        :type session: aiohttp.ClientSession
+        :param session: An `aiohttp.ClientSession` for making the HTTP request. Defaults to the `Api`'s own session.
+        :type session: Optional[aiohttp.ClientSession]
         :param status: An optional `rich.status.Status` object for displaying status messages. Defaults to None.
         :type status: Optional[rich.status.Status]
         :return: `True` if the given username is available. Otherwise, `False`.
@@ -1269,9 +2009,9 @@ class User:
         if status:
             status.update(f"Checking username availability: {self._name}")
 
-        response: bool = await api.send_request(
+        response: bool = await self._api.send_request(
             session=session,
-            endpoint=api.endpoint("username_available"),
+            endpoint=self._api.endpoint("username_available"),
             params={"user": self._name},
         )
 
@@ -1281,28 +2021,37 @@ class User:
 class Users:
     """Represents Reddit users and provides methods for getting related data."""
 
-    def __init__(self, time_format: TIME_FORMAT = "locale"):
+    def __init__(
+        self,
+        time_format: TIME_FORMAT = "locale",
+        api: Optional[Api] = None,
+    ):
         """
         Initialises the `Users()` instance for getting `new`, `popular` and `all` users.
 
         :param time_format: Time format of the output data. Use `concise` for a human-readable
                         time difference, or `locale` for a localized datetime string. Defaults to `locale`.
         :type time_format: Literal["concise", "locale"]
+        :param api: The `Api` to send requests with, e.g. one that owns a pooled session.
+            Defaults to the shared `Api` instance.
+        :type api: Optional[Api]
         """  #
         self._parse = Parse(time_format=time_format)
+        self._api = api or default_api
 
+    @session_first
     async def new(
         self,
-        session: ClientSession,
         limit: int,
+        session: Optional[ClientSession] = None,
         timeframe: TIMEFRAME = "all",
         status: Optional[Status] = None,
     ) -> List[SimpleNamespace]:
         """
         Asynchronously get new users.
 
-        :param session: An `aiohttp.ClientSession` for making the HTTP request.
-        :type session: aiohttp.ClientSession
+        :param session: An `aiohttp.ClientSession` for making the HTTP request. Defaults to the `Api`'s own session.
+        :type session: Optional[aiohttp.ClientSession]
         :param limit: Maximum number of new users to return.
         :type limit: int
         :param timeframe: Timeframe from which to get new posts.
@@ -1313,7 +2062,7 @@ class Users:
         :rtype: List[SimpleNamespace]
         """
 
-        new_users = await api.get_users(
+        new_users = await self._api.get_users(
             session=session,
             status=status,
             kind="new",
@@ -1325,18 +2074,19 @@ class Users:
 
         return parsed_users if new_users else [SimpleNamespace]
 
+    @session_first
     async def popular(
         self,
-        session: ClientSession,
         limit: int,
+        session: Optional[ClientSession] = None,
         timeframe: TIMEFRAME = "all",
         status: Optional[Status] = None,
     ) -> List[SimpleNamespace]:
         """
         Asynchronously get popular users.
 
-        :param session: An `aiohttp.ClientSession` for making the HTTP request.
-        :type session: aiohttp.ClientSession
+        :param session: An `aiohttp.ClientSession` for making the HTTP request. Defaults to the `Api`'s own session.
+        :type session: Optional[aiohttp.ClientSession]
         :param limit: Maximum number of popular users to return.
         :type limit: int
         :param timeframe: Timeframe from which to get popular posts.
@@ -1347,7 +2097,7 @@ class Users:
         :rtype: List[SimpleNamespace]
         """
 
-        popular_users = await api.get_users(
+        popular_users = await self._api.get_users(
             session=session,
             kind="popular",
             status=status,
@@ -1359,10 +2109,11 @@ class Users:
 
         return parsed_users if popular_users else [SimpleNamespace]
 
+    @session_first
     async def all(
         self,
-        session: ClientSession,
         limit: int,
+        session: Optional[ClientSession] = None,
         timeframe: TIMEFRAME = "all",
         status: Optional[Status] = None,
     ) -> List[SimpleNamespace]:
@@ -1371,8 +2122,8 @@ class Users:
 
         :param limit: Maximum number of all users to return.
         :type limit: int
-        :param session: An `aiohttp.ClientSession` for making the HTTP request.
-        :type session: aiohttp.ClientSession
+        :param session: An `aiohttp.ClientSession` for making the HTTP request. Defaults to the `Api`'s own session.
+        :type session: Optional[aiohttp.ClientSession]
         :param timeframe: Timeframe from which to get all posts.
         :type timeframe: Literal[str]
         :param status: An optional `rich.status.Status` object for displaying status messages. Defaults to None.
@@ -1381,7 +2132,7 @@ class Users:
         :rtype: List[SimpleNamespace]
         """
 
-        all_users = await api.get_users(
+        all_users = await self._api.get_users(
             session=session,
             kind="all",
             status=status,
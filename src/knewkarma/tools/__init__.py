@@ -1,6 +1,17 @@
 __all__ = [
+    "benchmark",
+    "cache",
+    "cassette",
+    "checkpoint",
+    "corpus",
     "data",
+    "dedup",
+    "fake_reddit",
+    "metrics",
     "miscellaneous",
     "package",
+    "progress",
+    "sync",
     "terminal",
+    "tracing",
 ]
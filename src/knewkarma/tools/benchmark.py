@@ -0,0 +1,280 @@
+import io
+import json
+import os
+import statistics
+import tempfile
+import time
+import tracemalloc
+from typing import Any, Callable, Literal, Optional, Dict, List, Tuple
+
+from karmakaze import Parse, Sanitise
+from rich import box
+from rich.console import Console
+from rich.status import Status
+from rich.table import Table
+
+from .corpus import Corpus
+from .data import create_dataframe, export_dataframe
+from .shared import console
+from ..api import JSON_DECODER
+
+__all__ = [
+    "BENCHMARK_KINDS",
+    "STAGES",
+    "results_table",
+    "run_benchmark",
+    "synthetic_pages",
+]
+
+BENCHMARK_KINDS = Literal["posts", "comments"]
+
+# Stages of the CPU path that a fetched listing goes through, in order.
+STAGES: List[str] = [
+    "decode",
+    "sanitise",
+    "parse",
+    "dataframe",
+    "export-csv",
+    "export-html",
+    "export-json",
+    "export-xml",
+    "render",
+]
+
+# Sources of the synthetic listings (see `Corpus.thing()`), by kind.
+SOURCES: Dict[str, str] = {"posts": "r:bench", "comments": "user:bench:comments"}
+
+
+def synthetic_pages(kind: BENCHMARK_KINDS, items: int, seed: int = 0) -> List[bytes]:
+    """
+    Builds listing pages of synthetic posts or comments, encoded as they would be received from Reddit.
+
+    :param kind: Whether to build "posts" or "comments".
+    :type kind: Literal["posts", "comments"]
+    :param items: Total number of items across the pages.
+    :type items: int
+    :param seed: Seed of the generated data. Defaults to 0.
+    :type seed: int
+    :return: The encoded listing pages, of up to 100 items each.
+    :rtype: List[bytes]
+    """
+
+    return [
+        json.dumps(page).encode("utf-8")
+        for page in Corpus(seed=seed).listing_pages(source=SOURCES[kind], items=items)
+    ]
+
+
+def _pipeline(
+    kind: BENCHMARK_KINDS, pages: List[bytes], time_format: str, directory: str
+) -> List[Tuple[str, Callable[[Any], Any]]]:
+    # Each stage takes the previous stage's output, the same way a fetched listing flows through
+    # `Api`, `core` and the CLI.
+    sanitise = Sanitise()
+    parse = Parse(time_format=time_format)
+    sanitiser: Callable = sanitise.posts if kind == "posts" else sanitise.comments
+    parser: Callable = parse.posts if kind == "posts" else parse.comments
+
+    def export(file_format: str) -> Callable:
+        def exporter(dataframe):
+            # Silences the "written to" notices, which would otherwise be mixed in with the results.
+            with console.capture():
+                export_dataframe(
+                    dataframe=dataframe,
+                    filename=kind,
+                    directory=directory,
+                    formats=[file_format],
+                )
+            return dataframe
+
+        return exporter
+
+    def render(dataframe):
+        Console(file=io.StringIO(), width=console.width).print(dataframe)
+        return dataframe
+
+    return [
+        ("decode", lambda _: [JSON_DECODER(page) for page in pages]),
+        (
+            "sanitise",
+            lambda decoded: [item for page in decoded for item in sanitiser(page)],
+        ),
+        ("parse", parser),
+        ("dataframe", create_dataframe),
+        *[
+            (f"export-{file_format}", export(file_format=file_format))
+            for file_format in ("csv", "html", "json", "xml")
+        ],
+        ("render", render),
+    ]
+
+
+def _run_pipeline(
+    kind: BENCHMARK_KINDS,
+    pages: List[bytes],
+    time_format: str,
+    trace_memory: bool = False,
+) -> Dict[str, float]:
+    measurements: Dict[str, float] = {}
+    with tempfile.TemporaryDirectory() as directory:
+        for file_format in ("csv", "html", "json", "xml"):
+            os.makedirs(os.path.join(directory, file_format))
+
+        data: Any = None
+        for stage, function in _pipeline(
+            kind=kind, pages=pages, time_format=time_format, directory=directory
+        ):
+            if trace_memory:
+                tracemalloc.reset_peak()
+                current_memory: int = tracemalloc.get_traced_memory()[0]
+                data = function(data)
+                measurements[stage] = (
+                    tracemalloc.get_traced_memory()[1] - current_memory
+                )
+            else:
+                started_at: float = time.perf_counter()
+                data = function(data)
+                measurements[stage] = time.perf_counter() - started_at
+
+    return measurements
+
+
+def run_benchmark(
+    kinds: List[BENCHMARK_KINDS],
+    items: int = 100000,
+    rounds: int = 1,
+    seed: int = 0,
+    time_format: str = "locale",
+    trace_memory: bool = True,
+    status: Optional[Status] = None,
+) -> List[Dict]:
+    """
+    Times every stage of the CPU path (decoding, sanitising, parsing, building a dataframe, exporting
+    it to each file format and rendering it in the console) on synthetic listings.
+
+    :param kinds: Kinds of listings to benchmark ("posts" and/or "comments").
+    :type kinds: List[Literal["posts", "comments"]]
+    :param items: Number of items in each listing. Defaults to 100000.
+    :type items: int
+    :param rounds: Number of timed runs per listing, of which the median is reported. Defaults to 1.
+    :type rounds: int
+    :param seed: Seed of the synthetic listings. Defaults to 0.
+    :type seed: int
+    :param time_format: Time format to parse timestamps to. Defaults to "locale".
+    :type time_format: str
+    :param trace_memory: Whether to measure each stage's peak allocated memory, in a separate run
+        (tracing allocations slows everything down). Defaults to True.
+    :type trace_memory: bool
+    :param status: An optional `rich.status.Status` object for displaying status messages. Defaults to None.
+    :type status: Optional[rich.status.Status]
+    :return: A result for each kind and stage, with its items, seconds, items per second, share of the
+        listing's total time and peak allocated memory in bytes (0 if it was not measured).
+    :rtype: List[Dict]
+    """
+
+    results: List[Dict] = []
+    for kind in kinds:
+        if status:
+            status.update(f"Generating {items} synthetic {kind}")
+        pages: List[bytes] = synthetic_pages(kind=kind, items=items, seed=seed)
+
+        runs: List[Dict[str, float]] = []
+        for round_number in range(1, rounds + 1):
+            if status:
+                status.update(f"Timing {kind} (round {round_number} of {rounds})")
+            runs.append(_run_pipeline(kind=kind, pages=pages, time_format=time_format))
+
+        peak_memory: Dict[str, float] = {}
+        if trace_memory:
+            if status:
+                status.update(f"Measuring memory allocated for {kind}")
+            tracemalloc.start()
+            try:
+                peak_memory = _run_pipeline(
+                    kind=kind, pages=pages, time_format=time_format, trace_memory=True
+                )
+            finally:
+                tracemalloc.stop()
+
+        seconds: Dict[str, float] = {
+            stage: statistics.median(run[stage] for run in runs) for stage in STAGES
+        }
+        total_seconds: float = sum(seconds.values())
+        for stage in STAGES:
+            results.append(
+                {
+                    "kind": kind,
+                    "stage": stage,
+                    "items": items,
+                    "seconds": seconds[stage],
+                    "items_per_second": (
+                        items / seconds[stage] if seconds[stage] else 0.0
+                    ),
+                    "share": seconds[stage] / total_seconds if total_seconds else 0.0,
+                    "peak_memory_bytes": int(peak_memory.get(stage, 0)),
+                }
+            )
+
+    return results
+
+
+def results_table(results: List[Dict], previous: Optional[List[Dict]] = None) -> Table:
+    """
+    Makes a table of benchmark results.
+
+    :param results: Results returned by `run_benchmark()`.
+    :type results: List[Dict]
+    :param previous: Optional results of an earlier benchmark, to compare items per second with.
+        Defaults to None.
+    :type previous: Optional[List[Dict]]
+    :return: A `rich.table.Table` with a row for each kind and stage.
+    :rtype: rich.table.Table
+    """
+
+    baselines: Dict[Tuple[str, str], Dict] = {
+        (result["kind"], result["stage"]): result for result in previous or []
+    }
+
+    table = Table(title="CPU path", box=box.ROUNDED)
+    for column in (
+        "Kind",
+        "Stage",
+        "Items",
+        "Seconds",
+        "Items/s",
+        "Share",
+        "Peak memory",
+    ):
+        table.add_column(
+            column, justify="left" if column in ("Kind", "Stage") else "right"
+        )
+    if baselines:
+        table.add_column("vs. previous", justify="right")
+
+    for result in results:
+        row: List[str] = [
+            result["kind"],
+            result["stage"],
+            str(result["items"]),
+            f"{result['seconds']:.3f}",
+            f"{result['items_per_second']:.0f}",
+            f"{result['share']:.1%}",
+            (
+                f"{result['peak_memory_bytes'] / 2**20:.1f} MiB"
+                if result["peak_memory_bytes"]
+                else "-"
+            ),
+        ]
+        if baselines:
+            baseline: Optional[Dict] = baselines.get((result["kind"], result["stage"]))
+            row.append(
+                f"{result['items_per_second'] / baseline['items_per_second'] - 1:+.0%}"
+                if baseline and baseline["items_per_second"]
+                else "-"
+            )
+        table.add_row(*row)
+
+    return table
+
+
+# -------------------------------- END ----------------------------------------- #
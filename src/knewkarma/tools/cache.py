@@ -0,0 +1,516 @@
+import hashlib
+import json
+import os
+import sqlite3
+import time
+from collections import OrderedDict
+from types import SimpleNamespace
+from typing import Optional, Dict, Tuple, Union, List
+
+__all__ = [
+    "EntityCache",
+    "ResponseCache",
+    "ENTITY_CACHE_TTLS",
+    "RESPONSE_CACHE_TTLS",
+]
+
+# Number of seconds a cached entity stays valid, per kind of entity (see `Api.get_entity`).
+ENTITY_CACHE_TTLS: Dict[str, float] = {
+    "post": 60,
+    "subreddit": 10 * 60,
+    "user": 10 * 60,
+    "wikipage": 30 * 60,
+}
+
+# Number of seconds a cached response stays fresh, per kind of endpoint (see `Api.endpoint_kind`).
+RESPONSE_CACHE_TTLS: Dict[str, float] = {
+    "about": 60 * 60,
+    "comments": 5 * 60,
+    "listing": 5 * 60,
+    "search": 10 * 60,
+    "status": 60,
+    "wiki": 24 * 60 * 60,
+    "other": 5 * 60,
+}
+
+
+class EntityCache:
+    """
+    An in-memory, size-bounded cache of sanitised entities (users, subreddits, posts and wiki pages),
+    where each kind of entity expires after its own time-to-live.
+
+    Once `max_entries` is reached, the least recently used entry is evicted. Hits and misses are counted,
+    so the cache's size and time-to-lives can be tuned for a workload.
+    """
+
+    def __init__(
+        self, max_entries: int = 1024, ttls: Optional[Dict[str, float]] = None
+    ):
+        """
+        Initialises an `EntityCache` instance.
+
+        :param max_entries: Maximum number of entities to keep. Defaults to 1024.
+        :type max_entries: int
+        :param ttls: Number of seconds an entity stays valid, per kind of entity.
+            Overrides the values in `ENTITY_CACHE_TTLS`. Defaults to None.
+        :type ttls: Optional[Dict[str, float]]
+        """
+
+        self._max_entries = max_entries
+        self._ttls: Dict[str, float] = {**ENTITY_CACHE_TTLS, **(ttls or {})}
+        self._entries: OrderedDict[Tuple, Tuple[float, Union[Dict, List]]] = (
+            OrderedDict()
+        )
+        self.hits: int = 0
+        self.misses: int = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def key(kind: str, **identity: str) -> Tuple:
+        """
+        Makes a cache key from an entity's kind and its identifying attributes.
+
+        :param kind: Kind of the entity.
+        :type kind: str
+        :param identity: Attributes that identify the entity (e.g. `username`, or `subreddit` and `id`).
+        :return: A hashable key. Names are lowercased, since Reddit treats them case-insensitively.
+        :rtype: Tuple
+        """
+
+        return kind, tuple(
+            sorted(
+                (name, str(value).lower())
+                for name, value in identity.items()
+                if value is not None
+            )
+        )
+
+    def get(self, kind: str, **identity: str) -> Optional[Union[Dict, List]]:
+        """
+        Gets a cached entity.
+
+        :param kind: Kind of the entity.
+        :type kind: str
+        :param identity: Attributes that identify the entity.
+        :return: The cached entity, or None if it is not cached or has expired.
+        :rtype: Optional[Union[Dict, List]]
+        """
+
+        key: Tuple = self.key(kind, **identity)
+        entry = self._entries.get(key)
+
+        if entry is None or entry[0] <= time.monotonic():
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+
+        return entry[1]
+
+    def set(self, kind: str, entity: Union[Dict, List], **identity: str):
+        """
+        Caches an entity, evicting the least recently used entity if the cache is full.
+
+        :param kind: Kind of the entity.
+        :type kind: str
+        :param entity: The entity to cache.
+        :type entity: Union[Dict, List]
+        :param identity: Attributes that identify the entity.
+        """
+
+        ttl: float = self._ttls.get(kind, 0)
+        if ttl <= 0 or self._max_entries <= 0:
+            return
+
+        key: Tuple = self.key(kind, **identity)
+        self._entries[key] = (time.monotonic() + ttl, entity)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, kind: Optional[str] = None, **identity: str) -> int:
+        """
+        Removes cached entities.
+
+        :param kind: Kind of the entities to remove. Removes every entity if None. Defaults to None.
+        :type kind: Optional[str]
+        :param identity: Attributes that identify a single entity to remove. If none are given,
+            every entity of the given `kind` is removed.
+        :return: Number of removed entities.
+        :rtype: int
+        """
+
+        if kind and identity:
+            return 1 if self._entries.pop(self.key(kind, **identity), None) else 0
+
+        keys: List[Tuple] = [
+            key for key in self._entries if kind is None or key[0] == kind
+        ]
+        for key in keys:
+            del self._entries[key]
+
+        return len(keys)
+
+    def stats(self) -> Dict[str, Union[int, float]]:
+        """
+        Gets the cache's usage statistics.
+
+        :return: A dictionary with the number of `entries`, `hits` and `misses`, and the `hit_rate`.
+        :rtype: Dict[str, Union[int, float]]
+        """
+
+        lookups: int = self.hits + self.misses
+
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+
+class ResponseCache:
+    """
+    A persistent, size-bounded response cache backed by a SQLite database.
+
+    Responses are keyed by URL and request parameters. Each entry keeps the response's `ETag` and
+    `Last-Modified` validators, so that stale entries can be revalidated with a conditional request
+    instead of being downloaded again. Once the cache grows past `max_size` bytes, the least recently
+    used entries are evicted.
+
+    Lookups only read from the database: access times and statistics are kept in memory, and written
+    in batches (of up to `flush_every` lookups), before the cache is changed, and when it is closed.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        max_size: int = 256 * 1024 * 1024,
+        ttls: Optional[Dict[str, float]] = None,
+        flush_every: int = 256,
+    ):
+        """
+        Initialises a `ResponseCache` instance, creating the database if it does not exist.
+
+        :param path: Path to the SQLite database file.
+        :type path: str
+        :param max_size: Maximum total size (in bytes) of the cached response bodies. Defaults to 256 MiB.
+        :type max_size: int
+        :param ttls: Number of seconds a response stays fresh, per kind of endpoint.
+            Overrides the values in `RESPONSE_CACHE_TTLS`. Defaults to None.
+        :type ttls: Optional[Dict[str, float]]
+        :param flush_every: Number of lookups after which their access times and statistics are written
+            to the database. Defaults to 256.
+        :type flush_every: int
+        """
+
+        directory: str = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._path = path
+        self._max_size = max_size
+        self._ttls: Dict[str, float] = {**RESPONSE_CACHE_TTLS, **(ttls or {})}
+        self._flush_every = max(flush_every, 1)
+        self._closed: bool = False
+
+        # Access times and counter increments that have not been written to the database yet.
+        self._pending_accesses: Dict[str, float] = {}
+        self._pending_counters: Dict[str, int] = {}
+        self._pending_lookups: int = 0
+
+        self._connection = sqlite3.connect(path)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.executescript("""
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                url TEXT NOT NULL,
+                kind TEXT NOT NULL,
+                body BLOB NOT NULL,
+                etag TEXT,
+                last_modified TEXT,
+                size INTEGER NOT NULL,
+                stored_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS responses_accessed_at ON responses (accessed_at);
+            CREATE TABLE IF NOT EXISTS counters (
+                name TEXT PRIMARY KEY,
+                value INTEGER NOT NULL
+            );
+            """)
+        self._connection.commit()
+
+        # Running total of the cached bodies' size, so that storing a response does not sum every entry.
+        (self._size,) = self._connection.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()
+
+    @property
+    def path(self) -> str:
+        """Path to the SQLite database file."""
+
+        return self._path
+
+    @staticmethod
+    def key(url: str, params: Optional[Dict] = None) -> str:
+        """
+        Makes a cache key from a URL and its request parameters.
+
+        :param url: The requested URL.
+        :type url: str
+        :param params: Request parameters. Defaults to None.
+        :type params: Optional[Dict]
+        :return: A hex digest identifying the request.
+        :rtype: str
+        """
+
+        request = json.dumps([url, params or {}], sort_keys=True, default=str)
+        return hashlib.sha256(request.encode("utf-8")).hexdigest()
+
+    def lookup(
+        self, url: str, params: Optional[Dict], kind: str
+    ) -> Optional[SimpleNamespace]:
+        """
+        Looks up a cached response.
+
+        :param url: The requested URL.
+        :type url: str
+        :param params: Request parameters.
+        :type params: Optional[Dict]
+        :param kind: Kind of endpoint the URL belongs to, used to pick the entry's time-to-live.
+        :type kind: str
+        :return: A `SimpleNamespace` with the entry's `body`, `etag`, `last_modified` and whether it
+            is still `fresh`, or None if the response is not cached.
+        :rtype: Optional[SimpleNamespace]
+        """
+
+        key: str = self.key(url=url, params=params)
+        row = self._connection.execute(
+            "SELECT body, etag, last_modified, stored_at FROM responses WHERE key = ?",
+            (key,),
+        ).fetchone()
+
+        if row is None:
+            self._increment("misses")
+            return None
+
+        body, etag, last_modified, stored_at = row
+        now: float = time.time()
+        fresh: bool = now - stored_at < self._ttl(kind=kind)
+
+        self._pending_accesses[key] = now
+        self._increment("hits" if fresh else "stale")
+
+        return SimpleNamespace(
+            body=body, etag=etag, last_modified=last_modified, fresh=fresh
+        )
+
+    def store(
+        self,
+        url: str,
+        params: Optional[Dict],
+        kind: str,
+        body: bytes,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ):
+        """
+        Stores a response, evicting the least recently used entries if the cache is full.
+
+        :param url: The requested URL.
+        :type url: str
+        :param params: Request parameters.
+        :type params: Optional[Dict]
+        :param kind: Kind of endpoint the URL belongs to.
+        :type kind: str
+        :param body: The raw response body.
+        :type body: bytes
+        :param etag: The response's `ETag` header. Defaults to None.
+        :type etag: Optional[str]
+        :param last_modified: The response's `Last-Modified` header. Defaults to None.
+        :type last_modified: Optional[str]
+        """
+
+        self._flush()
+
+        key: str = self.key(url=url, params=params)
+        replaced = self._connection.execute(
+            "SELECT size FROM responses WHERE key = ?", (key,)
+        ).fetchone()
+
+        now: float = time.time()
+        self._connection.execute(
+            "INSERT OR REPLACE INTO responses "
+            "(key, url, kind, body, etag, last_modified, size, stored_at, accessed_at) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                key,
+                url,
+                kind,
+                body,
+                etag,
+                last_modified,
+                len(body),
+                now,
+                now,
+            ),
+        )
+        self._size += len(body) - (replaced[0] if replaced else 0)
+        self._evict()
+        self._connection.commit()
+
+    def refresh(self, url: str, params: Optional[Dict]):
+        """
+        Marks a cached response as fresh again, after the server confirmed (304 Not Modified) it is unchanged.
+
+        :param url: The requested URL.
+        :type url: str
+        :param params: Request parameters.
+        :type params: Optional[Dict]
+        """
+
+        key: str = self.key(url=url, params=params)
+        now: float = time.time()
+        self._pending_accesses.pop(key, None)
+        self._increment("revalidated")
+        self._flush()
+        self._connection.execute(
+            "UPDATE responses SET stored_at = ?, accessed_at = ? WHERE key = ?",
+            (now, now, key),
+        )
+        self._connection.commit()
+
+    def prune(self, expired_only: bool = True) -> int:
+        """
+        Removes cache entries.
+
+        :param expired_only: Whether to only remove entries that are past their time-to-live. Defaults to True.
+        :type expired_only: bool
+        :return: Number of removed entries.
+        :rtype: int
+        """
+
+        self._flush()
+
+        if expired_only:
+            now: float = time.time()
+            expired = [
+                (key, size)
+                for key, kind, size, stored_at in self._connection.execute(
+                    "SELECT key, kind, size, stored_at FROM responses"
+                )
+                if now - stored_at >= self._ttl(kind=kind)
+            ]
+            self._connection.executemany(
+                "DELETE FROM responses WHERE key = ?", [(key,) for key, _ in expired]
+            )
+            self._size -= sum(size for _, size in expired)
+            removed: int = len(expired)
+        else:
+            removed = self._connection.execute("DELETE FROM responses").rowcount
+            self._connection.execute("DELETE FROM counters")
+            self._size = 0
+
+        self._connection.commit()
+        self._connection.execute("VACUUM")
+
+        return removed
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Gets the cache's usage statistics.
+
+        :return: A dictionary with the number of `entries`, their total `size` (in bytes), and the
+            number of `hits`, `stale` lookups, `revalidated` entries and `misses` so far.
+        :rtype: Dict[str, int]
+        """
+
+        self._flush()
+        (entries,) = self._connection.execute(
+            "SELECT COUNT(*) FROM responses"
+        ).fetchone()
+        counters: Dict[str, int] = dict(
+            self._connection.execute("SELECT name, value FROM counters").fetchall()
+        )
+
+        return {
+            "entries": entries,
+            "size": self._size,
+            "hits": counters.get("hits", 0),
+            "stale": counters.get("stale", 0),
+            "revalidated": counters.get("revalidated", 0),
+            "misses": counters.get("misses", 0),
+        }
+
+    def close(self):
+        """Writes pending access times and statistics, and closes the database."""
+
+        if self._closed:
+            return
+
+        self._flush()
+        self._connection.close()
+        self._closed = True
+
+    def _ttl(self, kind: str) -> float:
+        return self._ttls.get(kind, self._ttls.get("other", 0))
+
+    def _increment(self, counter: str):
+        self._pending_counters[counter] = self._pending_counters.get(counter, 0) + 1
+        self._pending_lookups += 1
+
+        if self._pending_lookups >= self._flush_every:
+            self._flush()
+
+    def _flush(self):
+        """Writes the pending access times and counter increments in a single transaction."""
+
+        if not self._pending_lookups:
+            return
+
+        self._connection.executemany(
+            "UPDATE responses SET accessed_at = ? WHERE key = ?",
+            [(accessed_at, key) for key, accessed_at in self._pending_accesses.items()],
+        )
+        self._connection.executemany(
+            "INSERT INTO counters (name, value) VALUES (?, ?) "
+            "ON CONFLICT(name) DO UPDATE SET value = value + excluded.value",
+            list(self._pending_counters.items()),
+        )
+        self._connection.commit()
+
+        self._pending_accesses.clear()
+        self._pending_counters.clear()
+        self._pending_lookups = 0
+
+    def _evict(self):
+        if self._size <= self._max_size:
+            return
+
+        size: int = self._size
+
+        # Walk the entries from least to most recently used until enough space has been freed.
+        evicted_keys = []
+        for key, entry_size in self._connection.execute(
+            "SELECT key, size FROM responses ORDER BY accessed_at ASC"
+        ).fetchall():
+            if size <= self._max_size:
+                break
+            evicted_keys.append((key,))
+            size -= entry_size
+
+        self._connection.executemany(
+            "DELETE FROM responses WHERE key = ?", evicted_keys
+        )
+        self._size = size
+
+
+# -------------------------------- END ----------------------------------------- #
@@ -0,0 +1,196 @@
+import asyncio
+import gzip
+import json
+import time
+import zlib
+from collections import deque
+from typing import Deque, Literal, Optional, Dict, Tuple
+
+__all__ = ["Cassette"]
+
+# Version of the cassette file format, written in its header line.
+CASSETTE_VERSION: int = 1
+
+
+class Cassette:
+    """
+    A gzip-compressed JSON-lines file of the responses to every request sent with `Api.send_request()`.
+
+    In "record" mode, each successful response is appended to the file along with its endpoint, parameters
+    and how long it took. In "replay" mode, requests are answered from the file instead, without touching
+    the network, so that a crawl can be reprocessed, benchmarked or regression-tested exactly as it was
+    captured. A request that was sent more than once gets its recorded responses in order, and the last
+    one after that.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        mode: Literal["record", "replay"] = "replay",
+        latency: float = 0.0,
+        recorded_latency: bool = False,
+    ):
+        """
+        Initialises a `Cassette` instance, opening its file for recording or loading it for replaying.
+
+        :param path: Path of the cassette file.
+        :type path: str
+        :param mode: Whether to "record" responses to the file (overwriting it), or "replay" them from it.
+            Defaults to "replay".
+        :type mode: Literal["record", "replay"]
+        :param latency: Seconds to wait before each replayed response. Defaults to 0.0.
+        :type latency: float
+        :param recorded_latency: Whether to wait as long before each replayed response as the original
+            request took, on top of `latency`. Defaults to False.
+        :type recorded_latency: bool
+        :raise ValueError: If `mode` is neither "record" nor "replay".
+        """
+
+        if mode not in ("record", "replay"):
+            raise ValueError(f"Unknown cassette mode: {mode}")
+
+        self._path = path
+        self._mode = mode
+        self.latency = latency
+        self.recorded_latency = recorded_latency
+        self._interactions: Dict[str, Deque[Tuple[str, float]]] = {}
+        self._count: int = 0
+        self._file = None
+
+        if mode == "record":
+            self._file = gzip.open(path, "wt", encoding="utf-8")
+            self._file.write(
+                json.dumps({"version": CASSETTE_VERSION, "created_at": time.time()})
+                + "\n"
+            )
+        else:
+            self._load()
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def mode(self) -> Literal["record", "replay"]:
+        """Whether the cassette is recording or replaying responses."""
+
+        return self._mode
+
+    @property
+    def path(self) -> str:
+        """Path of the cassette file."""
+
+        return self._path
+
+    @staticmethod
+    def key(endpoint: str, params: Optional[Dict] = None) -> str:
+        """
+        Makes the key that a request's responses are recorded under.
+
+        :param endpoint: The requested endpoint.
+        :type endpoint: str
+        :param params: Request parameters. Defaults to None.
+        :type params: Optional[Dict]
+        :return: The request's key.
+        :rtype: str
+        """
+
+        return json.dumps([endpoint, params or {}], sort_keys=True, default=str)
+
+    def record(
+        self,
+        endpoint: str,
+        params: Optional[Dict],
+        body: bytes,
+        elapsed: float = 0.0,
+    ):
+        """
+        Appends a response to the cassette.
+
+        :param endpoint: The requested endpoint.
+        :type endpoint: str
+        :param params: Request parameters.
+        :type params: Optional[Dict]
+        :param body: The response body.
+        :type body: bytes
+        :param elapsed: Seconds that the request took. Defaults to 0.0.
+        :type elapsed: float
+        :raise RuntimeError: If the cassette is not recording.
+        """
+
+        if self._file is None:
+            raise RuntimeError("The cassette is not recording.")
+
+        self._file.write(
+            json.dumps(
+                {
+                    "endpoint": endpoint,
+                    "params": params or {},
+                    "elapsed": round(elapsed, 6),
+                    "body": body.decode("utf-8"),
+                },
+                default=str,
+            )
+            + "\n"
+        )
+        self._count += 1
+
+    async def replay(self, endpoint: str, params: Optional[Dict] = None) -> bytes:
+        """
+        Asynchronously gets the recorded response to a request, waiting for the simulated latency first.
+
+        :param endpoint: The requested endpoint.
+        :type endpoint: str
+        :param params: Request parameters. Defaults to None.
+        :type params: Optional[Dict]
+        :return: The recorded response body.
+        :rtype: bytes
+        :raise LookupError: If no response to the request was recorded.
+        """
+
+        responses = self._interactions.get(self.key(endpoint=endpoint, params=params))
+        if not responses:
+            raise LookupError(
+                f"No response to {endpoint} (params: {params or {}}) was recorded in {self._path}"
+            )
+
+        body, elapsed = responses.popleft() if len(responses) > 1 else responses[0]
+        delay: float = self.latency + (elapsed if self.recorded_latency else 0.0)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        return body.encode("utf-8")
+
+    def close(self):
+        """
+        Closes the cassette file, if it is recording.
+        """
+
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _load(self):
+        with gzip.open(self._path, "rt", encoding="utf-8") as cassette_file:
+            try:
+                header: Dict = json.loads(cassette_file.readline())
+                if header.get("version") != CASSETTE_VERSION:
+                    raise ValueError(
+                        f"Unsupported cassette version: {header.get('version')}"
+                    )
+
+                for line in cassette_file:
+                    interaction: Dict = json.loads(line)
+                    self._interactions.setdefault(
+                        self.key(
+                            endpoint=interaction["endpoint"],
+                            params=interaction["params"],
+                        ),
+                        deque(),
+                    ).append((interaction["body"], interaction["elapsed"]))
+                    self._count += 1
+            except (EOFError, zlib.error, json.JSONDecodeError):
+                # A recording that was cut short still replays every response that was fully written.
+                pass
+
+
+# -------------------------------- END ----------------------------------------- #
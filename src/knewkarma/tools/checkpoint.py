@@ -0,0 +1,203 @@
+import hashlib
+import json
+import os
+import tempfile
+import time
+from types import SimpleNamespace
+from typing import Optional, Dict, List
+
+__all__ = ["CheckpointStore"]
+
+
+class CheckpointStore:
+    """
+    A directory of pagination checkpoints, so that long crawls can be resumed where they stopped.
+
+    Each paginated request (identified by its endpoint, parameters and limit) gets two files: a small
+    JSON file holding the `after` cursor, the `count` sent with it and the number of items persisted,
+    and a JSON-lines file that items are appended to after every page. The JSON file is replaced
+    atomically, and only ever counts items that were fully written, so a crawl that dies mid-page
+    resumes from the last complete page.
+    """
+
+    def __init__(self, directory: str, resume: bool = False):
+        """
+        Initialises a `CheckpointStore` instance, creating its directory if it does not exist.
+
+        :param directory: Directory to keep checkpoint files in.
+        :type directory: str
+        :param resume: Whether paginated requests continue from their last checkpoint. If False,
+            they start afresh and overwrite it. Defaults to False.
+        :type resume: bool
+        """
+
+        os.makedirs(directory, exist_ok=True)
+
+        self._directory = directory
+        self.resume = resume
+
+    @property
+    def directory(self) -> str:
+        """Directory that checkpoint files are kept in."""
+
+        return self._directory
+
+    @staticmethod
+    def key(endpoint: str, params: Optional[Dict], limit: int) -> str:
+        """
+        Makes a checkpoint key from a paginated request.
+
+        :param endpoint: The requested endpoint.
+        :type endpoint: str
+        :param params: Request parameters of the first page. Defaults to None.
+        :type params: Optional[Dict]
+        :param limit: Maximum number of items the request paginates to.
+        :type limit: int
+        :return: A hex digest identifying the paginated request.
+        :rtype: str
+        """
+
+        request = json.dumps(
+            [endpoint, params or {}, limit], sort_keys=True, default=str
+        )
+        return hashlib.sha256(request.encode("utf-8")).hexdigest()[:32]
+
+    def load(self, key: str) -> Optional[SimpleNamespace]:
+        """
+        Loads the checkpoint of a paginated request.
+
+        :param key: Key of the paginated request (see `key()`).
+        :type key: str
+        :return: A `SimpleNamespace` with the `after` cursor, the `count` of items fetched before it,
+            and the persisted `items`, or None if there is no checkpoint.
+        :rtype: Optional[SimpleNamespace]
+        """
+
+        try:
+            with open(self._meta_path(key=key), encoding="utf-8") as meta_file:
+                meta: Dict = json.load(meta_file)
+
+            items: List[Dict] = []
+            with open(self._items_path(key=key), "r+b") as items_file:
+                while len(items) < meta["items"]:
+                    line: bytes = items_file.readline()
+                    if not line:
+                        break
+                    items.append(json.loads(line))
+
+                # Lines past the recorded number of items belong to a page that was not completed,
+                # so drop them before the next page is appended.
+                items_file.truncate(items_file.tell())
+        except (OSError, ValueError, KeyError):
+            return None
+
+        if len(items) < meta["items"]:
+            return None
+
+        return SimpleNamespace(after=meta["after"], count=meta["count"], items=items)
+
+    def save(
+        self,
+        key: str,
+        items: List[Dict],
+        after: str,
+        count: int,
+        endpoint: Optional[str] = None,
+    ):
+        """
+        Records a page of a paginated request, along with the cursor of the page that follows it.
+
+        :param key: Key of the paginated request (see `key()`).
+        :type key: str
+        :param items: Items of the page to persist.
+        :type items: List[Dict]
+        :param after: The `after` cursor of the next page.
+        :type after: str
+        :param count: Number of items fetched so far, which is sent along with the cursor.
+        :type count: int
+        :param endpoint: The requested endpoint, kept for reference. Defaults to None.
+        :type endpoint: Optional[str]
+        """
+
+        with open(self._items_path(key=key), "a", encoding="utf-8") as items_file:
+            items_file.writelines(
+                f"{json.dumps(item, separators=(',', ':'), default=str)}\n"
+                for item in items
+            )
+            items_file.flush()
+            os.fsync(items_file.fileno())
+
+        previous = self._read_meta(key=key)
+        self._write_meta(
+            key=key,
+            meta={
+                "endpoint": endpoint,
+                "after": after,
+                "count": count,
+                "items": (previous.get("items", 0) if previous else 0) + len(items),
+                "updated_at": time.time(),
+            },
+        )
+
+    def discard(self, key: str):
+        """
+        Removes the checkpoint of a paginated request, e.g. once it has completed.
+
+        :param key: Key of the paginated request (see `key()`).
+        :type key: str
+        """
+
+        for path in (self._meta_path(key=key), self._items_path(key=key)):
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+    def clear(self) -> int:
+        """
+        Removes every checkpoint in the store.
+
+        :return: Number of checkpoints removed.
+        :rtype: int
+        """
+
+        keys = {
+            filename.split(".", 1)[0]
+            for filename in os.listdir(self._directory)
+            if filename.endswith((".json", ".jsonl"))
+        }
+        for key in keys:
+            self.discard(key=key)
+
+        return len(keys)
+
+    def _meta_path(self, key: str) -> str:
+        return os.path.join(self._directory, f"{key}.json")
+
+    def _items_path(self, key: str) -> str:
+        return os.path.join(self._directory, f"{key}.jsonl")
+
+    def _read_meta(self, key: str) -> Optional[Dict]:
+        try:
+            with open(self._meta_path(key=key), encoding="utf-8") as meta_file:
+                return json.load(meta_file)
+        except (OSError, ValueError):
+            return None
+
+    def _write_meta(self, key: str, meta: Dict):
+        # Write to a temporary file first, so that a crash never leaves a partially written checkpoint.
+        descriptor, temporary_path = tempfile.mkstemp(
+            dir=self._directory, suffix=".tmp"
+        )
+        try:
+            with os.fdopen(descriptor, "w", encoding="utf-8") as meta_file:
+                json.dump(meta, meta_file)
+                meta_file.flush()
+                os.fsync(meta_file.fileno())
+            os.replace(temporary_path, self._meta_path(key=key))
+        except BaseException:
+            os.remove(temporary_path)
+            raise
+
+
+# -------------------------------- END ----------------------------------------- #
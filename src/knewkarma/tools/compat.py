@@ -0,0 +1,78 @@
+import functools
+import inspect
+import warnings
+from typing import Any, Callable, List, Optional, Type
+
+from aiohttp import ClientSession
+
+__all__ = ["session_first", "default_instance_method"]
+
+
+def session_first(method: Callable) -> Callable:
+    """
+    Keeps calls to a method that pass an `aiohttp.ClientSession` as the first positional argument working.
+
+    `session` used to be the first (and a required) parameter of the public `Api` and `core` methods. It is
+    now optional, since each `Api` owns a pooled session, and follows the method's required parameters.
+    Positional arguments of a call that starts with a session are matched against the old order of the
+    parameters, and a `DeprecationWarning` is issued.
+
+    :param method: The method to decorate. It must have a `session` parameter.
+    :type method: Callable
+    :return: The decorated method.
+    :rtype: Callable
+    """
+
+    parameters: List[str] = [
+        name for name in inspect.signature(method).parameters if name != "self"
+    ]
+    legacy_order: List[str] = ["session"] + [
+        name for name in parameters if name != "session"
+    ]
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if args and isinstance(args[0], ClientSession):
+            warnings.warn(
+                f"Passing `session` as the first positional argument of `{method.__qualname__}` "
+                "is deprecated, pass it as a keyword argument (`session=...`) instead.",
+                DeprecationWarning,
+                stacklevel=2,
+            )
+            for name, value in zip(legacy_order, args):
+                if name in kwargs:
+                    raise TypeError(
+                        f"{method.__qualname__}() got multiple values for argument '{name}'"
+                    )
+                kwargs[name] = value
+            args = ()
+
+        return method(self, *args, **kwargs)
+
+    return wrapper
+
+
+class default_instance_method:
+    """
+    A method that can also be called on its class, as it could when it was a static method,
+    in which case it is bound to an instance made with the class's default arguments.
+    """
+
+    def __init__(self, method: Callable):
+        self._method = method
+        functools.update_wrapper(self, method)
+
+    def __get__(self, instance: Optional[Any], owner: Type) -> Callable:
+        if instance is None:
+            warnings.warn(
+                f"Calling `{self._method.__qualname__}` on the class is deprecated, "
+                "call it on an instance instead.",
+                DeprecationWarning,
+                stacklevel=2,
+            )
+            instance = owner()
+
+        return self._method.__get__(instance, owner)
+
+
+# -------------------------------- END ----------------------------------------- #
@@ -0,0 +1,831 @@
+import functools
+import itertools
+import random
+import string
+import zlib
+from typing import Callable, Iterator, Optional, Dict, List, Tuple, Union
+
+__all__ = ["Corpus", "CORPUS_EPOCH", "INDEX_BITS"]
+
+# Time that generated items are created before, unless another is given, so that a corpus is the same on every run.
+CORPUS_EPOCH: float = 1700000000.0
+# Bits of a generated ID that hold the item's index within its source (up to 16,777,216 items per source).
+INDEX_BITS: int = 24
+# Most items Reddit returns per page, whatever `limit` is asked for.
+PAGE_SIZE: int = 100
+# Number of words that generated text is cut from (longer than any text).
+WORD_RUN_LENGTH: int = 1 << 17
+# Deepest level of comment replies that Reddit nests.
+MAX_DEPTH: int = 9
+
+WORDS: tuple[str, ...] = (
+    "reddit",
+    "python",
+    "science",
+    "question",
+    "today",
+    "finally",
+    "anyone",
+    "think",
+    "found",
+    "weird",
+    "people",
+    "world",
+    "data",
+    "new",
+    "help",
+    "best",
+    "update",
+    "thread",
+    "discussion",
+    "project",
+)
+
+
+class Corpus:
+    """
+    A seedable, deterministic generator of Reddit things (`t1` comments, `t3` posts, `t5` subreddits and
+    `t2` users), shaped exactly like Reddit's listing and comment JSON.
+
+    Every item is generated from its source (e.g. "r:python" for r/python's posts, or "user:spez:comments"
+    for u/spez's comments) and its index in that source, so any item, page or comment tree can be made on
+    its own, in any order, and is the same every time it is made with the same seed. Authors, subreddits,
+    scores and text lengths follow long-tailed distributions, words follow Zipf's law, and comment trees
+    have nested replies of varying depth, with "more" stubs for the comments that do not fit on a page.
+
+    Items are made as plain dictionaries, in memory, so they can be served (see `FakeReddit`), encoded or
+    handed to the sanitiser directly.
+    """
+
+    def __init__(
+        self,
+        seed: int = 0,
+        comments_per_post: int = 50,
+        item_interval: float = 300.0,
+        created_at: float = CORPUS_EPOCH,
+        vocabulary_size: int = 5000,
+    ):
+        """
+        Initialises a `Corpus` instance.
+
+        :param seed: Seed that all generated data is derived from. Defaults to 0.
+        :type seed: int
+        :param comments_per_post: Number of comments on each post. Defaults to 50.
+        :type comments_per_post: int
+        :param item_interval: Seconds between the creation times of consecutive items in a source. Defaults to 300.0.
+        :type item_interval: float
+        :param created_at: Unix time that the first item of each source is created just before. Defaults to
+            `CORPUS_EPOCH`.
+        :type created_at: float
+        :param vocabulary_size: Number of distinct words in generated text. Defaults to 5000.
+        :type vocabulary_size: int
+        """
+
+        self.seed = seed
+        self.comments_per_post = comments_per_post
+        self.item_interval = item_interval
+        self.created_at = created_at
+
+        rng = self.rng("vocabulary")
+        vocabulary: List[str] = list(WORDS) + [
+            "".join(rng.choices(string.ascii_lowercase, k=rng.randint(2, 10)))
+            for _ in range(max(vocabulary_size - len(WORDS), 0))
+        ]
+        # Text is cut from one long run of words, in which the n-th most common word turns up 1/n as
+        # often as the most common one, which is much faster than drawing every word of every text.
+        self._words: List[str] = rng.choices(
+            vocabulary,
+            cum_weights=list(
+                itertools.accumulate(1 / rank for rank in range(1, len(vocabulary) + 1))
+            ),
+            k=WORD_RUN_LENGTH,
+        )
+        # Authors and subreddits come up again and again, so their IDs are only made once.
+        self._name_id: Callable[[str], str] = functools.lru_cache(maxsize=65536)(
+            lambda name: self.id(name, 0)
+        )
+
+    def listing_pages(
+        self, source: str, items: int, page_size: int = PAGE_SIZE
+    ) -> Iterator[Dict]:
+        """
+        Generates the pages of a listing, newest items first, one page at a time.
+
+        :param source: Source of the listing's items, e.g. "r:python" (posts), "user:spez:comments" (comments),
+            "subreddits:new" (subreddits) or "users:popular" (users).
+        :type source: str
+        :param items: Number of items in the listing.
+        :type items: int
+        :param page_size: Items per page. Defaults to 100.
+        :type page_size: int
+        :return: An iterator of listing pages.
+        :rtype: Iterator[Dict]
+        """
+
+        for start in range(0, items, page_size):
+            children: List[Dict] = [
+                self.thing(source=source, index=index)
+                for index in range(start, min(start + page_size, items))
+            ]
+            yield self.listing(
+                children=children,
+                after=(
+                    self.fullname(children[-1]) if start + page_size < items else None
+                ),
+            )
+
+    def thread_pages(
+        self, post_id: str, limit: int = 200
+    ) -> Iterator[Union[List[Dict], Dict]]:
+        """
+        Generates a post's comments page, followed by the `/api/morechildren` responses for every comment
+        that was left out of it, like a crawler that expands all of a thread's "more" stubs.
+
+        :param post_id: ID of the post.
+        :type post_id: str
+        :param limit: Most comments shown on the comments page. Defaults to 200.
+        :type limit: int
+        :return: An iterator of the comments page and the morechildren responses.
+        :rtype: Iterator[Union[List[Dict], Dict]]
+        """
+
+        post: Dict = self.post_by_id(post_id=post_id)
+        comments, children = self.comment_tree(post=post["data"])
+        page: List[Dict] = self.comments_page(
+            post=post, comments=comments, children=children, limit=limit
+        )
+        yield page
+
+        collapsed: List[str] = [
+            comment_id
+            for child in page[1]["data"]["children"]
+            if child["kind"] == "more"
+            for comment_id in child["data"]["children"]
+        ]
+        for start in range(0, len(collapsed), PAGE_SIZE):
+            yield self.more_children(
+                comments=comments, children=collapsed[start : start + PAGE_SIZE]
+            )
+
+    @staticmethod
+    def listing(children: List[Dict], after: Optional[str] = None) -> Dict:
+        """
+        Wraps things in a listing page.
+
+        :param children: Things on the page.
+        :type children: List[Dict]
+        :param after: Fullname of the last thing, if there are more pages. Defaults to None.
+        :type after: Optional[str]
+        :return: The listing page.
+        :rtype: Dict
+        """
+
+        return {
+            "kind": "Listing",
+            "data": {
+                "after": after,
+                "before": None,
+                "dist": len(children),
+                "modhash": "",
+                "geo_filter": "",
+                "children": children,
+            },
+        }
+
+    def thing(self, source: str, index: int) -> Dict:
+        """
+        Generates the item at an index of a source.
+
+        :param source: Source of the item (see `listing_pages()`).
+        :type source: str
+        :param index: Index of the item, newest first.
+        :type index: int
+        :return: The item, as a `t1`, `t2`, `t3` or `t5` thing.
+        :rtype: Dict
+        """
+
+        # Every item is generated from its own source and index, so it can be made on its own.
+        rng = self.rng(f"{source}:{index}")
+        kind, _, name = source.partition(":")
+        created: float = (
+            self.created_at
+            - index * self.item_interval
+            - rng.uniform(0, self.item_interval)
+        )
+
+        if kind in ("subreddits", "users"):
+            query: Optional[str] = (
+                name.partition(":")[2] if name.startswith("search:") else None
+            )
+            if kind == "subreddits":
+                return self.subreddit(
+                    name=f"{query or 'sub'}_{index}",
+                    created=created,
+                    thing_id=self.id(source, index),
+                )
+            return self.user(
+                name=f"{query or 'user'}_{index}",
+                created=created,
+                thing_id=self.id(source, index),
+            )
+
+        if kind == "user":
+            username, _, listing = name.partition(":")
+            is_comment: bool = listing == "comments" or (
+                listing == "overview" and index % 3 != 0
+            )
+            if is_comment:
+                return self.comment(
+                    post_id=self.id(f"{source}:post", index),
+                    comment_id=self.id(source, index),
+                    subreddit=self.subreddit_name(rng),
+                    author=username,
+                    created=created,
+                    rng=rng,
+                )
+            subreddit, author = self.subreddit_name(rng), username
+        else:
+            subreddit = (
+                name.split(":", 1)[0] if kind == "r" else self.subreddit_name(rng)
+            )
+            author = self.author(rng)
+
+        return self.post(
+            post_id=self.id(source, index),
+            subreddit=subreddit,
+            author=author,
+            created=created,
+            rng=rng,
+            query=name.rpartition("search:")[2] if "search:" in source else None,
+        )
+
+    def post(
+        self,
+        post_id: str,
+        subreddit: str,
+        author: str,
+        created: float,
+        rng: random.Random,
+        query: Optional[str] = None,
+    ) -> Dict:
+        """
+        Generates a post (`t3`).
+
+        :param post_id: ID of the post.
+        :type post_id: str
+        :param subreddit: Name of the post's subreddit.
+        :type subreddit: str
+        :param author: Username of the post's author.
+        :type author: str
+        :param created: Unix time that the post was created at.
+        :type created: float
+        :param rng: Random number generator that the post's content is drawn from.
+        :type rng: random.Random
+        :param query: A search query to put in the title, if the post is a search result. Defaults to None.
+        :type query: Optional[str]
+        :return: The post.
+        :rtype: Dict
+        """
+
+        title: str = self.text(rng, 4, 40)
+        if query:
+            words: List[str] = title.split()
+            words.insert(rng.randint(0, len(words)), query)
+            title = " ".join(words)
+        selftext: str = self.text(rng, 0, 1500) if rng.random() < 0.6 else ""
+        score: int = int(rng.paretovariate(1.2)) - 1
+        permalink: str = (
+            f"/r/{subreddit}/comments/{post_id}/{'_'.join(title.lower().split()[:6])}/"
+        )
+
+        return {
+            "kind": "t3",
+            "data": {
+                "id": post_id,
+                "name": f"t3_{post_id}",
+                "title": title,
+                "selftext": selftext,
+                "author": author,
+                "author_fullname": f"t2_{self._name_id(author)}",
+                "subreddit": subreddit,
+                "subreddit_name_prefixed": f"r/{subreddit}",
+                "subreddit_id": f"t5_{self._name_id(subreddit.lower())}",
+                "score": score,
+                "ups": score,
+                "downs": 0,
+                "upvote_ratio": round(rng.uniform(0.5, 1.0), 2),
+                "num_comments": self.comments_per_post,
+                "is_self": bool(selftext),
+                "over_18": rng.random() < 0.05,
+                "spoiler": False,
+                "locked": False,
+                "stickied": False,
+                "archived": False,
+                "gilded": 0,
+                "domain": f"self.{subreddit}",
+                "permalink": permalink,
+                "url": f"https://www.reddit.com{permalink}",
+                "thumbnail": "self",
+                "created": created,
+                "created_utc": created,
+                "edited": False,
+            },
+        }
+
+    def post_by_id(self, post_id: str, subreddit: Optional[str] = None) -> Dict:
+        """
+        Generates a post that does not belong to any listing, from its ID alone.
+
+        :param post_id: ID of the post.
+        :type post_id: str
+        :param subreddit: Name of the post's subreddit. Defaults to None (picked at random).
+        :type subreddit: Optional[str]
+        :return: The post.
+        :rtype: Dict
+        """
+
+        rng = self.rng(f"post:{post_id}")
+        return self.post(
+            post_id=post_id,
+            subreddit=subreddit or self.subreddit_name(rng),
+            author=self.author(rng),
+            created=self.created_at - rng.uniform(0, 7 * 86400),
+            rng=rng,
+        )
+
+    def comment(
+        self,
+        post_id: str,
+        comment_id: str,
+        subreddit: str,
+        author: str,
+        created: float,
+        rng: random.Random,
+        parent_id: Optional[str] = None,
+        depth: int = 0,
+    ) -> Dict:
+        """
+        Generates a comment (`t1`), without replies.
+
+        :param post_id: ID of the comment's post.
+        :type post_id: str
+        :param comment_id: ID of the comment.
+        :type comment_id: str
+        :param subreddit: Name of the comment's subreddit.
+        :type subreddit: str
+        :param author: Username of the comment's author.
+        :type author: str
+        :param created: Unix time that the comment was created at.
+        :type created: float
+        :param rng: Random number generator that the comment's content is drawn from.
+        :type rng: random.Random
+        :param parent_id: Fullname of the comment's parent. Defaults to None (the post).
+        :type parent_id: Optional[str]
+        :param depth: Nesting depth of the comment. Defaults to 0.
+        :type depth: int
+        :return: The comment.
+        :rtype: Dict
+        """
+
+        score: int = int(rng.paretovariate(1.5)) - 1
+
+        return {
+            "kind": "t1",
+            "data": {
+                "id": comment_id,
+                "name": f"t1_{comment_id}",
+                "body": self.text(rng, 1, 500),
+                "author": author,
+                "author_fullname": f"t2_{self._name_id(author)}",
+                "subreddit": subreddit,
+                "subreddit_name_prefixed": f"r/{subreddit}",
+                "subreddit_id": f"t5_{self._name_id(subreddit.lower())}",
+                "link_id": f"t3_{post_id}",
+                "parent_id": parent_id or f"t3_{post_id}",
+                "score": score,
+                "ups": score,
+                "downs": 0,
+                "depth": depth,
+                "is_submitter": False,
+                "stickied": False,
+                "gilded": 0,
+                "permalink": f"/r/{subreddit}/comments/{post_id}/_/{comment_id}/",
+                "created": created,
+                "created_utc": created,
+                "edited": False,
+                "replies": "",
+            },
+        }
+
+    def comment_tree(
+        self, post: Dict, comments: Optional[int] = None
+    ) -> Tuple[Dict[str, Dict], Dict[str, List[str]]]:
+        """
+        Generates every comment on a post.
+
+        :param post: Data of the post (its `"data"`).
+        :type post: Dict
+        :param comments: Number of comments. Defaults to None (`comments_per_post`).
+        :type comments: Optional[int]
+        :return: The comments by ID, and the IDs of the direct replies to each fullname (the post's
+            and the comments'), in the order they were made.
+        :rtype: Tuple[Dict[str, Dict], Dict[str, List[str]]]
+        """
+
+        rng = self.rng(f"comments:{post['id']}")
+        tree: Dict[str, Dict] = {}
+        children: Dict[str, List[str]] = {}
+        depths: Dict[str, int] = {post["name"]: -1}
+
+        recent: List[str] = []
+        for index in range(self.comments_per_post if comments is None else comments):
+            # Most comments reply to a recent comment, which builds threads of varying depth.
+            parent: str = (
+                rng.choice(recent[-10:])
+                if recent and rng.random() < 0.6
+                else post["name"]
+            )
+            if depths[parent] >= MAX_DEPTH:
+                parent = post["name"]
+
+            comment_id: str = self.id(f"comment:{post['id']}", index)
+            comment: Dict = self.comment(
+                post_id=post["id"],
+                comment_id=comment_id,
+                subreddit=post["subreddit"],
+                author=self.author(rng),
+                created=post["created"] + (index + 1) * rng.uniform(1, 120),
+                rng=rng,
+                parent_id=parent,
+                depth=depths[parent] + 1,
+            )
+            tree[comment_id] = comment
+            children.setdefault(parent, []).append(comment_id)
+            depths[comment["data"]["name"]] = depths[parent] + 1
+            recent.append(comment["data"]["name"])
+            if len(recent) > 10:
+                recent.pop(0)
+
+        return tree, children
+
+    def comments_page(
+        self,
+        post: Dict,
+        comments: Dict[str, Dict],
+        children: Dict[str, List[str]],
+        limit: int = 200,
+    ) -> List[Dict]:
+        """
+        Makes a post's comments page, with nested replies, like `/comments/{id}.json`.
+
+        :param post: The post.
+        :type post: Dict
+        :param comments: The post's comments by ID (see `comment_tree()`).
+        :type comments: Dict[str, Dict]
+        :param children: The IDs of the direct replies to each fullname (see `comment_tree()`).
+        :type children: Dict[str, List[str]]
+        :param limit: Most comments to show. The rest are collapsed into a "more" stub. Defaults to 200.
+        :type limit: int
+        :return: The post's listing, followed by its comments' listing.
+        :rtype: List[Dict]
+        """
+
+        post_name: str = post["data"]["name"]
+
+        # Comments are shown depth first, and the ones that do not fit are collapsed into a "more" stub.
+        order: List[str] = []
+        stack: List[str] = list(reversed(children.get(post_name, [])))
+        while stack:
+            comment_id: str = stack.pop()
+            order.append(comment_id)
+            stack.extend(reversed(children.get(f"t1_{comment_id}", [])))
+        shown: set = set(order[:limit])
+
+        def render(comment_id: str) -> Dict:
+            comment: Dict = dict(
+                comments[comment_id], data=dict(comments[comment_id]["data"])
+            )
+            replies: List[Dict] = [
+                render(child)
+                for child in children.get(f"t1_{comment_id}", [])
+                if child in shown
+            ]
+            if replies:
+                comment["data"]["replies"] = {
+                    "kind": "Listing",
+                    "data": {"after": None, "before": None, "children": replies},
+                }
+            return comment
+
+        top_level: List[Dict] = [
+            render(child) for child in children.get(post_name, []) if child in shown
+        ]
+        collapsed: List[str] = order[limit:]
+        if collapsed:
+            top_level.append(self.more(post_id=post["data"]["id"], children=collapsed))
+
+        return [
+            {
+                "kind": "Listing",
+                "data": {"after": None, "before": None, "dist": 1, "children": [post]},
+            },
+            {
+                "kind": "Listing",
+                "data": {"after": None, "before": None, "children": top_level},
+            },
+        ]
+
+    @staticmethod
+    def more_children(comments: Dict[str, Dict], children: List[str]) -> Dict:
+        """
+        Makes a `/api/morechildren` response.
+
+        :param comments: The post's comments by ID (see `comment_tree()`).
+        :type comments: Dict[str, Dict]
+        :param children: IDs of the requested comments.
+        :type children: List[str]
+        :return: The response, with the requested comments that exist, flattened.
+        :rtype: Dict
+        """
+
+        return {
+            "json": {
+                "errors": [],
+                "data": {
+                    "things": [
+                        comments[child] for child in children if child in comments
+                    ]
+                },
+            }
+        }
+
+    @staticmethod
+    def more(post_id: str, children: List[str]) -> Dict:
+        """
+        Makes a "more" stub for comments that were left out of a comments page.
+
+        :param post_id: ID of the comments' post.
+        :type post_id: str
+        :param children: IDs of the comments that were left out.
+        :type children: List[str]
+        :return: The stub.
+        :rtype: Dict
+        """
+
+        return {
+            "kind": "more",
+            "data": {
+                "count": len(children),
+                "name": f"t1_{children[0]}",
+                "id": children[0],
+                "parent_id": f"t3_{post_id}",
+                "depth": 0,
+                "children": children,
+            },
+        }
+
+    def subreddit(
+        self,
+        name: str,
+        created: Optional[float] = None,
+        thing_id: Optional[str] = None,
+    ) -> Dict:
+        """
+        Generates a subreddit (`t5`).
+
+        :param name: Name of the subreddit.
+        :type name: str
+        :param created: Unix time that the subreddit was created at. Defaults to None (random).
+        :type created: Optional[float]
+        :param thing_id: ID of the subreddit. Defaults to None (derived from its name).
+        :type thing_id: Optional[str]
+        :return: The subreddit.
+        :rtype: Dict
+        """
+
+        rng = self.rng(f"subreddit:{name.lower()}")
+        subreddit_id: str = thing_id or self._name_id(name.lower())
+        created = (
+            created
+            if created is not None
+            else self.created_at - rng.uniform(86400, 15 * 31536000)
+        )
+
+        return {
+            "kind": "t5",
+            "data": {
+                "id": subreddit_id,
+                "name": f"t5_{subreddit_id}",
+                "display_name": name,
+                "display_name_prefixed": f"r/{name}",
+                "title": self.text(rng, 2, 8),
+                "public_description": f"{name} {self.text(rng, 4, 30)}",
+                "description": self.text(rng, 10, 400),
+                "subscribers": int(rng.paretovariate(0.8) * 100),
+                "active_user_count": int(rng.paretovariate(1.0) * 10),
+                "over18": rng.random() < 0.05,
+                "subreddit_type": "public",
+                "lang": "en",
+                "url": f"/r/{name}/",
+                "created": created,
+                "created_utc": created,
+            },
+        }
+
+    def user(
+        self,
+        name: str,
+        created: Optional[float] = None,
+        thing_id: Optional[str] = None,
+    ) -> Dict:
+        """
+        Generates a user (`t2`).
+
+        :param name: Username of the user.
+        :type name: str
+        :param created: Unix time that the account was created at. Defaults to None (random).
+        :type created: Optional[float]
+        :param thing_id: ID of the user. Defaults to None (derived from the username).
+        :type thing_id: Optional[str]
+        :return: The user.
+        :rtype: Dict
+        """
+
+        rng = self.rng(f"user:{name.lower()}")
+        user_id: str = thing_id or self._name_id(name)
+        created = (
+            created
+            if created is not None
+            else self.created_at - rng.uniform(86400, 15 * 31536000)
+        )
+        link_karma: int = int(rng.paretovariate(0.7) * 10)
+        comment_karma: int = int(rng.paretovariate(0.7) * 10)
+
+        return {
+            "kind": "t2",
+            "data": {
+                "id": user_id,
+                "name": name,
+                "link_karma": link_karma,
+                "comment_karma": comment_karma,
+                "total_karma": link_karma + comment_karma,
+                "is_employee": False,
+                "is_mod": rng.random() < 0.1,
+                "is_gold": rng.random() < 0.05,
+                "verified": True,
+                "has_verified_email": True,
+                "icon_img": "",
+                "subreddit": {
+                    "display_name": f"u_{name}",
+                    "display_name_prefixed": f"u/{name}",
+                    "public_description": self.text(rng, 0, 20),
+                    "title": name,
+                    "subscribers": int(rng.paretovariate(1.0)),
+                    "over_18": False,
+                    "url": f"/user/{name}/",
+                },
+                "created": created,
+                "created_utc": created,
+            },
+        }
+
+    def wiki_page(self, subreddit: str, page: str) -> Dict:
+        """
+        Generates a subreddit's wiki page.
+
+        :param subreddit: Name of the subreddit.
+        :type subreddit: str
+        :param page: Name of the wiki page.
+        :type page: str
+        :return: The wiki page.
+        :rtype: Dict
+        """
+
+        rng = self.rng(f"wiki:{subreddit.lower()}:{page}")
+        content: str = self.text(rng, 20, 2000)
+        revised_at: float = self.created_at - rng.uniform(0, 31536000)
+
+        return {
+            "kind": "wikipage",
+            "data": {
+                "content_md": content,
+                "content_html": f'<div class="md wiki"><p>{content}</p></div>',
+                "may_revise": False,
+                "revision_id": self.id(f"wiki:{subreddit.lower()}:{page}", 0),
+                "revision_date": revised_at,
+                "revision_by": self.user(name=self.author(rng)),
+                "reason": None,
+            },
+        }
+
+    def rng(self, source: str) -> random.Random:
+        """
+        Makes the random number generator that a source's data is drawn from.
+
+        :param source: Name of the source.
+        :type source: str
+        :return: The source's random number generator.
+        :rtype: random.Random
+        """
+
+        return random.Random(self.source_hash(source))
+
+    def source_hash(self, source: str) -> int:
+        """
+        Hashes a source's name, along with the seed.
+
+        :param source: Name of the source.
+        :type source: str
+        :return: The source's hash.
+        :rtype: int
+        """
+
+        return zlib.crc32(f"{self.seed}:{source}".encode("utf-8"))
+
+    def id(self, source: str, index: int) -> str:
+        """
+        Makes the ID of the item at an index of a source.
+
+        :param source: Name of the source.
+        :type source: str
+        :param index: Index of the item.
+        :type index: int
+        :return: The base-36 ID.
+        :rtype: str
+        """
+
+        # IDs are the source's hash followed by the item's index, so they are stable across runs,
+        # never collide within a source, and can be traced back to the item they belong to.
+        number: int = (self.source_hash(source) << INDEX_BITS) + index
+        digits: str = "0123456789abcdefghijklmnopqrstuvwxyz"
+        encoded: str = ""
+        while number:
+            number, remainder = divmod(number, 36)
+            encoded = digits[remainder] + encoded
+
+        return encoded or "0"
+
+    @staticmethod
+    def split_id(thing_id: str) -> Optional[Tuple[int, int]]:
+        """
+        Splits an ID made with `id()` back into its source's hash and its index.
+
+        :param thing_id: The ID, with or without its kind prefix (e.g. "t3_").
+        :type thing_id: str
+        :return: The source's hash and the item's index, or None if the ID is not base-36.
+        :rtype: Optional[Tuple[int, int]]
+        """
+
+        try:
+            number: int = int(thing_id.rpartition("_")[2], 36)
+        except ValueError:
+            return None
+
+        return number >> INDEX_BITS, number & ((1 << INDEX_BITS) - 1)
+
+    @staticmethod
+    def fullname(thing: Dict) -> str:
+        """
+        Gets a thing's fullname, e.g. "t3_abc123".
+
+        :param thing: The thing.
+        :type thing: Dict
+        :return: The fullname.
+        :rtype: str
+        """
+
+        return f"{thing['kind']}_{thing['data']['id']}"
+
+    @staticmethod
+    def author(rng: random.Random) -> str:
+        """Picks an author. A few prolific authors write most items, like on Reddit."""
+
+        return f"user_{min(int(rng.paretovariate(1.1)), 10000)}"
+
+    @staticmethod
+    def subreddit_name(rng: random.Random) -> str:
+        """Picks a subreddit. A few large subreddits get most items, like on Reddit."""
+
+        return f"sub_{min(int(rng.paretovariate(1.0)), 1000)}"
+
+    def text(self, rng: random.Random, minimum: int, maximum: int) -> str:
+        """
+        Generates text of between `minimum` and `maximum` words, most of it short.
+
+        :param rng: Random number generator to draw the text from.
+        :type rng: random.Random
+        :param minimum: Fewest words.
+        :type minimum: int
+        :param maximum: Most words.
+        :type maximum: int
+        :return: The text.
+        :rtype: str
+        """
+
+        words: int = minimum + int((maximum - minimum + 1) * rng.random() ** 6)
+        start: int = rng.randrange(len(self._words) - words)
+
+        return " ".join(self._words[start : start + words])
+
+
+# -------------------------------- END ----------------------------------------- #
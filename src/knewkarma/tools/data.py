@@ -1,9 +1,11 @@
 import os
+import time
 from types import SimpleNamespace
-from typing import Union, Literal, List, Tuple, Dict
+from typing import Union, Literal, Optional, List, Tuple, Dict
 
 import pandas as pd
 
+from .metrics import MetricsRegistry
 from .shared import notify
 
 __all__ = [
@@ -105,6 +107,7 @@ def export_dataframe(
     filename: str,
     directory: str,
     formats: List[EXPORT_FORMATS],
+    metrics: Optional[MetricsRegistry] = None,
 ):
     """
     Exports a Pandas dataframe to specified file formats.
@@ -117,6 +120,8 @@ def export_dataframe(
     :type directory: str
     :param formats: A list of file formats to which the data will be exported.
     :type formats: List[Literal]
+    :param metrics: An optional `MetricsRegistry` to record the exported rows and export time in. Defaults to None.
+    :type metrics: Optional[MetricsRegistry]
     """
 
     file_mapping: Dict = {
@@ -145,7 +150,17 @@ def export_dataframe(
             filepath: str = os.path.join(
                 directory, file_format, f"{filename}.{file_format}"
             )
+            start_time: float = time.perf_counter()
             file_mapping.get(file_format)()
+            if metrics:
+                metrics.inc(
+                    "knewkarma_exported_rows_total", len(dataframe), format=file_format
+                )
+                metrics.inc(
+                    "knewkarma_export_seconds_total",
+                    time.perf_counter() - start_time,
+                    format=file_format,
+                )
             notify.ok(
                 f"{get_file_size(file_path=filepath)} written to [link file://{filepath}]{filepath}"
             )
@@ -0,0 +1,318 @@
+import hashlib
+import json
+import math
+import os
+import tempfile
+import warnings
+from typing import Iterable, Iterator, Optional, Dict, List, Set
+
+__all__ = ["BloomFilter", "SeenSet"]
+
+# Number of fullnames a `SeenSet` holds exactly before it switches to a Bloom filter. A set of this many
+# fullnames takes about 20 MiB.
+EXACT_LIMIT: int = 200000
+# Number of fullnames a `SeenSet`'s Bloom filter is sized for, which takes about 17 MiB at the default
+# false-positive rate.
+BLOOM_CAPACITY: int = 10000000
+BLOOM_ERROR_RATE: float = 0.001
+
+
+class BloomFilter:
+    """
+    A fixed-size set of strings that answers "have I seen this?" with no false negatives and a bounded
+    rate of false positives, in far less memory than the strings themselves take.
+    """
+
+    def __init__(
+        self,
+        capacity: int = BLOOM_CAPACITY,
+        error_rate: float = BLOOM_ERROR_RATE,
+    ):
+        """
+        Initialises an empty `BloomFilter` instance, sized for `capacity` strings.
+
+        :param capacity: Number of strings the filter is sized for. Past it, the false-positive rate
+            climbs above `error_rate`. Defaults to `BLOOM_CAPACITY`.
+        :type capacity: int
+        :param error_rate: Rate of false positives once `capacity` strings have been added.
+            Defaults to `BLOOM_ERROR_RATE`.
+        :type error_rate: float
+        """
+
+        self.capacity = max(capacity, 1)
+        self.error_rate = error_rate
+        self.size: int = max(
+            int(-self.capacity * math.log(error_rate) / math.log(2) ** 2), 8
+        )
+        self.hashes: int = max(round(self.size / self.capacity * math.log(2)), 1)
+        self.count: int = 0
+        self._bits = bytearray((self.size + 7) // 8)
+
+    def __contains__(self, value: str) -> bool:
+        return all(
+            self._bits[index >> 3] & (1 << (index & 7))
+            for index in self._indexes(value=value)
+        )
+
+    def __len__(self) -> int:
+        return self.count
+
+    @property
+    def false_positive_rate(self) -> float:
+        """Estimated rate of false positives, given the number of strings added so far."""
+
+        return (1 - math.exp(-self.hashes * self.count / self.size)) ** self.hashes
+
+    def add(self, value: str) -> bool:
+        """
+        Adds a string to the filter.
+
+        :param value: The string to add.
+        :type value: str
+        :return: True if the string was not in the filter yet (or, rarely, was a false positive of it).
+        :rtype: bool
+        """
+
+        is_new: bool = False
+        for index in self._indexes(value=value):
+            byte, bit = index >> 3, 1 << (index & 7)
+            if not self._bits[byte] & bit:
+                self._bits[byte] |= bit
+                is_new = True
+
+        self.count += is_new
+        return is_new
+
+    def to_bytes(self) -> bytes:
+        """
+        Gets the filter's bits, e.g. to write them to a file.
+
+        :return: The filter's bits.
+        :rtype: bytes
+        """
+
+        return bytes(self._bits)
+
+    @classmethod
+    def from_bytes(
+        cls, bits: bytes, capacity: int, error_rate: float, count: int
+    ) -> "BloomFilter":
+        """
+        Rebuilds a filter from its bits (see `to_bytes()`).
+
+        :param bits: The filter's bits.
+        :type bits: bytes
+        :param capacity: Number of strings the filter was sized for.
+        :type capacity: int
+        :param error_rate: False-positive rate the filter was sized for.
+        :type error_rate: float
+        :param count: Number of strings that had been added to the filter.
+        :type count: int
+        :return: The filter.
+        :rtype: BloomFilter
+        :raise ValueError: If the bits do not match the filter's size.
+        """
+
+        bloom_filter = cls(capacity=capacity, error_rate=error_rate)
+        if len(bits) != len(bloom_filter._bits):
+            raise ValueError(
+                f"Expected {len(bloom_filter._bits)} bytes of filter bits, got {len(bits)}"
+            )
+
+        bloom_filter._bits = bytearray(bits)
+        bloom_filter.count = count
+        return bloom_filter
+
+    def _indexes(self, value: str) -> Iterator[int]:
+        # Two halves of one digest make every index (double hashing), which is as good as `hashes`
+        # independent hash functions, at the cost of one.
+        digest: bytes = hashlib.blake2b(value.encode("utf-8"), digest_size=16).digest()
+        first: int = int.from_bytes(digest[:8], "little")
+        second: int = int.from_bytes(digest[8:], "little") | 1
+        for number in range(self.hashes):
+            yield (first + number * second) % self.size
+
+
+class SeenSet:
+    """
+    The fullnames of the items that have been fetched, so that each item is only returned once: within
+    a listing (which shifts while it is paginated), across the listings of a batch job, and, if it is
+    saved to a file, across runs.
+
+    Fullnames are held in an exact set until there are `exact_limit` of them, and then moved into a
+    `BloomFilter`, whose memory use stays fixed however many items are crawled, at the cost of
+    occasionally taking a new item for a seen one.
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        exact_limit: int = EXACT_LIMIT,
+        capacity: int = BLOOM_CAPACITY,
+        error_rate: float = BLOOM_ERROR_RATE,
+    ):
+        """
+        Initialises a `SeenSet` instance, loading the fullnames saved to `path` if the file exists.
+        If the file cannot be read (e.g. it was truncated or edited), a warning is issued, and the
+        set starts empty.
+
+        :param path: Path of the file to load fullnames from, and to save them to (see `save()`).
+            Defaults to None (fullnames are only kept in memory).
+        :type path: Optional[str]
+        :param exact_limit: Number of fullnames to hold exactly before switching to a Bloom filter.
+            Defaults to `EXACT_LIMIT`.
+        :type exact_limit: int
+        :param capacity: Number of fullnames the Bloom filter is sized for. Defaults to `BLOOM_CAPACITY`.
+        :type capacity: int
+        :param error_rate: False-positive rate of the Bloom filter at `capacity`.
+            Defaults to `BLOOM_ERROR_RATE`.
+        :type error_rate: float
+        """
+
+        self.path = path
+        self.exact_limit = exact_limit
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self._exact: Optional[Set[str]] = set()
+        self._bloom_filter: Optional[BloomFilter] = None
+
+        if path and os.path.exists(path):
+            try:
+                self._load(path=path)
+            except (OSError, ValueError, KeyError, TypeError) as error:
+                warnings.warn(
+                    f"Could not load the seen items from {path} ({error!r}), starting with none",
+                    RuntimeWarning,
+                    stacklevel=2,
+                )
+                self._exact = set()
+                self._bloom_filter = None
+
+    def __contains__(self, fullname: str) -> bool:
+        if self._exact is not None:
+            return fullname in self._exact
+
+        return fullname in self._bloom_filter
+
+    def __len__(self) -> int:
+        return len(self._exact) if self._exact is not None else len(self._bloom_filter)
+
+    @property
+    def is_exact(self) -> bool:
+        """Whether fullnames are still held exactly, rather than in a Bloom filter."""
+
+        return self._exact is not None
+
+    @staticmethod
+    def fullname(item: Dict) -> str:
+        """
+        Gets an item's fullname, e.g. "t3_abc123".
+
+        :param item: The item, as a thing (with its "kind" and "data").
+        :type item: Dict
+        :return: The fullname.
+        :rtype: str
+        """
+
+        data: Dict = item.get("data", {})
+        return data.get("name") or f"{item.get('kind')}_{data.get('id')}"
+
+    def add(self, fullname: str) -> bool:
+        """
+        Records a fullname as seen.
+
+        :param fullname: The fullname.
+        :type fullname: str
+        :return: True if the fullname had not been seen yet.
+        :rtype: bool
+        """
+
+        if self._exact is None:
+            return self._bloom_filter.add(fullname)
+
+        if fullname in self._exact:
+            return False
+
+        self._exact.add(fullname)
+        if len(self._exact) > self.exact_limit:
+            self._bloom_filter = BloomFilter(
+                capacity=max(self.capacity, len(self._exact)),
+                error_rate=self.error_rate,
+            )
+            for seen_fullname in self._exact:
+                self._bloom_filter.add(seen_fullname)
+            self._exact = None
+
+        return True
+
+    def filter(self, items: Iterable[Dict]) -> List[Dict]:
+        """
+        Leaves out the items that have been seen, and records the others as seen.
+
+        :param items: The items, as things (with their "kind" and "data").
+        :type items: Iterable[Dict]
+        :return: The items that had not been seen, in their original order.
+        :rtype: List[Dict]
+        """
+
+        return [item for item in items if self.add(self.fullname(item))]
+
+    def save(self, path: Optional[str] = None):
+        """
+        Saves the fullnames to a file, replacing it atomically.
+
+        :param path: Path of the file. Defaults to None (the path it was loaded from).
+        :type path: Optional[str]
+        :raise ValueError: If there is no path to save to.
+        """
+
+        path = path or self.path
+        if not path:
+            raise ValueError("SeenSet has no path to be saved to")
+
+        # The file is a JSON header line, followed by either one fullname per line or the filter's bits.
+        header: Dict = {
+            "kind": "exact" if self.is_exact else "bloom",
+            "count": len(self),
+        }
+        if self.is_exact:
+            payload: bytes = "\n".join(sorted(self._exact)).encode("utf-8")
+        else:
+            header.update(
+                capacity=self._bloom_filter.capacity,
+                error_rate=self._bloom_filter.error_rate,
+            )
+            payload = self._bloom_filter.to_bytes()
+
+        directory: str = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        descriptor, temporary_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(descriptor, "wb") as seen_file:
+                seen_file.write(json.dumps(header).encode("utf-8") + b"\n")
+                seen_file.write(payload)
+                seen_file.flush()
+                os.fsync(seen_file.fileno())
+            os.replace(temporary_path, path)
+        except BaseException:
+            os.remove(temporary_path)
+            raise
+
+    def _load(self, path: str):
+        with open(path, "rb") as seen_file:
+            header: Dict = json.loads(seen_file.readline())
+            payload: bytes = seen_file.read()
+
+        if header["kind"] == "exact":
+            self._exact = set(payload.decode("utf-8").split("\n")) if payload else set()
+        else:
+            self._bloom_filter = BloomFilter.from_bytes(
+                bits=payload,
+                capacity=header["capacity"],
+                error_rate=header["error_rate"],
+                count=header["count"],
+            )
+            self._exact = None
+
+
+# -------------------------------- END ----------------------------------------- #
@@ -0,0 +1,837 @@
+import argparse
+import asyncio
+import base64
+import binascii
+import hashlib
+import json
+import random
+import re
+import time
+from collections import OrderedDict, deque
+from email.utils import formatdate, parsedate_to_datetime
+from http import HTTPStatus
+from types import SimpleNamespace
+from typing import (
+    Callable,
+    Deque,
+    Iterable,
+    Sequence,
+    Optional,
+    Dict,
+    List,
+    Tuple,
+    Union,
+)
+
+from aiohttp import web
+
+from .corpus import Corpus
+
+__all__ = ["FakeReddit"]
+
+# Reddit never serves more than this many items from one listing, however far it is paginated.
+LISTING_CAP: int = 1000
+# Most items Reddit returns per page, whatever `limit` is asked for.
+PAGE_SIZE_CAP: int = 100
+# Most comment IDs `/api/morechildren` accepts in one request.
+MORE_CHILDREN_CAP: int = 100
+# Most fullnames `/api/info` looks up in one request.
+INFO_CAP: int = 100
+
+SORTS: tuple[str, ...] = ("hot", "new", "top", "rising", "controversial", "best")
+# Listings that are served from the front page rather than from a subreddit of that name.
+FRONT_PAGE_LISTINGS: tuple[str, ...] = ("all", "popular", *SORTS)
+TIMEFRAME_SECONDS: Dict[str, float] = {
+    "hour": 3600,
+    "day": 86400,
+    "week": 604800,
+    "month": 2592000,
+    "year": 31536000,
+}
+WIKI_PAGES: tuple[str, ...] = ("index", "faq", "rules", "config/sidebar")
+
+
+class FakeReddit:
+    """
+    A local stand-in for the Reddit endpoints that `Api` talks to, for offline tests and benchmarks.
+
+    It serves listings (with `after`/`count` pagination, `sort`, `t` and the 1,000-item cap), about,
+    comments (with "more" stubs), `/api/morechildren`, `/api/info`, search, wiki,
+    `/api/username_available` and Reddit status endpoints. Data is generated deterministically by a `Corpus`, so every name that is
+    asked for exists, and the same request always gets the same response.
+
+    Every response carries `X-Ratelimit-*` headers, and faults (error statuses and latency) can be
+    injected at random or queued for upcoming requests. Point an `Api` at it with
+    `Api(base_url=server.url)`.
+
+    App-only OAuth is supported too: `/api/v1/access_token` grants bearer tokens for the client
+    credentials `client_id` and `client_secret`, and requests made with a token draw from their own,
+    optionally larger, rate-limit budget.
+    """
+
+    def __init__(
+        self,
+        seed: int = 0,
+        items_per_listing: int = 1500,
+        comments_per_post: int = 50,
+        item_interval: float = 300.0,
+        listing_cap: Optional[int] = LISTING_CAP,
+        rate_limit: Optional[int] = 1000,
+        rate_limit_window: float = 600.0,
+        latency: float = 0.0,
+        latency_jitter: float = 0.0,
+        error_rate: float = 0.0,
+        error_statuses: Tuple[int, ...] = (500, 502, 503),
+        retry_after: Optional[float] = 1.0,
+        corpus: Optional[Corpus] = None,
+        client_id: str = "client-id",
+        client_secret: str = "client-secret",
+        token_lifetime: float = 3600.0,
+        oauth_rate_limit: Optional[int] = None,
+        require_oauth: bool = False,
+    ):
+        """
+        Initialises a `FakeReddit` instance.
+
+        :param seed: Seed that all generated data is derived from. Defaults to 0.
+        :type seed: int
+        :param items_per_listing: Number of items behind each listing, before the listing cap. Defaults to 1500.
+        :type items_per_listing: int
+        :param comments_per_post: Number of comments on each post. Defaults to 50.
+        :type comments_per_post: int
+        :param item_interval: Seconds between the creation times of consecutive items. Defaults to 300.0.
+        :type item_interval: float
+        :param listing_cap: Maximum number of items served from one listing, or None for no cap.
+            Defaults to 1000, like Reddit.
+        :type listing_cap: Optional[int]
+        :param rate_limit: Requests allowed per rate-limit window, after which requests get a 429,
+            or None to serve requests without rate-limit headers. Defaults to 1000.
+        :type rate_limit: Optional[int]
+        :param rate_limit_window: Length of a rate-limit window in seconds. Defaults to 600.0.
+        :type rate_limit_window: float
+        :param latency: Seconds to wait before every response. Defaults to 0.0.
+        :type latency: float
+        :param latency_jitter: Maximum number of random seconds added to `latency`. Defaults to 0.0.
+        :type latency_jitter: float
+        :param error_rate: Share (0.0 to 1.0) of requests that fail with one of `error_statuses`. Defaults to 0.0.
+        :type error_rate: float
+        :param error_statuses: Statuses that random failures are picked from. Defaults to (500, 502, 503).
+        :type error_statuses: Tuple[int, ...]
+        :param retry_after: Value of the `Retry-After` header sent with 429 responses, or None to leave
+            it out. Defaults to 1.0.
+        :type retry_after: Optional[float]
+        :param corpus: The `Corpus` to serve data from, in which case `seed`, `comments_per_post` and
+            `item_interval` are taken from it. Defaults to None (a corpus of items created up to now).
+        :type corpus: Optional[Corpus]
+        :param client_id: Client ID that access tokens are granted for. Defaults to "client-id".
+        :type client_id: str
+        :param client_secret: Client secret that access tokens are granted for. Defaults to "client-secret".
+        :type client_secret: str
+        :param token_lifetime: Seconds that granted access tokens are valid for. Defaults to 3600.0.
+        :type token_lifetime: float
+        :param oauth_rate_limit: Requests allowed per rate-limit window for requests made with an access
+            token. Defaults to None (the same as `rate_limit`).
+        :type oauth_rate_limit: Optional[int]
+        :param require_oauth: Whether to reject requests without an access token. Defaults to False.
+        :type require_oauth: bool
+        """
+
+        self.corpus: Corpus = corpus or Corpus(
+            seed=seed,
+            comments_per_post=comments_per_post,
+            item_interval=item_interval,
+            created_at=time.time(),
+        )
+        self.items_per_listing = items_per_listing
+        self.listing_cap = listing_cap
+        self.rate_limit = rate_limit
+        self.rate_limit_window = rate_limit_window
+        self.latency = latency
+        self.latency_jitter = latency_jitter
+        self.error_rate = error_rate
+        self.error_statuses = error_statuses
+        self.retry_after = retry_after
+        self.client_id = client_id
+        self.client_secret = client_secret
+        self.token_lifetime = token_lifetime
+        self.oauth_rate_limit = oauth_rate_limit
+        self.require_oauth = require_oauth
+
+        self.requests: List[SimpleNamespace] = []
+        self._faults: Deque[SimpleNamespace] = deque()
+        self._random = random.Random(self.corpus.seed)
+        # Rate-limit windows of anonymous and authenticated requests, as [started at, requests used].
+        self._windows: Dict[str, List[float]] = {}
+        # Access tokens that have been granted, and when they expire.
+        self._tokens: Dict[str, float] = {}
+        self._runner: Optional[web.AppRunner] = None
+        self._url: Optional[str] = None
+        # Sources of the listings that have been served, by their hash, so that an item can be
+        # generated again from its ID alone.
+        self._sources: Dict[int, str] = {}
+        # Posts that were asked for by an ID that does not belong to any listing.
+        self._posts: Dict[str, Dict] = {}
+        # Posts whose comments have been served, by the hash their comment IDs are made from, and
+        # subreddits whose about page has been served, by ID, so that `/api/info` can find them.
+        self._threads: Dict[int, str] = {}
+        self._subreddits: Dict[str, str] = {}
+        self._generated: OrderedDict = OrderedDict()
+
+    async def __aenter__(self) -> "FakeReddit":
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.stop()
+
+    @property
+    def comments_per_post(self) -> int:
+        """Number of comments on each post."""
+
+        return self.corpus.comments_per_post
+
+    @comments_per_post.setter
+    def comments_per_post(self, comments_per_post: int):
+        self.corpus.comments_per_post = comments_per_post
+
+    @property
+    def url(self) -> str:
+        """
+        Base URL of the running server, e.g. "http://127.0.0.1:54321".
+
+        :raise RuntimeError: If the server has not been started.
+        """
+
+        if self._url is None:
+            raise RuntimeError("The server has not been started.")
+
+        return self._url
+
+    def application(self) -> web.Application:
+        """
+        Makes an `aiohttp.web.Application` that serves the fake endpoints, e.g. for `aiohttp`'s test utilities.
+
+        :return: The application.
+        :rtype: aiohttp.web.Application
+        """
+
+        application = web.Application()
+        application.router.add_post("/api/v1/access_token", self._handle_token)
+        application.router.add_get("/{path:.*}", self._handle)
+
+        return application
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> str:
+        """
+        Asynchronously starts serving the fake endpoints.
+
+        :param host: Address to listen on. Defaults to "127.0.0.1".
+        :type host: str
+        :param port: Port to listen on, or 0 for any free port. Defaults to 0.
+        :type port: int
+        :return: Base URL of the server.
+        :rtype: str
+        """
+
+        self._runner = web.AppRunner(self.application(), access_log=None)
+        await self._runner.setup()
+        await web.TCPSite(self._runner, host=host, port=port).start()
+
+        bound_host, bound_port = self._runner.addresses[0][:2]
+        self._url = f"http://{bound_host}:{bound_port}"
+
+        return self._url
+
+    async def stop(self):
+        """
+        Asynchronously stops the server.
+        """
+
+        if self._runner:
+            await self._runner.cleanup()
+            self._runner = None
+            self._url = None
+
+    def fail_next(
+        self,
+        status: int,
+        times: int = 1,
+        path: Optional[str] = None,
+        delay: float = 0.0,
+    ):
+        """
+        Queues a fault for upcoming requests.
+
+        :param status: Status to respond with, e.g. 429 or 503.
+        :type status: int
+        :param times: Number of requests that get the fault. Defaults to 1.
+        :type times: int
+        :param path: Only fail requests whose path contains this string. Defaults to None (any request).
+        :type path: Optional[str]
+        :param delay: Seconds to wait before responding with the fault. Defaults to 0.0.
+        :type delay: float
+        """
+
+        for _ in range(times):
+            self._faults.append(SimpleNamespace(status=status, path=path, delay=delay))
+
+    def revoke_tokens(self):
+        """
+        Revokes every access token that has been granted, so that requests made with them get a 401.
+        """
+
+        self._tokens.clear()
+
+    def request_count(self, path: Optional[str] = None) -> int:
+        """
+        Counts the requests the server has received.
+
+        :param path: Only count requests whose path contains this string. Defaults to None (every request).
+        :type path: Optional[str]
+        :return: Number of matching requests.
+        :rtype: int
+        """
+
+        return sum(path is None or path in request.path for request in self.requests)
+
+    async def _handle(self, request: web.Request) -> web.Response:
+        query: Dict[str, str] = dict(request.query)
+        record = SimpleNamespace(path=request.path, query=query, status=200)
+        self.requests.append(record)
+
+        delay: float = self.latency + (
+            self._random.uniform(0, self.latency_jitter) if self.latency_jitter else 0.0
+        )
+        fault: Optional[SimpleNamespace] = self._next_fault(path=request.path)
+        if fault:
+            delay += fault.delay
+        if delay:
+            await asyncio.sleep(delay)
+
+        headers: Dict[str, str] = {}
+        status: int = fault.status if fault else 200
+
+        authorization: str = request.headers.get("Authorization", "")
+        authenticated: bool = authorization.lower().startswith("bearer ")
+        if (
+            authenticated
+            and self._tokens.get(authorization[len("bearer ") :], 0.0)
+            <= time.monotonic()
+        ) or (self.require_oauth and not authenticated):
+            record.status = 401
+            return web.json_response(
+                {"message": "Unauthorized", "error": 401}, status=401
+            )
+
+        rate_limit: Optional[int] = (
+            self.oauth_rate_limit
+            if authenticated and self.oauth_rate_limit is not None
+            else self.rate_limit
+        )
+        if rate_limit is not None:
+            now: float = time.monotonic()
+            window: List[float] = self._windows.setdefault(
+                "oauth" if authenticated else "anonymous", [now, 0]
+            )
+            if now - window[0] >= self.rate_limit_window:
+                window[:] = [now, 0]
+            window[1] += 1
+            headers.update(
+                {
+                    "X-Ratelimit-Used": str(min(int(window[1]), rate_limit)),
+                    "X-Ratelimit-Remaining": str(max(rate_limit - int(window[1]), 0)),
+                    "X-Ratelimit-Reset": str(
+                        int(self.rate_limit_window - (now - window[0]))
+                    ),
+                }
+            )
+            if window[1] > rate_limit and not fault:
+                status = 429
+
+        if (
+            status == 200
+            and self.error_rate
+            and self._random.random() < self.error_rate
+        ):
+            status = self._random.choice(self.error_statuses)
+
+        if status != 200:
+            record.status = status
+            if status == 429 and self.retry_after is not None:
+                headers["Retry-After"] = f"{self.retry_after:g}"
+            return web.json_response(
+                {"message": HTTPStatus(status).phrase, "error": status},
+                status=status,
+                headers=headers,
+            )
+
+        body: Optional[Union[Dict, List, bool]] = self._route(
+            path=request.path, query=query
+        )
+        if body is None:
+            record.status = 404
+            return web.json_response(
+                {"message": "Not Found", "error": 404}, status=404, headers=headers
+            )
+
+        text: str = json.dumps(body, separators=(",", ":"))
+        etag: str = f'"{hashlib.md5(text.encode("utf-8")).hexdigest()}"'
+        headers["ETag"] = etag
+        # The corpus does not change once generated, so every response was last modified when it was.
+        headers["Last-Modified"] = formatdate(self.corpus.created_at, usegmt=True)
+        if_none_match: Optional[str] = request.headers.get("If-None-Match")
+        if_modified_since: Optional[str] = request.headers.get("If-Modified-Since")
+        if (if_none_match == etag) or (
+            if_none_match is None
+            and if_modified_since
+            and self._not_modified_since(if_modified_since)
+        ):
+            record.status = 304
+            return web.Response(status=304, headers=headers)
+
+        return web.Response(text=text, content_type="application/json", headers=headers)
+
+    def _not_modified_since(self, date: str) -> bool:
+        """Whether the corpus was last modified at or before an HTTP date (as in `If-Modified-Since`)."""
+
+        try:
+            return parsedate_to_datetime(date).timestamp() >= int(
+                self.corpus.created_at
+            )
+        except (TypeError, ValueError):
+            return False
+
+    async def _handle_token(self, request: web.Request) -> web.Response:
+        form: Dict[str, str] = dict(await request.post())
+        record = SimpleNamespace(path=request.path, query=form, status=200)
+        self.requests.append(record)
+
+        scheme, _, encoded = request.headers.get("Authorization", "").partition(" ")
+        try:
+            credentials: str = base64.b64decode(encoded, validate=True).decode("utf-8")
+        except (binascii.Error, UnicodeDecodeError):
+            credentials = ""
+        if (
+            scheme.lower() != "basic"
+            or credentials != f"{self.client_id}:{self.client_secret}"
+        ):
+            record.status = 401
+            return web.json_response(
+                {"message": "Unauthorized", "error": 401}, status=401
+            )
+
+        # Like Reddit, an unsupported grant is reported in the body of a successful response.
+        if form.get("grant_type") != "client_credentials":
+            return web.json_response({"error": "unsupported_grant_type"})
+
+        access_token: str = f"{self._random.getrandbits(128):032x}"
+        self._tokens[access_token] = time.monotonic() + self.token_lifetime
+
+        return web.json_response(
+            {
+                "access_token": access_token,
+                "token_type": "bearer",
+                "expires_in": self.token_lifetime,
+                "scope": "*",
+            }
+        )
+
+    def _next_fault(self, path: str) -> Optional[SimpleNamespace]:
+        for fault in self._faults:
+            if fault.path is None or fault.path in path:
+                self._faults.remove(fault)
+                return fault
+
+        return None
+
+    def _route(
+        self, path: str, query: Dict[str, str]
+    ) -> Optional[Union[Dict, List, bool]]:
+        path = path.rstrip("/")
+        path = path[: -len(".json")] if path.endswith(".json") else path
+        parts: List[str] = [part for part in path.split("/") if part]
+
+        if path == "/api/v2/status":
+            return {
+                "status": {
+                    "indicator": "none",
+                    "description": "All Systems Operational",
+                }
+            }
+        if path == "/api/v2/components":
+            return {
+                "components": [
+                    {
+                        "name": name,
+                        "status": "operational",
+                        "description": None,
+                        "updated_at": self._timestamp(self.corpus.created_at),
+                    }
+                    for name in ("reddit.com", "API", "Search", "Comments")
+                ]
+            }
+        if path == "/api/username_available":
+            return not self._is_taken(username=query.get("user", ""))
+        if path == "/api/morechildren":
+            return self._more_children(query=query)
+        if path == "/api/info":
+            return self.corpus.listing(
+                children=[
+                    thing
+                    for thing in map(
+                        self._lookup_thing,
+                        [name for name in query.get("id", "").split(",") if name][
+                            :INFO_CAP
+                        ],
+                    )
+                    if thing is not None
+                ]
+            )
+
+        if not parts:
+            return self._listing(source="front", query=query)
+        if len(parts) == 1 and parts[0] in SORTS:
+            return self._listing(source="front", query=query, sort=parts[0])
+        if parts == ["search"]:
+            return self._listing(source=f"search:{query.get('q', '')}", query=query)
+        if parts[0] == "comments" and len(parts) >= 2:
+            return self._post_with_comments(post_id=parts[1], query=query)
+
+        if parts[0] == "r" and len(parts) >= 2:
+            return self._subreddit_route(
+                subreddit=parts[1], parts=parts[2:], query=query
+            )
+        if parts[0] in ("user", "u") and len(parts) >= 2:
+            return self._user_route(username=parts[1], parts=parts[2:], query=query)
+        if parts[0] in ("subreddits", "users"):
+            kind: str = parts[1] if len(parts) > 1 else "all"
+            source: str = (
+                f"{parts[0]}:search:{query.get('q', '')}"
+                if kind == "search"
+                else f"{parts[0]}:{kind}"
+            )
+            return self._listing(
+                source=source,
+                query=query,
+                sort="new" if kind == "new" else None,
+            )
+
+        return None
+
+    def _subreddit_route(
+        self, subreddit: str, parts: List[str], query: Dict[str, str]
+    ) -> Optional[Union[Dict, List]]:
+        if subreddit.lower() in FRONT_PAGE_LISTINGS and not parts:
+            return self._listing(
+                source="front",
+                query=query,
+                sort=subreddit.lower() if subreddit.lower() in SORTS else None,
+            )
+
+        if not parts:
+            # Like Reddit, ignore the `sort` parameter here, and serve the "hot" listing.
+            return self._listing(source=f"r:{subreddit}", query=query, sort="hot")
+        if parts[0] in SORTS and len(parts) == 1:
+            return self._listing(source=f"r:{subreddit}", query=query, sort=parts[0])
+        if parts == ["about"]:
+            about: Dict = self.corpus.subreddit(name=subreddit)
+            self._subreddits[about["data"]["id"]] = subreddit
+            return about
+        if parts == ["search"]:
+            return self._listing(
+                source=(
+                    f"r:{subreddit}:search:{query.get('q', '')}"
+                    if query.get("restrict_sr") in ("1", "true", "on")
+                    else f"search:{query.get('q', '')}"
+                ),
+                query=query,
+            )
+        if parts[0] == "comments" and len(parts) >= 2:
+            return self._post_with_comments(
+                post_id=parts[1], query=query, subreddit=subreddit
+            )
+        if parts[0] == "wiki" and len(parts) >= 2:
+            page: str = "/".join(parts[1:])
+            if page == "pages":
+                return {"kind": "wikipagelisting", "data": list(WIKI_PAGES)}
+            if page in WIKI_PAGES:
+                return self.corpus.wiki_page(subreddit=subreddit, page=page)
+
+        return None
+
+    def _user_route(
+        self, username: str, parts: List[str], query: Dict[str, str]
+    ) -> Optional[Dict]:
+        if parts == ["about"]:
+            return self.corpus.user(name=username)
+        if not parts or parts == ["overview"]:
+            return self._listing(
+                source=f"user:{username}:overview",
+                query=query,
+            )
+        if parts in (["submitted"], ["comments"]):
+            return self._listing(
+                source=f"user:{username}:{parts[0]}",
+                query=query,
+            )
+
+        return None
+
+    def _listing(
+        self, source: str, query: Dict[str, str], sort: Optional[str] = None
+    ) -> Dict:
+        sort = sort or query.get("sort")
+        order, positions = self._order(
+            source=source, sort=sort, timeframe=query.get("t")
+        )
+
+        start: int = 0
+        after: Optional[str] = query.get("after")
+        if after:
+            index: Optional[int] = self._index(source=source, name=after)
+            if index is None:
+                start = len(order)
+            elif positions is None:
+                start = index + 1
+            else:
+                start = positions.get(index, len(order) - 1) + 1
+
+        try:
+            limit: int = int(query.get("limit", 25))
+        except ValueError:
+            limit = 25
+        page: List[Dict] = [
+            self.corpus.thing(source=source, index=index)
+            for index in order[start : start + max(min(limit, PAGE_SIZE_CAP), 1)]
+        ]
+        has_more: bool = start + len(page) < len(order)
+
+        return self.corpus.listing(
+            children=page,
+            after=self.corpus.fullname(page[-1]) if page and has_more else None,
+        )
+
+    def _order(
+        self, source: str, sort: Optional[str], timeframe: Optional[str]
+    ) -> Tuple[Sequence[int], Optional[Dict[int, int]]]:
+        self._sources[self.corpus.source_hash(source)] = source
+
+        # Items are created in order of their index, so the "new" listing needs no sorting,
+        # and only the items of a page are ever generated.
+        if sort == "new":
+            return range(self.items_per_listing)[: self.listing_cap], None
+
+        def make_order() -> Tuple[List[int], Dict[int, int]]:
+            things: List[Dict] = [
+                self.corpus.thing(source=source, index=index)
+                for index in range(self.items_per_listing)
+            ]
+            if sort in ("top", "controversial") and timeframe in TIMEFRAME_SECONDS:
+                oldest: float = self.corpus.created_at - TIMEFRAME_SECONDS[timeframe]
+                things = [
+                    thing for thing in things if thing["data"]["created"] >= oldest
+                ]
+
+            def score(thing: Dict) -> float:
+                return thing["data"].get("score", 0)
+
+            def age(thing: Dict) -> float:
+                return (
+                    max(self.corpus.created_at - thing["data"]["created"], 0.0) / 3600
+                    + 2
+                )
+
+            sort_keys = {
+                "top": lambda thing: -score(thing),
+                "controversial": lambda thing: -thing["data"].get("num_comments", 0)
+                / (abs(score(thing)) + 1),
+                "rising": lambda thing: -score(thing) / age(thing) ** 3,
+            }
+            # Anything else is ranked like "hot", which favours high scores on recent items.
+            sort_key = sort_keys.get(
+                sort, lambda thing: -score(thing) / age(thing) ** 1.5
+            )
+
+            # Only the order is kept, the items of each page are generated again when they are served.
+            order: List[int] = [
+                self._index(source=source, name=self.corpus.fullname(thing))
+                for thing in sorted(things, key=sort_key)
+            ][: self.listing_cap]
+
+            return order, {index: position for position, index in enumerate(order)}
+
+        return self._cached(
+            key=("order", f"{source}|{sort}|{timeframe}"), make=make_order
+        )
+
+    def _lookup_post(self, post_id: str, subreddit: Optional[str] = None) -> Dict:
+        # Posts from a listing that has been served are generated again exactly as they were listed.
+        source_hash, index = self.corpus.split_id(post_id) or (-1, -1)
+        source: Optional[str] = self._sources.get(source_hash)
+        if source is not None:
+            thing: Dict = self.corpus.thing(source=source, index=index)
+            if thing["kind"] == "t3":
+                return thing
+
+        if post_id not in self._posts:
+            self._posts[post_id] = self.corpus.post_by_id(
+                post_id=post_id, subreddit=subreddit
+            )
+
+        return self._posts[post_id]
+
+    def _post_with_comments(
+        self, post_id: str, query: Dict[str, str], subreddit: Optional[str] = None
+    ) -> List[Dict]:
+        post: Dict = self._lookup_post(post_id=post_id, subreddit=subreddit)
+        comments, children = self._comment_tree(post=post["data"])
+        try:
+            limit: int = int(query.get("limit", 200))
+        except ValueError:
+            limit = 200
+
+        return self.corpus.comments_page(
+            post=post,
+            comments=comments,
+            children=children,
+            limit=max(min(limit, 500), 1),
+        )
+
+    def _lookup_thing(self, fullname: str) -> Optional[Dict]:
+        # Like Reddit, anything that cannot be found is left out rather than failing the request.
+        kind, _, thing_id = fullname.partition("_")
+        source_hash, index = self.corpus.split_id(thing_id) or (-1, -1)
+
+        if kind == "t1" and source_hash in self._threads:
+            post: Dict = self._lookup_post(post_id=self._threads[source_hash])
+            comments, _ = self._comment_tree(post=post["data"])
+            return comments.get(thing_id)
+        if kind == "t5" and thing_id in self._subreddits:
+            return self.corpus.subreddit(name=self._subreddits[thing_id])
+        if source_hash in self._sources:
+            thing: Dict = self.corpus.thing(
+                source=self._sources[source_hash], index=index
+            )
+            if self.corpus.fullname(thing) == fullname:
+                return thing
+        if kind == "t3":
+            return self._lookup_post(post_id=thing_id)
+
+        return None
+
+    def _comment_tree(self, post: Dict) -> Tuple[Dict[str, Dict], Dict[str, List[str]]]:
+        self._threads[self.corpus.source_hash(f"comment:{post['id']}")] = post["id"]
+        return self._cached(
+            key=("comments", post["id"]), make=lambda: self.corpus.comment_tree(post)
+        )
+
+    def _more_children(self, query: Dict[str, str]) -> Optional[Dict]:
+        link_id: str = query.get("link_id", "")
+        if not link_id.startswith("t3_"):
+            return None
+
+        post: Dict = self._lookup_post(post_id=link_id[3:])
+        comments, _ = self._comment_tree(post=post["data"])
+
+        return self.corpus.more_children(
+            comments=comments,
+            children=[child for child in query.get("children", "").split(",") if child][
+                :MORE_CHILDREN_CAP
+            ],
+        )
+
+    def _cached(self, key: Tuple[str, str], make: Callable):
+        # Generating a listing or comment tree is costly, so keep the most recently used ones around.
+        if key in self._generated:
+            self._generated.move_to_end(key)
+        else:
+            self._generated[key] = make()
+            if len(self._generated) > 256:
+                self._generated.popitem(last=False)
+
+        return self._generated[key]
+
+    def _index(self, source: str, name: str) -> Optional[int]:
+        source_hash, index = self.corpus.split_id(name) or (-1, -1)
+        if source_hash != self.corpus.source_hash(source):
+            return None
+
+        return index
+
+    def _is_taken(self, username: str) -> bool:
+        # Generated authors, and a few well-known accounts, are registered; every other name is free.
+        return username.lower() in ("automoderator", "reddit", "spez") or bool(
+            re.fullmatch(r"user_\d+", username)
+        )
+
+    @staticmethod
+    def _timestamp(created: float) -> str:
+        return time.strftime("%Y-%m-%dT%H:%M:%S.000Z", time.gmtime(created))
+
+
+def main(arguments: Optional[Iterable[str]] = None):
+    """
+    Runs the fake Reddit server from the command line, e.g. `python -m knewkarma.tools.fake_reddit`.
+    """
+
+    parser = argparse.ArgumentParser(
+        description=FakeReddit.__doc__.split("\n\n")[0].strip()
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--items-per-listing", type=int, default=1500)
+    parser.add_argument("--comments-per-post", type=int, default=50)
+    parser.add_argument(
+        "--no-listing-cap", action="store_true", help="serve listings past 1,000 items"
+    )
+    parser.add_argument("--rate-limit", type=int, default=1000)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--latency-jitter", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--client-id", default="client-id")
+    parser.add_argument("--client-secret", default="client-secret")
+    parser.add_argument(
+        "--oauth-rate-limit",
+        type=int,
+        help="requests per window for requests made with an access token",
+    )
+    parser.add_argument(
+        "--require-oauth",
+        action="store_true",
+        help="reject requests without an access token",
+    )
+    options = parser.parse_args(arguments)
+
+    async def serve():
+        server = FakeReddit(
+            seed=options.seed,
+            items_per_listing=options.items_per_listing,
+            comments_per_post=options.comments_per_post,
+            listing_cap=None if options.no_listing_cap else LISTING_CAP,
+            rate_limit=options.rate_limit,
+            latency=options.latency,
+            latency_jitter=options.latency_jitter,
+            error_rate=options.error_rate,
+            client_id=options.client_id,
+            client_secret=options.client_secret,
+            oauth_rate_limit=options.oauth_rate_limit,
+            require_oauth=options.require_oauth,
+        )
+        url: str = await server.start(host=options.host, port=options.port)
+        print(f"Serving a fake Reddit on {url} (press Ctrl+C to stop)")
+        try:
+            await asyncio.Event().wait()
+        finally:
+            await server.stop()
+
+    try:
+        asyncio.run(serve())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
+
+# -------------------------------- END ----------------------------------------- #
@@ -0,0 +1,261 @@
+import os
+import tempfile
+import time
+from typing import Callable, Iterable, Literal, Optional, Dict, List, Tuple
+
+from aiohttp import web
+
+__all__ = ["MetricsRegistry", "METRICS"]
+
+# Metrics that can be recorded, as name: (type, help text).
+METRICS: Dict[str, Tuple[Literal["counter", "gauge"], str]] = {
+    "knewkarma_requests_total": (
+        "counter",
+        "HTTP requests sent, by endpoint kind and response status.",
+    ),
+    "knewkarma_rate_limited_total": (
+        "counter",
+        "Requests that were rejected with 429 Too Many Requests.",
+    ),
+    "knewkarma_retries_total": ("counter", "Failed requests that were retried."),
+    "knewkarma_circuit_breaker_trips_total": (
+        "counter",
+        "Times a host's circuit breaker opened.",
+    ),
+    "knewkarma_cache_lookups_total": (
+        "counter",
+        "Response cache lookups, by result (hit, stale, revalidated or miss).",
+    ),
+    "knewkarma_cache_hit_ratio": (
+        "gauge",
+        "Share of response cache lookups that were served without downloading the response again.",
+    ),
+    "knewkarma_entity_cache_lookups_total": (
+        "counter",
+        "Entity cache lookups, by result (hit or miss).",
+    ),
+    "knewkarma_items_total": ("counter", "Items fetched, by listing."),
+    "knewkarma_items_per_second": (
+        "gauge",
+        "Items fetched per second since the first item of the listing, by listing.",
+    ),
+    "knewkarma_requests_in_flight": (
+        "gauge",
+        "Requests that have been sent and are waiting for a response.",
+    ),
+    "knewkarma_coalesced_requests_in_flight": (
+        "gauge",
+        "Distinct in-flight requests that identical requests are waiting on.",
+    ),
+    "knewkarma_rate_limit_remaining": (
+        "gauge",
+        "Requests left in the current rate-limit window.",
+    ),
+    "knewkarma_exported_rows_total": ("counter", "Rows exported, by file format."),
+    "knewkarma_export_seconds_total": (
+        "counter",
+        "Seconds spent exporting data, by file format.",
+    ),
+    "process_resident_memory_bytes": ("gauge", "Resident memory size in bytes."),
+    "process_max_resident_memory_bytes": (
+        "gauge",
+        "Peak resident memory size in bytes.",
+    ),
+    "process_uptime_seconds": (
+        "gauge",
+        "Seconds since the metrics registry was created.",
+    ),
+}
+
+# A sample yielded by a collector: metric name, value, and labels.
+SAMPLE = Tuple[str, float, Dict[str, str]]
+
+
+class MetricsRegistry:
+    """
+    A registry of counters and gauges that renders them in the Prometheus text exposition format.
+
+    Values are either recorded as they happen (`inc()` and `set()`), or sampled when the metrics are
+    rendered by collectors (see `add_collector()`). The rendered metrics can be served on a local
+    `/metrics` endpoint (see `serve()`) and written to a file (see `dump()`).
+    """
+
+    def __init__(self):
+        self._created_at: float = time.monotonic()
+        self._samples: Dict[str, Dict[Tuple[Tuple[str, str], ...], float]] = {
+            name: {} for name in METRICS
+        }
+        self._collectors: List[Callable[[], Iterable[SAMPLE]]] = [self._process_samples]
+        self._runner: Optional[web.AppRunner] = None
+
+    def inc(self, name: str, value: float = 1.0, **labels: str):
+        """
+        Increments a counter.
+
+        :param name: Name of the counter (see `METRICS`).
+        :type name: str
+        :param value: Amount to increment the counter by. Defaults to 1.0.
+        :type value: float
+        :param labels: Labels of the counter's series.
+        :type labels: str
+        """
+
+        key = self._labels_key(labels=labels)
+        self._samples[name][key] = self._samples[name].get(key, 0.0) + value
+
+    def set(self, name: str, value: float, **labels: str):
+        """
+        Sets a gauge.
+
+        :param name: Name of the gauge (see `METRICS`).
+        :type name: str
+        :param value: Value of the gauge.
+        :type value: float
+        :param labels: Labels of the gauge's series.
+        :type labels: str
+        """
+
+        self._samples[name][self._labels_key(labels=labels)] = value
+
+    def value(self, name: str, **labels: str) -> float:
+        """
+        Gets the recorded value of a metric's series.
+
+        :param name: Name of the metric (see `METRICS`).
+        :type name: str
+        :param labels: Labels of the series.
+        :type labels: str
+        :return: The series' value, or 0.0 if it has not been recorded.
+        :rtype: float
+        """
+
+        return self._samples[name].get(self._labels_key(labels=labels), 0.0)
+
+    def add_collector(self, collector: Callable[[], Iterable[SAMPLE]]):
+        """
+        Adds a collector, which is called to sample metrics whenever they are rendered.
+
+        :param collector: A callable that yields `(name, value, labels)` samples.
+        :type collector: Callable[[], Iterable[Tuple[str, float, Dict[str, str]]]]
+        """
+
+        self._collectors.append(collector)
+
+    def render(self) -> str:
+        """
+        Renders every metric in the Prometheus text exposition format.
+
+        :return: The rendered metrics.
+        :rtype: str
+        """
+
+        samples: Dict[str, Dict[Tuple[Tuple[str, str], ...], float]] = {
+            name: dict(series) for name, series in self._samples.items()
+        }
+        for collector in self._collectors:
+            for name, value, labels in collector():
+                samples[name][self._labels_key(labels=labels)] = value
+
+        lines: List[str] = []
+        for name, (metric_type, description) in METRICS.items():
+            if not samples[name]:
+                continue
+
+            lines.append(f"# HELP {name} {description}")
+            lines.append(f"# TYPE {name} {metric_type}")
+            for key, value in sorted(samples[name].items()):
+                labels: str = ",".join(
+                    f'{label}="{self._escape(text=label_value)}"'
+                    for label, label_value in key
+                )
+                rendered_value: str = (
+                    str(int(value)) if float(value).is_integer() else repr(float(value))
+                )
+                lines.append(
+                    f"{name}{{{labels}}} {rendered_value}"
+                    if labels
+                    else f"{name} {rendered_value}"
+                )
+
+        return "\n".join(lines) + "\n"
+
+    def dump(self, path: str):
+        """
+        Writes the rendered metrics to a file (e.g. for the node exporter's textfile collector).
+
+        :param path: Path of the file to write.
+        :type path: str
+        """
+
+        directory: str = os.path.dirname(os.path.abspath(path))
+        descriptor, temporary_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        with os.fdopen(descriptor, "w", encoding="utf-8") as metrics_file:
+            metrics_file.write(self.render())
+        os.replace(temporary_path, path)
+
+    async def serve(self, port: int, host: str = "127.0.0.1"):
+        """
+        Asynchronously starts serving the metrics on `http://<host>:<port>/metrics`.
+
+        :param port: Port to listen on.
+        :type port: int
+        :param host: Address to listen on. Defaults to "127.0.0.1".
+        :type host: str
+        """
+
+        async def metrics_handler(request: web.Request) -> web.Response:
+            return web.Response(
+                text=self.render(),
+                content_type="text/plain",
+                headers={"X-Content-Type-Options": "nosniff"},
+            )
+
+        application = web.Application()
+        application.router.add_get("/metrics", metrics_handler)
+
+        self._runner = web.AppRunner(application, access_log=None)
+        await self._runner.setup()
+        await web.TCPSite(self._runner, host=host, port=port).start()
+
+    async def stop(self):
+        """
+        Asynchronously stops serving the metrics.
+        """
+
+        if self._runner:
+            await self._runner.cleanup()
+            self._runner = None
+
+    def _process_samples(self) -> Iterable[SAMPLE]:
+        yield "process_uptime_seconds", time.monotonic() - self._created_at, {}
+
+        try:
+            import resource
+
+            # Linux reports the peak in kilobytes, macOS in bytes.
+            max_rss: int = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+            yield "process_max_resident_memory_bytes", max_rss * (
+                1 if os.uname().sysname == "Darwin" else 1024
+            ), {}
+        except ImportError:
+            pass
+
+        try:
+            with open("/proc/self/statm") as statm:
+                resident_pages: int = int(statm.read().split()[1])
+            yield "process_resident_memory_bytes", resident_pages * os.sysconf(
+                "SC_PAGE_SIZE"
+            ), {}
+        except (OSError, ValueError, IndexError):
+            pass
+
+    @staticmethod
+    def _labels_key(labels: Dict[str, str]) -> Tuple[Tuple[str, str], ...]:
+        return tuple(sorted((label, str(value)) for label, value in labels.items()))
+
+    @staticmethod
+    def _escape(text: str) -> str:
+        return text.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+# -------------------------------- END ----------------------------------------- #
@@ -1,5 +1,7 @@
 import os
-from datetime import datetime
+import re
+import time
+from datetime import datetime, timezone
 from typing import Union, List, Optional
 
 from rich.box import DOUBLE
@@ -11,9 +13,13 @@ from .shared import console, notify
 __all__ = [
     "filename_timestamp",
     "make_panel",
+    "parse_time_bound",
     "pathfinder",
 ]
 
+# Seconds in each unit of a relative time bound, e.g. "6h".
+TIME_UNITS: dict[str, int] = {"s": 1, "m": 60, "h": 3600, "d": 86400, "w": 604800}
+
 
 def make_panel(
     title: str,
@@ -65,6 +71,39 @@ def filename_timestamp() -> str:
     )
 
 
+def parse_time_bound(value: str, now: Optional[float] = None) -> float:
+    """
+    Converts a time bound (e.g. of `--since`) to a Unix timestamp.
+
+    :param value: A Unix timestamp ("1700000000"), an ISO 8601 date or datetime ("2024-05-01T12:00:00",
+        in UTC unless it has an offset), or a time relative to `now` ("30m", "6h", "2d" or "1w").
+    :type value: str
+    :param now: Unix time that relative bounds count back from. Defaults to None (the current time).
+    :type now: Optional[float]
+    :return: The Unix timestamp.
+    :rtype: float
+    :raise ValueError: If the value is not in any of the supported formats.
+    """
+
+    value = value.strip()
+    if re.fullmatch(r"\d+(\.\d+)?", value):
+        return float(value)
+
+    relative = re.fullmatch(r"(\d+(?:\.\d+)?)\s*([smhdw])", value.lower())
+    if relative:
+        return (time.time() if now is None else now) - float(
+            relative.group(1)
+        ) * TIME_UNITS[relative.group(2)]
+
+    # Python 3.10 does not read a "Z" suffix as UTC.
+    moment = datetime.fromisoformat(
+        value[:-1] + "+00:00" if value.endswith(("Z", "z")) else value
+    )
+    return (
+        moment if moment.tzinfo else moment.replace(tzinfo=timezone.utc)
+    ).timestamp()
+
+
 def pathfinder(directories: Union[List[str], str]):
     """
     Creates directories for exported data (`exported`).
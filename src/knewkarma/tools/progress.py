@@ -0,0 +1,188 @@
+import json
+import time
+from typing import Optional, IO, Union
+
+from rich.status import Status
+
+from .terminal import Notify, Style
+
+__all__ = ["ProgressSink", "RichProgress", "JsonLinesProgress"]
+
+
+class ProgressSink:
+    """
+    Receives progress events from `Api`, e.g. to display or log how far a long crawl has got.
+
+    This base class ignores every event, so it doubles as the sink for runs without a terminal.
+    Subclasses override the events they are interested in. Events are emitted from the event loop,
+    so handlers should return quickly.
+    """
+
+    def page_fetched(self, endpoint: str, count: int):
+        """
+        Called after a page of a paginated request has been fetched.
+
+        :param endpoint: The endpoint the page was fetched from.
+        :type endpoint: str
+        :param count: Number of items on the page.
+        :type count: int
+        """
+
+    def items_so_far(self, count: int, limit: int):
+        """
+        Called with the running total of items of a paginated request.
+
+        :param count: Number of items fetched so far.
+        :type count: int
+        :param limit: Number of items the request paginates to.
+        :type limit: int
+        """
+
+    def sleeping_until(self, until: float, reason: str):
+        """
+        Called when requests are held back, e.g. because the rate-limit budget has been spent.
+
+        :param until: Time (as a Unix timestamp) at which requests resume.
+        :type until: float
+        :param reason: Why requests are held back, e.g. "rate_limit" or "retry".
+        :type reason: str
+        """
+
+    def retrying(self, endpoint: str, attempt: int, delay: float, error: BaseException):
+        """
+        Called when a failed request is about to be retried.
+
+        :param endpoint: The endpoint of the failed request.
+        :type endpoint: str
+        :param attempt: Number of the upcoming attempt (the first retry is attempt 2).
+        :type attempt: int
+        :param delay: Seconds until the request is retried.
+        :type delay: float
+        :param error: The error the request failed with.
+        :type error: BaseException
+        """
+
+    def close(self):
+        """
+        Releases any resources held by the sink.
+        """
+
+
+class RichProgress(ProgressSink):
+    """
+    Renders progress events in a `rich.status.Status`.
+
+    The status text is only replaced at most once every `min_interval` seconds. The countdown while
+    requests are held back is worked out whenever rich refreshes the status, so it keeps ticking
+    without any redraws of its own.
+    """
+
+    def __init__(self, status: Status, min_interval: float = 0.1):
+        """
+        Initialises a `RichProgress` instance.
+
+        :param status: The `rich.status.Status` to render progress in.
+        :type status: rich.status.Status
+        :param min_interval: Minimum number of seconds between status text updates. Defaults to 0.1.
+        :type min_interval: float
+        """
+
+        self._status = status
+        self._notify = Notify(console=status.console)
+        self._min_interval = min_interval
+        self._updated_at: float = 0.0
+        self._count: int = 0
+        self._limit: int = 0
+        self._resumes_at: float = 0.0
+
+    def __rich__(self) -> str:
+        text: str = (
+            f"{Style.cyan}{self._count}{Style.reset} (of {Style.cyan}{self._limit}{Style.reset}) "
+            f"items retrieved so far."
+        )
+        remaining_time: float = self._resumes_at - time.time()
+        if remaining_time > 0:
+            text += (
+                f" Resuming in {Style.cyan}{remaining_time:.1f}{Style.reset} seconds"
+            )
+
+        return text
+
+    def items_so_far(self, count: int, limit: int):
+        self._count, self._limit = count, limit
+        self._update()
+
+    def sleeping_until(self, until: float, reason: str):
+        self._resumes_at = max(self._resumes_at, until)
+        self._update(force=True)
+
+    def retrying(self, endpoint: str, attempt: int, delay: float, error: BaseException):
+        self._notify.warning(
+            f"Request to {endpoint} failed ({type(error).__name__}: {error or 'no details'}), "
+            f"retrying in {delay:.1f}s (attempt {attempt})"
+        )
+
+    def _update(self, force: bool = False):
+        now: float = time.monotonic()
+        if force or now - self._updated_at >= self._min_interval:
+            self._updated_at = now
+            self._status.update(self)
+
+
+class JsonLinesProgress(ProgressSink):
+    """
+    Writes progress events as JSON lines, for runs without a terminal.
+
+    Each line is an object with the `event` name, the `time` it was emitted at (as a Unix timestamp),
+    and the event's arguments.
+    """
+
+    def __init__(self, file: Optional[IO[str]] = None, path: Optional[str] = None):
+        """
+        Initialises a `JsonLinesProgress` instance.
+
+        :param file: A text stream to write events to. Defaults to None.
+        :type file: Optional[IO[str]]
+        :param path: Path of a file to append events to, if no `file` is given. Defaults to None.
+        :type path: Optional[str]
+        """
+
+        if file is None and path is None:
+            raise ValueError("Either a file or a path is required.")
+
+        self._owns_file: bool = file is None
+        self._file: IO[str] = file or open(path, "a", encoding="utf-8")
+
+    def page_fetched(self, endpoint: str, count: int):
+        self._write(event="page_fetched", endpoint=endpoint, count=count)
+
+    def items_so_far(self, count: int, limit: int):
+        self._write(event="items_so_far", count=count, limit=limit)
+
+    def sleeping_until(self, until: float, reason: str):
+        self._write(event="sleeping_until", until=until, reason=reason)
+
+    def retrying(self, endpoint: str, attempt: int, delay: float, error: BaseException):
+        self._write(
+            event="retrying",
+            endpoint=endpoint,
+            attempt=attempt,
+            delay=delay,
+            error=f"{type(error).__name__}: {error}",
+        )
+
+    def close(self):
+        if self._owns_file:
+            self._file.close()
+        else:
+            self._file.flush()
+
+    def _write(self, event: str, **fields: Union[str, int, float]):
+        self._file.write(
+            json.dumps({"event": event, "time": time.time(), **fields}, default=str)
+            + "\n"
+        )
+        self._file.flush()
+
+
+# -------------------------------- END ----------------------------------------- #
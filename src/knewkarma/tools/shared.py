@@ -4,12 +4,14 @@ from platform import python_version, platform
 from rich.console import Console
 
 from .terminal import Notify, Style
+from .cache import EntityCache
 from ..api import Api, SORT_CRITERION, TIMEFRAME, TIME_FORMAT
 from ..meta import about, version
 
 __all__ = [
     "api",
     "console",
+    "CACHE_DIR",
     "OUTPUT_PARENT_DIR",
     "notify",
     "style",
@@ -23,6 +25,7 @@ api = Api(
         "User-Agent": f"{about.name.replace(' ', '-')}/{version.release} "
         f"(Python {python_version} on {platform}; +{about.documentation})"
     },
+    entity_cache=EntityCache(),
 )
 
 console = Console(log_time=False)
@@ -32,3 +35,4 @@ style = Style
 
 OUTPUT_PARENT_DIR: str = os.path.expanduser(os.path.join("~", "knewkarma"))
 ML_MODELS_DIR: str = os.path.join(OUTPUT_PARENT_DIR, "ml_models")
+CACHE_DIR: str = os.path.join(OUTPUT_PARENT_DIR, "cache")
@@ -0,0 +1,196 @@
+import json
+import os
+import tempfile
+import time
+from types import SimpleNamespace
+from typing import Iterable, Optional, Dict
+from urllib.parse import urlencode, urlparse
+
+__all__ = ["SyncState"]
+
+# Request parameters that change from page to page (or run to run) without changing the listing.
+PAGINATION_PARAMS: tuple[str, ...] = ("after", "before", "count", "limit", "raw_json")
+
+
+class SyncState:
+    """
+    High-water marks of listings, so that scheduled runs only fetch the items that are new since the
+    last run.
+
+    A listing's mark is the fullname and `created_utc` of the newest item seen in it. On a later run,
+    items at or below the mark are left out, and listings sorted by "new" stop paginating as soon as
+    they reach one. Marks are kept in a single JSON file, which is replaced atomically.
+    """
+
+    def __init__(self, path: str):
+        """
+        Initialises a `SyncState` instance, loading its marks from `path` if the file exists.
+
+        :param path: Path of the JSON file to keep marks in.
+        :type path: str
+        """
+
+        directory: str = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+
+        self._path = path
+        self._marks: Dict[str, Dict] = {}
+        try:
+            with open(path, encoding="utf-8") as state_file:
+                self._marks = json.load(state_file)
+        except (OSError, ValueError):
+            pass
+
+    @property
+    def path(self) -> str:
+        """Path of the JSON file that marks are kept in."""
+
+        return self._path
+
+    @staticmethod
+    def key(endpoint: str, params: Optional[Dict] = None) -> str:
+        """
+        Makes a listing's key from its endpoint and parameters, e.g. "/r/python.json?sort=new&t=all".
+
+        The host and pagination parameters are left out, so that a listing keeps its mark when it is
+        requested through another host (e.g. `OAUTH_URL`) or with another limit.
+
+        :param endpoint: The listing's endpoint.
+        :type endpoint: str
+        :param params: Request parameters of the listing's first page. Defaults to None.
+        :type params: Optional[Dict]
+        :return: The listing's key.
+        :rtype: str
+        """
+
+        query: str = urlencode(
+            sorted(
+                (name, value)
+                for name, value in (params or {}).items()
+                if name not in PAGINATION_PARAMS and value is not None
+            )
+        )
+        return (
+            f"{urlparse(endpoint).path}?{query}" if query else urlparse(endpoint).path
+        )
+
+    def mark(self, key: str) -> Optional[SimpleNamespace]:
+        """
+        Gets a listing's high-water mark.
+
+        :param key: Key of the listing (see `key()`).
+        :type key: str
+        :return: A `SimpleNamespace` with the `fullname` and `created_utc` of the newest item seen in the
+            listing, or None if it has not been synced yet.
+        :rtype: Optional[SimpleNamespace]
+        """
+
+        mark: Optional[Dict] = self._marks.get(key)
+        if not mark:
+            return None
+
+        return SimpleNamespace(
+            fullname=mark.get("fullname"), created_utc=mark.get("created_utc", 0.0)
+        )
+
+    @staticmethod
+    def is_seen(mark: Optional[SimpleNamespace], item: Dict) -> bool:
+        """
+        Checks whether an item is at or below a high-water mark.
+
+        :param mark: The mark (see `mark()`), or None.
+        :type mark: Optional[SimpleNamespace]
+        :param item: The item, as a thing (with its "kind" and "data").
+        :type item: Dict
+        :return: True if the item is the marked item, or older than it.
+        :rtype: bool
+        """
+
+        if mark is None:
+            return False
+
+        data: Dict = item.get("data", {})
+        # Items created in the same second as the marked one are only seen if they are that item.
+        return (
+            data.get("name") == mark.fullname
+            or data.get("created_utc", 0.0) < mark.created_utc
+        )
+
+    @staticmethod
+    def newest(items: Iterable[Dict]) -> Optional[Dict]:
+        """
+        Finds the most recently created of some items.
+
+        :param items: The items, as things (with their "kind" and "data").
+        :type items: Iterable[Dict]
+        :return: The newest item (the first of them, if several were created at the same time),
+            or None if there are none.
+        :rtype: Optional[Dict]
+        """
+
+        newest_item: Optional[Dict] = None
+        for item in items:
+            if newest_item is None or item.get("data", {}).get(
+                "created_utc", 0.0
+            ) > newest_item.get("data", {}).get("created_utc", 0.0):
+                newest_item = item
+
+        return newest_item
+
+    def advance(self, key: str, item: Dict):
+        """
+        Moves a listing's high-water mark up to an item, unless the mark is already newer.
+
+        :param key: Key of the listing (see `key()`).
+        :type key: str
+        :param item: The newest item fetched from the listing, as a thing (with its "kind" and "data").
+        :type item: Dict
+        """
+
+        data: Dict = item.get("data", {})
+        mark: Optional[SimpleNamespace] = self.mark(key=key)
+        if mark and data.get("created_utc", 0.0) < mark.created_utc:
+            return
+
+        self._marks[key] = {
+            "fullname": data.get("name") or f"{item.get('kind')}_{data.get('id')}",
+            "created_utc": data.get("created_utc", 0.0),
+            "updated_at": time.time(),
+        }
+        self._write()
+
+    def forget(self, key: Optional[str] = None) -> int:
+        """
+        Removes a listing's mark, or every mark, so that the next run fetches the listing in full.
+
+        :param key: Key of the listing (see `key()`). Defaults to None (every listing).
+        :type key: Optional[str]
+        :return: Number of marks removed.
+        :rtype: int
+        """
+
+        keys = list(self._marks) if key is None else [key] if key in self._marks else []
+        for forgotten_key in keys:
+            del self._marks[forgotten_key]
+        if keys:
+            self._write()
+
+        return len(keys)
+
+    def _write(self):
+        # Write to a temporary file first, so that a crash never leaves a partially written state.
+        descriptor, temporary_path = tempfile.mkstemp(
+            dir=os.path.dirname(os.path.abspath(self._path)), suffix=".tmp"
+        )
+        try:
+            with os.fdopen(descriptor, "w", encoding="utf-8") as state_file:
+                json.dump(self._marks, state_file, indent=2, sort_keys=True)
+                state_file.flush()
+                os.fsync(state_file.fileno())
+            os.replace(temporary_path, self._path)
+        except BaseException:
+            os.remove(temporary_path)
+            raise
+
+
+# -------------------------------- END ----------------------------------------- #
@@ -0,0 +1,321 @@
+import json
+import math
+import time
+from collections import defaultdict
+from types import SimpleNamespace
+from typing import Optional, Dict, List, Union
+
+from aiohttp import TraceConfig
+from rich import box
+from rich.table import Table
+
+__all__ = ["RequestTrace", "RequestTracer", "LATENCY_BUCKETS"]
+
+# Upper bounds (in seconds) of the latency histogram buckets. Slower requests fall in an overflow bucket.
+LATENCY_BUCKETS: tuple[float, ...] = (0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class RequestTrace:
+    """
+    Timings of a single HTTP request, filled in by `RequestTracer`'s trace callbacks and by `Api`.
+
+    Each phase is a `time.perf_counter()` timestamp, recorded with `mark()` the first time it is reached.
+    """
+
+    def __init__(self, endpoint: str, kind: str):
+        """
+        Initialises a `RequestTrace` instance.
+
+        :param endpoint: The requested endpoint.
+        :type endpoint: str
+        :param kind: Kind of the requested endpoint (see `Api.endpoint_kind`).
+        :type kind: str
+        """
+
+        self.endpoint = endpoint
+        self.kind = kind
+        self.reused_connection: bool = False
+        self.size: int = 0
+        self.phases: Dict[str, float] = {"start": time.perf_counter()}
+
+    def mark(self, phase: str):
+        """
+        Records the time at which a phase of the request was reached.
+
+        :param phase: Name of the phase, e.g. "headers_received" or "body_read".
+        :type phase: str
+        """
+
+        self.phases.setdefault(phase, time.perf_counter())
+
+    def durations(self) -> Dict[str, float]:
+        """
+        Gets the number of seconds spent in each phase of the request.
+
+        :return: A dictionary with the seconds spent waiting for a pooled connection (`queued`), resolving
+            the host (`dns`), connecting (`connect`, including the TLS handshake), waiting for the response
+            headers after the request was sent (`ttfb`), downloading the body (`body`), decoding it
+            (`decode`), and in total (`total`). Phases that did not happen are left out.
+        :rtype: Dict[str, float]
+        """
+
+        phases: Dict[str, float] = self.phases
+        durations: Dict[str, float] = {}
+
+        def between(name: str, start: str, end: str):
+            if start in phases and end in phases:
+                durations[name] = max(phases[end] - phases[start], 0.0)
+
+        between("queued", "queued_start", "queued_end")
+        between("dns", "dns_start", "dns_end")
+        between("connect", "connect_start", "connect_end")
+        # Connection setup includes resolving the host, which is already accounted for.
+        if "connect" in durations:
+            durations["connect"] = max(
+                durations["connect"] - durations.get("dns", 0.0), 0.0
+            )
+        between("ttfb", "headers_sent", "headers_received")
+        between("body", "headers_received", "body_read")
+        between("decode", "body_read", "decoded")
+        durations["total"] = max(
+            phases.get("end", phases["start"]) - phases["start"], 0.0
+        )
+
+        return durations
+
+
+class RequestTracer:
+    """
+    Traces the requests sent through an `aiohttp.ClientSession`, using `aiohttp.TraceConfig`.
+
+    It records each request's phases (queueing, DNS, connect, time to first byte, body download and
+    decoding), status, size and endpoint kind, and keeps per-kind latency histograms. Every finished
+    request can also be written to a JSON-lines trace file.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        """
+        Initialises a `RequestTracer` instance.
+
+        :param path: Path of a file to append a JSON line to for every traced request. Defaults to None.
+        :type path: Optional[str]
+        """
+
+        self._file = open(path, "a", encoding="utf-8") if path else None
+        self._latencies: Dict[str, List[float]] = defaultdict(list)
+        self._phase_totals: Dict[str, Dict[str, float]] = defaultdict(
+            lambda: defaultdict(float)
+        )
+        self._sizes: Dict[str, int] = defaultdict(int)
+        self._errors: Dict[str, int] = defaultdict(int)
+
+    def trace_config(self) -> TraceConfig:
+        """
+        Makes a `TraceConfig` to attach to a session (`ClientSession(trace_configs=[...])`).
+
+        Only requests sent with a `RequestTrace` as their `trace_request_ctx` are traced.
+
+        :return: A `TraceConfig` whose callbacks record request phases.
+        :rtype: aiohttp.TraceConfig
+        """
+
+        trace_config = TraceConfig()
+
+        def marker(phase: str):
+            async def callback(session, trace_config_ctx: SimpleNamespace, params):
+                trace = trace_config_ctx.trace_request_ctx
+                if isinstance(trace, RequestTrace):
+                    trace.mark(phase=phase)
+
+            return callback
+
+        async def on_connection_reuseconn(session, trace_config_ctx, params):
+            trace = trace_config_ctx.trace_request_ctx
+            if isinstance(trace, RequestTrace):
+                trace.reused_connection = True
+
+        trace_config.on_connection_queued_start.append(marker("queued_start"))
+        trace_config.on_connection_queued_end.append(marker("queued_end"))
+        trace_config.on_dns_resolvehost_start.append(marker("dns_start"))
+        trace_config.on_dns_resolvehost_end.append(marker("dns_end"))
+        trace_config.on_connection_create_start.append(marker("connect_start"))
+        trace_config.on_connection_create_end.append(marker("connect_end"))
+        trace_config.on_connection_reuseconn.append(on_connection_reuseconn)
+        trace_config.on_request_headers_sent.append(marker("headers_sent"))
+        trace_config.on_request_end.append(marker("headers_received"))
+
+        return trace_config
+
+    @staticmethod
+    def start(endpoint: str, kind: str) -> RequestTrace:
+        """
+        Starts tracing a request.
+
+        :param endpoint: The requested endpoint.
+        :type endpoint: str
+        :param kind: Kind of the requested endpoint (see `Api.endpoint_kind`).
+        :type kind: str
+        :return: A `RequestTrace` to send as the request's `trace_request_ctx`.
+        :rtype: RequestTrace
+        """
+
+        return RequestTrace(endpoint=endpoint, kind=kind)
+
+    def finish(
+        self,
+        trace: RequestTrace,
+        status: int,
+        error: Optional[BaseException] = None,
+    ):
+        """
+        Finishes tracing a request, adding it to the histograms and the trace file.
+
+        :param trace: The request's trace.
+        :type trace: RequestTrace
+        :param status: HTTP status code of the response, or 0 if none was received.
+        :type status: int
+        :param error: The error the request failed with, if any. Defaults to None.
+        :type error: Optional[BaseException]
+        """
+
+        trace.mark(phase="end")
+        durations: Dict[str, float] = trace.durations()
+
+        self._latencies[trace.kind].append(durations["total"])
+        for phase, duration in durations.items():
+            self._phase_totals[trace.kind][phase] += duration
+        self._sizes[trace.kind] += trace.size
+        if error is not None or not 200 <= status < 400:
+            self._errors[trace.kind] += 1
+
+        if self._file:
+            self._file.write(
+                json.dumps(
+                    {
+                        "time": time.time(),
+                        "endpoint": trace.endpoint,
+                        "kind": trace.kind,
+                        "status": status,
+                        "bytes": trace.size,
+                        "reused_connection": trace.reused_connection,
+                        "error": f"{type(error).__name__}: {error}" if error else None,
+                        **{
+                            f"{phase}_ms": duration * 1000
+                            for phase, duration in durations.items()
+                        },
+                    }
+                )
+                + "\n"
+            )
+
+    def summary(self) -> Dict[str, Dict[str, Union[int, float, List[int]]]]:
+        """
+        Gets the latency statistics of the traced requests, per endpoint kind.
+
+        :return: A dictionary mapping each endpoint kind to its number of `requests` and `errors`, total
+            `bytes`, latency percentiles (`p50`, `p95`, `p99` and `max`, in seconds), mean seconds per
+            phase (`phases`), and request counts per bucket of `LATENCY_BUCKETS` (`histogram`, with a
+            final overflow bucket).
+        :rtype: Dict[str, Dict[str, Union[int, float, List[int]]]]
+        """
+
+        summary: Dict = {}
+        for kind, latencies in sorted(self._latencies.items()):
+            latencies = sorted(latencies)
+            histogram: List[int] = [0] * (len(LATENCY_BUCKETS) + 1)
+            for latency in latencies:
+                histogram[
+                    next(
+                        (
+                            index
+                            for index, bound in enumerate(LATENCY_BUCKETS)
+                            if latency <= bound
+                        ),
+                        len(LATENCY_BUCKETS),
+                    )
+                ] += 1
+
+            summary[kind] = {
+                "requests": len(latencies),
+                "errors": self._errors[kind],
+                "bytes": self._sizes[kind],
+                "p50": self._percentile(latencies, 50),
+                "p95": self._percentile(latencies, 95),
+                "p99": self._percentile(latencies, 99),
+                "max": latencies[-1],
+                "phases": {
+                    phase: total / len(latencies)
+                    for phase, total in self._phase_totals[kind].items()
+                },
+                "histogram": histogram,
+            }
+
+        return summary
+
+    def table(self) -> Table:
+        """
+        Makes a table of the per-endpoint-kind latency histograms, for printing at the end of a session.
+
+        :return: A `rich.table.Table` with one row per endpoint kind.
+        :rtype: rich.table.Table
+        """
+
+        table = Table(title="Request Latency", box=box.ROUNDED)
+        table.add_column("Endpoint", style="cyan")
+        table.add_column("Requests", justify="right")
+        table.add_column("Errors", justify="right")
+        table.add_column("p50", justify="right")
+        table.add_column("p95", justify="right")
+        table.add_column("p99", justify="right")
+        table.add_column("DNS/Connect/TTFB/Body/Decode (mean)", justify="right")
+        table.add_column(
+            f"Histogram ({', '.join(f'≤{bound:g}s' for bound in LATENCY_BUCKETS)}, more)"
+        )
+
+        for kind, statistics in self.summary().items():
+            phases: Dict[str, float] = statistics["phases"]
+            table.add_row(
+                kind,
+                str(statistics["requests"]),
+                str(statistics["errors"]),
+                *[
+                    f"{statistics[percentile] * 1000:.0f} ms"
+                    for percentile in ("p50", "p95", "p99")
+                ],
+                "/".join(
+                    f"{phases.get(phase, 0.0) * 1000:.0f}"
+                    for phase in ("dns", "connect", "ttfb", "body", "decode")
+                )
+                + " ms",
+                self._sparkline(statistics["histogram"]),
+            )
+
+        return table
+
+    def close(self):
+        """
+        Closes the trace file, if any.
+        """
+
+        if self._file:
+            self._file.close()
+            self._file = None
+
+    @staticmethod
+    def _percentile(sorted_values: List[float], percentile: float) -> float:
+        index: int = round(percentile / 100 * (len(sorted_values) - 1))
+        return sorted_values[index]
+
+    @staticmethod
+    def _sparkline(histogram: List[int]) -> str:
+        bars: str = " ▁▂▃▄▅▆▇█"
+        peak: int = max(histogram) or 1
+        return (
+            "".join(
+                bars[math.ceil(count / peak * (len(bars) - 1))] for count in histogram
+            )
+            + f"  {histogram}"
+        )
+
+
+# -------------------------------- END ----------------------------------------- #
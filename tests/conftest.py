@@ -1,15 +1,27 @@
-import pytest
+from typing import AsyncIterator
 
-from knewkarma.api import Api
-from knewkarma.meta import about, version
+import pytest_asyncio
 
-api = Api(
-    headers={
-        "User-Agent": f"{about.name.replace(' ', '-')}/Testing-{version.release} "
-        f"(PyTest {pytest.__version__}; +{about.documentation})"
-    }
-)
+from knewkarma.api import Api, RetryPolicy
+from knewkarma.tools.fake_reddit import FakeReddit
 
 TEST_USERNAME: str = "AutoModerator"
 TEST_SUBREDDIT_1: str = "AskScience"
 TEST_SUBREDDIT_2: str = "AskReddit"
+
+
+@pytest_asyncio.fixture
+async def fake_reddit() -> AsyncIterator[FakeReddit]:
+    """Serves a local stand-in for Reddit, so that tests can run offline."""
+    async with FakeReddit(retry_after=0.1) as server:
+        yield server
+
+
+@pytest_asyncio.fixture
+async def offline_api(fake_reddit: FakeReddit) -> AsyncIterator[Api]:
+    """An `Api` that sends its requests to the `fake_reddit` server."""
+    async with Api(
+        base_url=fake_reddit.url,
+        retry_policy=RetryPolicy(base_delay=0.01, max_delay=0.1),
+    ) as offline:
+        yield offline
@@ -0,0 +1,1047 @@
+import asyncio
+import importlib.util
+import io
+import json
+import socket
+import sys
+import time
+from contextlib import aclosing
+from email.utils import formatdate
+from functools import partial
+from typing import List, Dict
+from urllib.parse import urlparse
+
+import aiohttp
+import pytest
+from click.testing import CliRunner
+
+from conftest import TEST_USERNAME, TEST_SUBREDDIT_1
+import knewkarma.cli as cli_module
+from knewkarma.api import (
+    Api,
+    CircuitBreaker,
+    ClientCredentials,
+    RetryPolicy,
+    BASE_URL,
+    OAUTH_URL,
+)
+from knewkarma.core import Posts, Subreddit
+from knewkarma.tools.benchmark import STAGES, run_benchmark
+from knewkarma.tools.cache import EntityCache, ResponseCache, RESPONSE_CACHE_TTLS
+from knewkarma.tools.cassette import Cassette
+from knewkarma.tools.checkpoint import CheckpointStore
+from knewkarma.tools.corpus import Corpus
+from knewkarma.tools.dedup import SeenSet
+from knewkarma.tools.fake_reddit import FakeReddit, LISTING_CAP
+from knewkarma.tools.metrics import MetricsRegistry
+from knewkarma.tools.miscellaneous import parse_time_bound
+from knewkarma.tools.progress import JsonLinesProgress
+from knewkarma.tools.sync import SyncState
+from knewkarma.tools.tracing import RequestTracer
+
+
+async def interrupted_crawl(api: Api, pages: int, **request) -> List[Dict]:
+    """Gets the first pages of a listing, then stops as if the crawl had been interrupted."""
+    items: List[Dict] = []
+    async with aclosing(api.iter_posts_or_comments(**request)) as listing:
+        async for page in listing:
+            items.extend(page)
+            pages -= 1
+            if not pages:
+                break
+
+    return items
+
+
+@pytest.mark.asyncio
+async def test_pooled_session_lifecycle(fake_reddit: FakeReddit):
+    """Tests that an `Api` opens one pooled session with its connector options, and closes it on exit."""
+    api = Api(base_url=fake_reddit.url, connector_options={"limit_per_host": 3})
+    with pytest.raises(RuntimeError):
+        api.session
+
+    async with api:
+        session: aiohttp.ClientSession = api.session
+        assert session.connector.limit_per_host == 3
+        await Subreddit(name=TEST_SUBREDDIT_1, api=api).posts(limit=200)
+        await api.get_entity(kind="user", username=TEST_USERNAME)
+        assert api.session is session
+
+    assert session.closed
+    with pytest.raises(RuntimeError):
+        api.session
+
+
+@pytest.mark.asyncio
+async def test_session_first_calls_are_deprecated(offline_api: Api):
+    """Tests that calls passing a session first, as the old signatures did, still work with a warning."""
+    subreddit = Subreddit(name=TEST_SUBREDDIT_1, api=offline_api)
+    async with aiohttp.ClientSession() as session:
+        with pytest.warns(DeprecationWarning):
+            posts = await subreddit.posts(session, 150, "new")
+        with pytest.warns(DeprecationWarning):
+            profile: Dict = await offline_api.get_entity(
+                session, "subreddit", subreddit=TEST_SUBREDDIT_1
+            )
+    with pytest.warns(DeprecationWarning):
+        endpoint: str = Api.endpoint("subreddit")
+
+    assert posts == await subreddit.posts(limit=150, sort="new")
+    assert profile["display_name"] == TEST_SUBREDDIT_1
+    assert endpoint == f"{BASE_URL}/r"
+
+
+@pytest.mark.asyncio
+async def test_responses_are_decoded_with_the_given_decoder(fake_reddit: FakeReddit):
+    """Tests that every response body is decoded with the `Api`'s `json_decoder`."""
+    decoded_bodies: List[bytes] = []
+
+    def json_decoder(body: bytes) -> Dict:
+        decoded_bodies.append(body)
+        return json.loads(body)
+
+    async with Api(base_url=fake_reddit.url, json_decoder=json_decoder) as api:
+        posts: List[Dict] = await api.get_posts_or_comments(
+            kind="posts_from_a_subreddit", subreddit=TEST_SUBREDDIT_1, limit=150
+        )
+
+    assert len(posts) == 150
+    assert len(decoded_bodies) == fake_reddit.request_count() == 2
+    assert all(isinstance(body, bytes) for body in decoded_bodies)
+
+
+def test_json_decoder_falls_back_to_the_standard_library(monkeypatch):
+    """Tests that responses are decoded with `json` when orjson is not installed."""
+    monkeypatch.setitem(sys.modules, "orjson", None)
+    spec = importlib.util.find_spec("knewkarma.api")
+    api_module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(api_module)
+
+    assert api_module.JSON_DECODER is json.loads
+    assert api_module.Api()._json_decoder(b'{"kind": "t3"}') == {"kind": "t3"}
+
+
+@pytest.mark.asyncio
+async def test_listing_pagination_stops_at_the_cap(
+    offline_api: Api, fake_reddit: FakeReddit
+):
+    """Tests that a listing is paginated to its end, without duplicates, and no further."""
+    subreddit_posts: List[Dict] = await offline_api.get_posts_or_comments(
+        kind="posts_from_a_subreddit",
+        subreddit=TEST_SUBREDDIT_1,
+        limit=LISTING_CAP + 500,
+    )
+
+    assert len(subreddit_posts) == LISTING_CAP
+    assert len({post["data"]["id"] for post in subreddit_posts}) == LISTING_CAP
+    assert all(
+        post["data"]["subreddit"] == TEST_SUBREDDIT_1 for post in subreddit_posts
+    )
+    # Pages hold up to 100 items each, and the last one has no `after` cursor.
+    assert fake_reddit.request_count(path=f"/r/{TEST_SUBREDDIT_1}") == 10
+
+
+@pytest.mark.asyncio
+async def test_comments_expand_more_stubs(offline_api: Api, fake_reddit: FakeReddit):
+    """Tests that collapsed ("more") comments are expanded through /api/morechildren."""
+    fake_reddit.comments_per_post = 300
+    comments: List[Dict] = await offline_api.get_posts_or_comments(
+        kind="comments_from_a_post",
+        subreddit=TEST_SUBREDDIT_1,
+        id="abc123",
+        limit=200,
+    )
+
+    assert fake_reddit.request_count(path="/api/morechildren") > 0
+    assert 0 < len(comments) <= 200
+    assert all(comment["kind"] == "t1" for comment in comments)
+    assert len({comment["data"]["id"] for comment in comments}) == len(comments)
+
+
+@pytest.mark.asyncio
+async def test_subreddit_comments_skip_a_failed_post(
+    offline_api: Api, fake_reddit: FakeReddit
+):
+    """Tests that a post whose comments fail is skipped, and the rest keep the order of the posts."""
+    subreddit = Subreddit(name=TEST_SUBREDDIT_1, api=offline_api)
+    posts = await subreddit.posts(limit=5)
+    failed_post = posts[2].id
+    fake_reddit.fail_next(status=404, path=f"/comments/{failed_post}")
+
+    comments = await subreddit.comments(posts_limit=5, comments_per_post=10)
+
+    commented_posts: List[str] = []
+    for comment in comments:
+        post_id: str = comment.link_id.removeprefix("t3_")
+        if not commented_posts or commented_posts[-1] != post_id:
+            commented_posts.append(post_id)
+
+    assert commented_posts == [post.id for post in posts if post.id != failed_post]
+    assert len(comments) == 4 * 10
+
+
+@pytest.mark.asyncio
+async def test_listing_pages_are_streamed(offline_api: Api, fake_reddit: FakeReddit):
+    """Tests that each page is yielded as soon as it is fetched, up to `limit` items across pages."""
+    path: str = f"/r/{TEST_SUBREDDIT_1}"
+    requests_per_page: List[int] = []
+    page_sizes: List[int] = []
+    async for page in offline_api.iter_posts_or_comments(
+        kind="posts_from_a_subreddit", subreddit=TEST_SUBREDDIT_1, limit=250
+    ):
+        requests_per_page.append(fake_reddit.request_count(path=path))
+        page_sizes.append(len(page))
+
+    assert requests_per_page == [1, 2, 3]
+    assert page_sizes == [100, 100, 50]
+    assert fake_reddit.request_count(path=path) == 3
+
+
+@pytest.mark.asyncio
+async def test_breaking_out_of_a_stream_stops_pagination(
+    offline_api: Api, fake_reddit: FakeReddit
+):
+    """Tests that no more pages are requested once a caller stops iterating over a listing."""
+    posts: List = []
+    async with aclosing(
+        Subreddit(name=TEST_SUBREDDIT_1, api=offline_api).iter_posts(limit=500)
+    ) as stream:
+        async for post in stream:
+            posts.append(post)
+            if len(posts) == 150:
+                break
+    await asyncio.sleep(0.1)
+
+    assert len({post.id for post in posts}) == 150
+    assert fake_reddit.request_count(path=f"/r/{TEST_SUBREDDIT_1}") == 2
+
+
+@pytest.mark.asyncio
+async def test_interrupted_listing_resumes_from_its_checkpoint(
+    offline_api: Api, fake_reddit: FakeReddit, tmp_path
+):
+    """Tests that an interrupted listing resumes after its last saved page, and is then discarded."""
+    request: Dict = dict(
+        kind="posts_from_a_subreddit", subreddit=TEST_SUBREDDIT_1, limit=500
+    )
+    expected: List[Dict] = await offline_api.get_posts_or_comments(**request)
+
+    offline_api.checkpoints = CheckpointStore(directory=str(tmp_path))
+    interrupted: List[Dict] = await interrupted_crawl(offline_api, pages=2, **request)
+    offline_api.checkpoints.resume = True
+    requests_before: int = fake_reddit.request_count()
+
+    resumed: List[Dict] = await offline_api.get_posts_or_comments(**request)
+
+    assert interrupted == expected[:200]
+    assert resumed == expected
+    # Only the three pages after the checkpoint are requested again.
+    assert fake_reddit.request_count() - requests_before == 3
+    assert offline_api.checkpoints.clear() == 0
+
+
+def test_checkpoint_drops_an_incomplete_page(tmp_path):
+    """Tests that items written after a checkpoint's last complete page are not loaded."""
+    store = CheckpointStore(directory=str(tmp_path))
+    key: str = store.key(endpoint="/r/python.json", params={"sort": "new"}, limit=300)
+    pages: List[List[Dict]] = [
+        [{"kind": "t3", "data": {"id": f"{page}{item}"}} for item in range(3)]
+        for page in range(2)
+    ]
+    store.save(key=key, items=pages[0], after="t3_02", count=3)
+    store.save(key=key, items=pages[1], after="t3_12", count=6)
+    # A crash while the third page was written leaves a partial line behind.
+    with open(tmp_path / f"{key}.jsonl", "a", encoding="utf-8") as items_file:
+        items_file.write('{"kind": "t3", "da')
+
+    checkpoint = store.load(key=key)
+    store.save(key=key, items=pages[0], after="t3_02", count=9)
+
+    assert (checkpoint.after, checkpoint.count) == ("t3_12", 6)
+    assert checkpoint.items == pages[0] + pages[1]
+    assert store.load(key=key).items == pages[0] + pages[1] + pages[0]
+    assert store.clear() == 1
+    assert store.load(key=key) is None
+
+
+@pytest.mark.parametrize(
+    "flags, checkpointed", [([], False), (["--checkpoint"], True), (["--resume"], True)]
+)
+def test_cli_only_checkpoints_when_asked_to(monkeypatch, tmp_path, flags, checkpointed):
+    """Tests that the CLI only records checkpoints with `--checkpoint` or `--resume`."""
+    monkeypatch.setattr(cli_module, "CHECKPOINTS_DIR", str(tmp_path / "checkpoints"))
+    monkeypatch.setattr(
+        cli_module, "RESPONSE_CACHE_PATH", str(tmp_path / "responses.sqlite3")
+    )
+    monkeypatch.setattr(cli_module.api, "cache", None)
+    monkeypatch.setattr(cli_module.api, "checkpoints", None)
+
+    result = CliRunner().invoke(cli_module.cli, [*flags, "cache", "--stats"], obj={})
+
+    assert result.exit_code == 0, result.output
+    assert isinstance(cli_module.api.checkpoints, CheckpointStore) is checkpointed
+    assert (tmp_path / "checkpoints").exists() is checkpointed
+
+
+@pytest.mark.asyncio
+async def test_info_looks_up_fullnames_in_batches(
+    offline_api: Api, fake_reddit: FakeReddit
+):
+    """Tests that posts, comments and subreddits are looked up by fullname, in input order."""
+    subreddit_posts: List[Dict] = await offline_api.get_posts_or_comments(
+        kind="posts_from_a_subreddit", subreddit=TEST_SUBREDDIT_1, limit=250
+    )
+    comments: List[Dict] = await offline_api.get_posts_or_comments(
+        kind="comments_from_a_post", subreddit=TEST_SUBREDDIT_1, id="abc123", limit=10
+    )
+    subreddit_profile: Dict = await offline_api.get_entity(
+        kind="subreddit", subreddit=TEST_SUBREDDIT_1
+    )
+    fullnames: List[str] = [
+        comments[0]["data"]["name"],
+        *[post["data"]["name"] for post in reversed(subreddit_posts)],
+        subreddit_profile["name"],
+    ]
+
+    things: List[Dict] = await offline_api.get_info(fullnames=fullnames)
+    posts = await Posts(api=offline_api).by_ids(
+        ids=[post["data"]["id"] for post in subreddit_posts[:5]]
+    )
+
+    assert [thing["data"]["name"] for thing in things] == fullnames
+    assert fake_reddit.request_count(path="/api/info") == 3 + 1
+    assert [post.id for post in posts] == [
+        post["data"]["id"] for post in subreddit_posts[:5]
+    ]
+    with pytest.raises(ValueError):
+        await offline_api.get_info(fullnames=["t2_abc123"])
+
+
+@pytest.mark.asyncio
+async def test_sync_only_fetches_items_newer_than_the_mark(
+    offline_api: Api, fake_reddit: FakeReddit, tmp_path
+):
+    """Tests that a synced "new" listing stops at its high-water mark, which then moves up."""
+    offline_api.sync_state = SyncState(path=str(tmp_path / "sync.json"))
+    request: Dict = dict(
+        kind="posts_from_a_subreddit", subreddit=TEST_SUBREDDIT_1, sort="new"
+    )
+
+    first_run: List[Dict] = await offline_api.get_posts_or_comments(
+        limit=500, **request
+    )
+    # Pretend that only the posts older than the 150th newest one were there on the last run.
+    sync_key: str = f"/r/{TEST_SUBREDDIT_1}/new.json?sort=new&t=all"
+    offline_api.sync_state.forget()
+    offline_api.sync_state.advance(key=sync_key, item=first_run[150])
+    requests_before: int = fake_reddit.request_count()
+
+    delta: List[Dict] = await offline_api.get_posts_or_comments(limit=500, **request)
+
+    assert delta == first_run[:150]
+    assert fake_reddit.request_count() - requests_before == 2
+    assert offline_api.sync_state.mark(key=sync_key).fullname == (
+        first_run[0]["data"]["name"]
+    )
+    assert await offline_api.get_posts_or_comments(limit=500, **request) == []
+
+
+@pytest.mark.asyncio
+async def test_new_subreddit_posts_come_from_the_new_path(
+    offline_api: Api, fake_reddit: FakeReddit
+):
+    """Tests that a subreddit's new posts are requested from its "new" path, since `sort` is ignored."""
+    hot_page: Dict = await offline_api.send_request(
+        endpoint=f"{fake_reddit.url}/r/{TEST_SUBREDDIT_1}.json",
+        params={"sort": "new", "limit": 100},
+    )
+    new_posts: List[Dict] = await offline_api.get_posts_or_comments(
+        kind="posts_from_a_subreddit", subreddit=TEST_SUBREDDIT_1, sort="new", limit=300
+    )
+
+    hot_times: List[float] = [
+        post["data"]["created_utc"] for post in hot_page["data"]["children"]
+    ]
+    assert hot_times != sorted(hot_times, reverse=True)
+    new_times: List[float] = [post["data"]["created_utc"] for post in new_posts]
+    assert new_times == sorted(new_times, reverse=True)
+    assert {request.path for request in fake_reddit.requests[1:]} == {
+        f"/r/{TEST_SUBREDDIT_1}/new.json"
+    }
+
+
+@pytest.mark.asyncio
+async def test_sync_paginates_listings_that_are_not_in_time_order(
+    offline_api: Api, fake_reddit: FakeReddit, tmp_path
+):
+    """Tests that a synced "hot" listing is paginated in full, rather than stopping at its first old item."""
+    offline_api.sync_state = SyncState(path=str(tmp_path / "sync.json"))
+    request: Dict = dict(
+        kind="posts_from_a_subreddit",
+        subreddit=TEST_SUBREDDIT_1,
+        sort="hot",
+        limit=LISTING_CAP,
+    )
+    first_run: List[Dict] = await offline_api.get_posts_or_comments(**request)
+    marked: Dict = sorted(first_run, key=lambda post: post["data"]["created_utc"])[500]
+    offline_api.sync_state.forget()
+    offline_api.sync_state.advance(
+        key=f"/r/{TEST_SUBREDDIT_1}/hot.json?sort=hot&t=all", item=marked
+    )
+    requests_before: int = fake_reddit.request_count()
+
+    delta: List[Dict] = await offline_api.get_posts_or_comments(**request)
+
+    assert delta == [
+        post
+        for post in first_run
+        if post["data"]["created_utc"] > marked["data"]["created_utc"]
+    ]
+    assert fake_reddit.request_count() - requests_before == 10
+
+
+@pytest.mark.asyncio
+async def test_sync_mark_counts_items_resumed_from_a_checkpoint(
+    offline_api: Api, fake_reddit: FakeReddit, tmp_path
+):
+    """Tests that a synced listing resumed from a checkpoint moves its mark up to the newest item."""
+    request: Dict = dict(
+        kind="posts_from_a_subreddit", subreddit=TEST_SUBREDDIT_1, sort="new", limit=500
+    )
+    expected: List[Dict] = await offline_api.get_posts_or_comments(**request)
+
+    offline_api.sync_state = SyncState(path=str(tmp_path / "sync.json"))
+    offline_api.checkpoints = CheckpointStore(directory=str(tmp_path / "checkpoints"))
+    await interrupted_crawl(offline_api, pages=2, **request)
+    offline_api.checkpoints.resume = True
+    requests_before: int = fake_reddit.request_count()
+
+    resumed: List[Dict] = await offline_api.get_posts_or_comments(**request)
+
+    assert resumed == expected
+    assert fake_reddit.request_count() - requests_before == 3
+    assert offline_api.sync_state.mark(
+        key=f"/r/{TEST_SUBREDDIT_1}/new.json?sort=new&t=all"
+    ).fullname == (expected[0]["data"]["name"])
+
+
+@pytest.mark.asyncio
+async def test_time_bounds_stop_new_listings_early(
+    offline_api: Api, fake_reddit: FakeReddit
+):
+    """Tests that `since` halts "new" listings, and that other sorts are filtered to the window."""
+    request: Dict = dict(kind="posts_from_a_subreddit", subreddit=TEST_SUBREDDIT_1)
+    newest_posts: List[Dict] = await offline_api.get_posts_or_comments(
+        limit=300, sort="new", **request
+    )
+    since: float = newest_posts[149]["data"]["created_utc"]
+    until: float = newest_posts[9]["data"]["created_utc"]
+    requests_before: int = fake_reddit.request_count()
+
+    bounded_posts: List[Dict] = await offline_api.get_posts_or_comments(
+        limit=LISTING_CAP, sort="new", since=since, until=until, **request
+    )
+    requests_made: int = fake_reddit.request_count() - requests_before
+    top_posts: List[Dict] = await offline_api.get_posts_or_comments(
+        limit=LISTING_CAP, sort="top", since=since, **request
+    )
+
+    assert bounded_posts == newest_posts[10:150]
+    assert requests_made == 2
+    assert sorted(post["data"]["name"] for post in top_posts) == sorted(
+        post["data"]["name"] for post in newest_posts[:150]
+    )
+    assert parse_time_bound("6h", now=since) == since - 6 * 3600
+    assert parse_time_bound("2023-11-14T22:13:20Z") == 1700000000.0
+
+
+@pytest.mark.asyncio
+async def test_time_bounds_do_not_stop_listings_out_of_time_order(
+    offline_api: Api, fake_reddit: FakeReddit
+):
+    """Tests that `since` filters a listing whose first page is not in time order, without stopping it early."""
+    request: Dict = dict(
+        kind="posts_from_a_subreddit", subreddit=TEST_SUBREDDIT_1, limit=LISTING_CAP
+    )
+    hot_posts: List[Dict] = await offline_api.get_posts_or_comments(**request)
+    first_page_times: List[float] = [
+        post["data"]["created_utc"] for post in hot_posts[:100]
+    ]
+    since: float = sorted(first_page_times)[50]
+    requests_before: int = fake_reddit.request_count()
+
+    bounded_posts: List[Dict] = await offline_api.get_posts_or_comments(
+        since=since, **request
+    )
+
+    assert first_page_times != sorted(first_page_times, reverse=True)
+    assert bounded_posts == [
+        post for post in hot_posts if post["data"]["created_utc"] >= since
+    ]
+    assert fake_reddit.request_count() - requests_before == 10
+
+
+@pytest.mark.asyncio
+async def test_seen_set_dedups_across_listings_and_runs(
+    offline_api: Api, fake_reddit: FakeReddit, tmp_path
+):
+    """Tests that items are only returned once, across listings and across saved runs."""
+    path: str = str(tmp_path / "seen.bin")
+    offline_api.seen_set = SeenSet(path=path, exact_limit=100, capacity=1000)
+    request: Dict = dict(kind="posts_from_a_subreddit", subreddit=TEST_SUBREDDIT_1)
+
+    first_run: List[Dict] = await offline_api.get_posts_or_comments(
+        limit=250, **request
+    )
+    repeated_run: List[Dict] = await offline_api.get_posts_or_comments(
+        limit=250, **request
+    )
+    offline_api.seen_set.save()
+    # The saved filter holds more fullnames than `exact_limit`, so it is reloaded as a Bloom filter.
+    offline_api.seen_set = SeenSet(path=path)
+    next_run: List[Dict] = await offline_api.get_posts_or_comments(
+        limit=LISTING_CAP, sort="new", **request
+    )
+
+    def fullnames(posts: List[Dict]) -> set:
+        return {SeenSet.fullname(post) for post in posts}
+
+    # Seen items do not count towards the limit, so the repeated run carries on past them.
+    assert len(fullnames(first_run)) == len(fullnames(repeated_run)) == 250
+    assert not fullnames(first_run) & fullnames(repeated_run)
+    assert not offline_api.seen_set.is_exact
+    assert 0 < len(next_run) < LISTING_CAP
+    assert not fullnames(next_run) & fullnames(first_run + repeated_run)
+    duplicated: Dict = first_run[0]
+    assert SeenSet().filter([duplicated, first_run[1], duplicated]) == first_run[:2]
+
+
+@pytest.mark.parametrize(
+    "contents",
+    [
+        b"",
+        b'{"kind": "exa',
+        b'{"kind": "bloom", "count": 3}\n',
+        b'{"kind": "bloom", "count": 3, "capacity": 100, "error_rate": 0.01}\n\x00\x01',
+    ],
+)
+def test_unreadable_seen_set_starts_empty(tmp_path, contents):
+    """Tests that a truncated, edited or mis-sized seen-set file is replaced by an empty set."""
+    path = tmp_path / "seen.txt"
+    path.write_bytes(contents)
+
+    with pytest.warns(RuntimeWarning):
+        seen_set = SeenSet(path=str(path))
+    assert len(seen_set) == 0
+    assert seen_set.add("t3_abc123")
+    seen_set.save()
+
+    assert "t3_abc123" in SeenSet(path=str(path))
+
+
+@pytest.mark.asyncio
+async def test_seen_set_holds_items_resumed_from_a_checkpoint(
+    offline_api: Api, tmp_path
+):
+    """Tests that items resumed from a checkpoint are recorded in a shared seen-set."""
+    request: Dict = dict(
+        kind="posts_from_a_subreddit", subreddit=TEST_SUBREDDIT_1, limit=300
+    )
+    expected: List[Dict] = await offline_api.get_posts_or_comments(**request)
+
+    offline_api.checkpoints = CheckpointStore(directory=str(tmp_path / "checkpoints"))
+    await interrupted_crawl(offline_api, pages=2, **request)
+    offline_api.checkpoints.resume = True
+    offline_api.seen_set = SeenSet()
+
+    resumed: List[Dict] = await offline_api.get_posts_or_comments(**request)
+    seen_count: int = len(offline_api.seen_set)
+    offline_api.checkpoints = None
+    next_run: List[Dict] = await offline_api.get_posts_or_comments(**request)
+
+    assert resumed == expected
+    assert seen_count == len(expected)
+    assert not {SeenSet.fullname(post) for post in expected} & {
+        SeenSet.fullname(post) for post in next_run
+    }
+
+
+@pytest.mark.asyncio
+async def test_harvest_merges_sorts_past_the_listing_cap(offline_api: Api):
+    """Tests that harvesting every sort and timeframe gets more unique items than one listing holds."""
+    posts, coverage = await Subreddit(
+        name=TEST_SUBREDDIT_1, api=offline_api
+    ).harvest_posts()
+
+    assert len(posts) > LISTING_CAP
+    assert len({post.id for post in posts}) == len(posts)
+    assert len(coverage) == 3 + 2 * 6
+    assert coverage[0].new_items == LISTING_CAP
+    assert [listing.total_items for listing in coverage] == sorted(
+        listing.total_items for listing in coverage
+    )
+    assert sum(listing.new_items for listing in coverage) == len(posts)
+    assert not any(listing.error for listing in coverage)
+
+
+@pytest.mark.asyncio
+async def test_harvest_stops_once_its_limit_is_reached(
+    offline_api: Api, fake_reddit: FakeReddit
+):
+    """Tests that a harvest stops paginating every listing once `limit` unique items have been fetched."""
+    posts, coverage = await Subreddit(
+        name=TEST_SUBREDDIT_1, api=offline_api
+    ).harvest_posts(limit=250)
+
+    assert len(posts) == 250
+    assert len({post.id for post in posts}) == 250
+    # Each listing's first page is requested at once, and few get to a second one before the limit.
+    assert len(coverage) <= fake_reddit.request_count() < 2 * len(coverage)
+
+
+@pytest.mark.asyncio
+async def test_repeated_entity_lookups_are_cached(
+    offline_api: Api, fake_reddit: FakeReddit
+):
+    """Tests that looking up the same entity twice only sends one request."""
+    offline_api.entity_cache = EntityCache()
+
+    first_lookup: Dict = await offline_api.get_entity(
+        kind="user", username=TEST_USERNAME
+    )
+    second_lookup: Dict = await offline_api.get_entity(
+        kind="user", username=TEST_USERNAME
+    )
+
+    assert second_lookup == first_lookup
+    assert fake_reddit.request_count(path=f"/user/{TEST_USERNAME}") == 1
+    assert (offline_api.entity_cache.hits, offline_api.entity_cache.misses) == (1, 1)
+
+
+@pytest.mark.asyncio
+async def test_stale_responses_are_revalidated(
+    offline_api: Api, fake_reddit: FakeReddit, tmp_path
+):
+    """Tests that stale cached responses are revalidated, and served from the cache on 304 Not Modified."""
+    offline_api.cache = ResponseCache(
+        path=str(tmp_path / "responses.sqlite3"),
+        ttls={kind: 0 for kind in RESPONSE_CACHE_TTLS},
+    )
+    etag_endpoint: str = f"{fake_reddit.url}/r/{TEST_SUBREDDIT_1}/about.json"
+    date_endpoint: str = f"{fake_reddit.url}/user/{TEST_USERNAME}/about.json"
+    # Cached without an `ETag`, so that it can only be revalidated with `If-Modified-Since`.
+    offline_api.cache.store(
+        url=date_endpoint,
+        params=None,
+        kind="about",
+        body=b'{"cached": true}',
+        last_modified=formatdate(usegmt=True),
+    )
+
+    downloaded: Dict = await offline_api.send_request(endpoint=etag_endpoint)
+    revalidated: Dict = await offline_api.send_request(endpoint=etag_endpoint)
+    served_from_cache: Dict = await offline_api.send_request(endpoint=date_endpoint)
+
+    assert revalidated == downloaded
+    assert served_from_cache == {"cached": True}
+    assert [request.status for request in fake_reddit.requests] == [200, 304, 304]
+    assert offline_api.cache.stats()["revalidated"] == 2
+
+
+def test_cached_responses_expire_per_kind(tmp_path):
+    """Tests that each kind of cached response stays fresh for its own time-to-live."""
+    cache = ResponseCache(
+        path=str(tmp_path / "responses.sqlite3"),
+        ttls={"about": 60 * 60, "listing": 0.05},
+    )
+    for kind in ("about", "listing"):
+        cache.store(
+            url=f"https://reddit.test/{kind}", params=None, kind=kind, body=b"{}"
+        )
+    time.sleep(0.1)
+
+    assert cache.lookup(
+        url="https://reddit.test/about", params=None, kind="about"
+    ).fresh
+    assert not cache.lookup(
+        url="https://reddit.test/listing", params=None, kind="listing"
+    ).fresh
+    assert cache.prune() == 1
+    assert cache.stats()["entries"] == 1
+
+
+def test_response_cache_evicts_the_least_recently_used(tmp_path):
+    """Tests that the least recently used responses are evicted once the cache is full."""
+    path: str = str(tmp_path / "responses.sqlite3")
+    cache = ResponseCache(path=path, max_size=30)
+    for url in ("a", "b", "c"):
+        cache.store(url=url, params=None, kind="other", body=b"0123456789")
+        time.sleep(0.01)
+    # Looking "a" up makes "b" the least recently used, even before the access is written.
+    cache.lookup(url="a", params=None, kind="other")
+    time.sleep(0.01)
+    cache.store(url="d", params=None, kind="other", body=b"0123456789")
+
+    assert cache.lookup(url="b", params=None, kind="other") is None
+    assert all(cache.lookup(url=url, params=None, kind="other") for url in "acd")
+    cache.close()
+
+    reopened = ResponseCache(path=path, max_size=30)
+    stats: Dict[str, int] = reopened.stats()
+    assert (stats["entries"], stats["size"]) == (3, 30)
+    assert (stats["hits"], stats["misses"]) == (4, 1)
+
+
+def test_cache_command_prunes_and_shows_stats(monkeypatch, tmp_path):
+    """Tests that `knewkarma cache` prunes expired responses and shows the cache's statistics."""
+    path: str = str(tmp_path / "responses.sqlite3")
+    cache = ResponseCache(path=path, ttls={"about": 60 * 60, "listing": 0})
+    for kind in ("about", "listing"):
+        cache.store(
+            url=f"https://reddit.test/{kind}", params=None, kind=kind, body=b"{}"
+        )
+    cache.lookup(url="https://reddit.test/about", params=None, kind="about")
+    cache.close()
+    monkeypatch.setattr(cli_module, "RESPONSE_CACHE_PATH", path)
+    monkeypatch.setattr(cli_module.api, "cache", None)
+    monkeypatch.setattr(
+        cli_module, "ResponseCache", partial(ResponseCache, ttls={"listing": 0})
+    )
+
+    result = CliRunner().invoke(cli_module.cli, ["cache", "--prune", "--stats"], obj={})
+
+    assert result.exit_code == 0, result.output
+    assert "Removed 1 cache entries" in result.output
+    assert "Response Cache" in result.output
+    assert ResponseCache(path=path).stats()["entries"] == 1
+
+
+@pytest.mark.asyncio
+async def test_identical_requests_in_flight_are_coalesced(
+    offline_api: Api, fake_reddit: FakeReddit
+):
+    """Tests that identical concurrent requests share one HTTP request, even if a caller is cancelled."""
+    fake_reddit.latency = 0.1
+    endpoint: str = offline_api.endpoint("username_available")
+
+    cancelled = asyncio.ensure_future(
+        offline_api.send_request(endpoint=endpoint, params={"user": "unregistered"})
+    )
+    await asyncio.sleep(0)
+    cancelled.cancel()
+    responses: List[bool] = await asyncio.gather(
+        *(
+            offline_api.send_request(endpoint=endpoint, params={"user": "unregistered"})
+            for _ in range(5)
+        ),
+        offline_api.send_request(endpoint=endpoint, params={"user": TEST_USERNAME}),
+    )
+
+    assert responses == [True] * 5 + [False]
+    assert fake_reddit.request_count(path="/api/username_available") == 2
+    assert not offline_api._in_flight_requests
+
+
+@pytest.mark.asyncio
+async def test_failed_requests_are_retried(offline_api: Api, fake_reddit: FakeReddit):
+    """Tests that 5xx and 429 responses are retried until the request succeeds."""
+    fake_reddit.fail_next(status=503, times=2)
+    fake_reddit.fail_next(status=429)
+
+    new_users: List[Dict] = await offline_api.get_users(kind="new", limit=10)
+
+    assert len(new_users) == 10
+    assert [request.status for request in fake_reddit.requests] == [
+        503,
+        503,
+        429,
+        200,
+    ]
+    assert offline_api.retry_policy.retries == 3
+
+
+@pytest.mark.asyncio
+async def test_progress_events_are_emitted(offline_api: Api, fake_reddit: FakeReddit):
+    """Tests that pages, running totals and retries are reported to the progress sink."""
+    progress_file = io.StringIO()
+    offline_api.progress = JsonLinesProgress(file=progress_file)
+    fake_reddit.fail_next(status=503)
+
+    await offline_api.get_posts_or_comments(
+        kind="posts_from_a_subreddit", subreddit=TEST_SUBREDDIT_1, limit=250
+    )
+    offline_api.progress.close()
+    events: List[Dict] = [
+        json.loads(line) for line in progress_file.getvalue().splitlines()
+    ]
+
+    def fields(event: str, *names: str) -> List[tuple]:
+        return [
+            tuple(line[name] for name in names)
+            for line in events
+            if line["event"] == event
+        ]
+
+    assert fields("retrying", "attempt") == [(2,)]
+    assert fields("sleeping_until", "reason") == [("retry",)]
+    assert fields("page_fetched", "count") == [(100,), (100,), (50,)]
+    assert fields("items_so_far", "count", "limit") == [
+        (100, 250),
+        (200, 250),
+        (250, 250),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_requests_are_traced_per_endpoint_kind(fake_reddit: FakeReddit, tmp_path):
+    """Tests that every request's phases, status and size are traced, and summed up per endpoint kind."""
+    path: str = str(tmp_path / "trace.jsonl")
+    tracer = RequestTracer(path=path)
+    fake_reddit.fail_next(status=503)
+    async with Api(
+        base_url=fake_reddit.url,
+        tracer=tracer,
+        retry_policy=RetryPolicy(base_delay=0.01, max_delay=0.1),
+    ) as traced_api:
+        await traced_api.get_posts_or_comments(
+            kind="posts_from_a_subreddit", subreddit=TEST_SUBREDDIT_1, limit=250
+        )
+        await traced_api.get_entity(kind="user", username=TEST_USERNAME)
+    tracer.close()
+
+    with open(path, encoding="utf-8") as trace_file:
+        traces: List[Dict] = [json.loads(line) for line in trace_file]
+    summary: Dict = tracer.summary()
+
+    assert [(trace["kind"], trace["status"]) for trace in traces] == [
+        ("listing", 503),
+        ("listing", 200),
+        ("listing", 200),
+        ("listing", 200),
+        ("about", 200),
+    ]
+    assert all(trace["ttfb_ms"] >= 0 and "total_ms" in trace for trace in traces)
+    # The first request opens the pooled connection, and the ones after it reuse it.
+    assert [trace["reused_connection"] for trace in traces][1:] == [True] * 4
+    assert (summary["listing"]["requests"], summary["listing"]["errors"]) == (4, 1)
+    assert summary["listing"]["bytes"] > summary["about"]["bytes"] > 0
+    assert sum(summary["about"]["histogram"]) == summary["about"]["requests"] == 1
+
+
+@pytest.mark.asyncio
+async def test_metrics_are_served_in_the_prometheus_format(
+    offline_api: Api, fake_reddit: FakeReddit, tmp_path
+):
+    """Tests that request, retry, item and cache metrics are recorded, served and dumped."""
+    offline_api.metrics = MetricsRegistry()
+    offline_api.entity_cache = EntityCache()
+    fake_reddit.fail_next(status=429)
+
+    await offline_api.get_posts_or_comments(
+        kind="posts_from_a_subreddit", subreddit=TEST_SUBREDDIT_1, limit=250
+    )
+    for _ in range(2):
+        await offline_api.get_entity(kind="user", username=TEST_USERNAME)
+
+    with socket.socket() as free_socket:
+        free_socket.bind(("127.0.0.1", 0))
+        port: int = free_socket.getsockname()[1]
+    await offline_api.metrics.serve(port=port)
+    try:
+        async with aiohttp.ClientSession() as session:
+            async with session.get(f"http://127.0.0.1:{port}/metrics") as response:
+                served: str = await response.text()
+    finally:
+        await offline_api.metrics.stop()
+    offline_api.metrics.dump(path=str(tmp_path / "knewkarma.prom"))
+
+    lines: List[str] = served.splitlines()
+    for line in (
+        "# TYPE knewkarma_requests_total counter",
+        'knewkarma_requests_total{kind="listing",status="200"} 3',
+        'knewkarma_requests_total{kind="listing",status="429"} 1',
+        'knewkarma_requests_total{kind="about",status="200"} 1',
+        "knewkarma_rate_limited_total 1",
+        "knewkarma_retries_total 1",
+        'knewkarma_items_total{listing="posts_from_a_subreddit"} 250',
+        'knewkarma_entity_cache_lookups_total{result="hit"} 1',
+        'knewkarma_entity_cache_lookups_total{result="miss"} 1',
+        "knewkarma_coalesced_requests_in_flight 0",
+    ):
+        assert line in lines
+    assert any(line.startswith("process_uptime_seconds ") for line in lines)
+    assert (tmp_path / "knewkarma.prom").read_text().startswith("# HELP ")
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_headers_are_honoured(
+    offline_api: Api, fake_reddit: FakeReddit
+):
+    """Tests that the rate-limit budget advertised by the server is tracked."""
+    await offline_api.get_subreddits(kind="new", limit=10)
+
+    assert offline_api._rate_limiter.remaining == fake_reddit.rate_limit - 1
+
+
+@pytest.mark.asyncio
+async def test_cassette_replays_a_recorded_crawl(fake_reddit: FakeReddit, tmp_path):
+    """Tests that responses recorded to a cassette are replayed without the network."""
+    path: str = str(tmp_path / "crawl.jsonl.gz")
+    recording = Cassette(path=path, mode="record")
+    async with Api(base_url=fake_reddit.url, cassette=recording) as recording_api:
+        recorded_posts: List[Dict] = await recording_api.get_posts_or_comments(
+            kind="posts_from_a_subreddit", subreddit=TEST_SUBREDDIT_1, limit=250
+        )
+    recording.close()
+
+    replay_api = Api(base_url=fake_reddit.url, cassette=Cassette(path=path))
+    await fake_reddit.stop()
+    replayed_posts: List[Dict] = await replay_api.get_posts_or_comments(
+        kind="posts_from_a_subreddit", subreddit=TEST_SUBREDDIT_1, limit=250
+    )
+
+    assert replayed_posts == recorded_posts
+    with pytest.raises(LookupError):
+        await replay_api.get_entity(kind="user", username=TEST_USERNAME)
+
+
+def test_credentials_route_requests_to_the_oauth_host():
+    """Tests that endpoints are built from the OAuth host only when credentials are set."""
+    anonymous_api = Api()
+    oauth_api = Api(credentials=ClientCredentials("client-id", "client-secret"))
+
+    assert anonymous_api.endpoint("subreddit") == f"{BASE_URL}/r"
+    assert oauth_api.endpoint("subreddit") == f"{OAUTH_URL}/r"
+    assert oauth_api.endpoint("access_token") == f"{BASE_URL}/api/v1/access_token"
+
+
+@pytest.mark.asyncio
+async def test_oauth_token_is_shared_and_refreshed():
+    """Tests that one token is fetched for concurrent requests, and fetched again before it expires."""
+    credentials = ClientCredentials("client-id", "client-secret", refresh_margin=0.5)
+    async with FakeReddit(
+        require_oauth=True, token_lifetime=1.0, rate_limit=10, oauth_rate_limit=1000
+    ) as server, Api(base_url=server.url, credentials=credentials) as api:
+        await asyncio.gather(
+            *[
+                api.get_entity(kind="user", username=f"user_{index}")
+                for index in range(5)
+            ]
+        )
+        assert credentials.fetches == 1
+        assert api._rate_limiter.remaining > server.rate_limit
+
+        await asyncio.sleep(0.6)
+        await api.get_entity(kind="user", username=TEST_USERNAME)
+        assert credentials.fetches == 2
+
+
+@pytest.mark.asyncio
+async def test_revoked_oauth_token_is_replaced():
+    """Tests that a request rejected for its token gets a new token and is sent again."""
+    credentials = ClientCredentials("client-id", "client-secret")
+    async with FakeReddit(require_oauth=True) as server, Api(
+        base_url=server.url, credentials=credentials
+    ) as api:
+        await api.get_entity(kind="user", username=TEST_USERNAME)
+        server.revoke_tokens()
+        subreddit: Dict = await api.get_entity(
+            kind="subreddit", subreddit=TEST_SUBREDDIT_1
+        )
+
+        assert subreddit and credentials.fetches == 2
+        assert server.request_count("/api/v1/access_token") == 2
+
+
+@pytest.mark.asyncio
+async def test_oauth_requests_release_a_half_open_circuit():
+    """Tests that a probe request that is re-authorised, or fails to get a token, frees the circuit."""
+    circuit_breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=0.05)
+    async with FakeReddit(require_oauth=True) as server, Api(
+        base_url=server.url,
+        credentials=ClientCredentials("client-id", "client-secret"),
+        circuit_breaker=circuit_breaker,
+    ) as api:
+        host: str = urlparse(server.url).hostname
+        await api.get_entity(kind="user", username=TEST_USERNAME)
+        server.revoke_tokens()
+        circuit_breaker.record_failure(host=host)
+        await asyncio.sleep(0.05)
+
+        # The probe gets a 401, is re-authorised, and is then sent again.
+        subreddit: Dict = await asyncio.wait_for(
+            api.get_entity(kind="subreddit", subreddit=TEST_SUBREDDIT_1), timeout=5
+        )
+
+        assert subreddit and circuit_breaker.state(host=host) == "closed"
+
+        api.credentials = ClientCredentials("client-id", "wrong")
+        circuit_breaker.record_failure(host=host)
+        await asyncio.sleep(0.05)
+        with pytest.raises(aiohttp.ClientResponseError):
+            await api.get_entity(kind="user", username="unregistered")
+
+        # The probe never reached the host, so the next request may probe it.
+        await asyncio.wait_for(circuit_breaker.wait(host=host), timeout=0.5)
+
+
+@pytest.mark.asyncio
+async def test_rejected_oauth_credentials_raise():
+    """Tests that credentials the token endpoint rejects raise instead of being retried."""
+    async with FakeReddit(require_oauth=True) as server, Api(
+        base_url=server.url, credentials=ClientCredentials("client-id", "wrong")
+    ) as api:
+        with pytest.raises(aiohttp.ClientResponseError):
+            await api.get_entity(kind="user", username=TEST_USERNAME)
+
+
+def test_cpu_benchmark_times_every_stage():
+    """Tests that the CPU benchmark reports every stage of both kinds of listings."""
+    results: List[Dict] = run_benchmark(kinds=["posts", "comments"], items=250)
+
+    assert [(result["kind"], result["stage"]) for result in results] == [
+        (kind, stage) for kind in ("posts", "comments") for stage in STAGES
+    ]
+    assert all(result["seconds"] > 0 for result in results)
+    assert all(result["peak_memory_bytes"] > 0 for result in results)
+
+
+def test_corpus_is_deterministic():
+    """Tests that a corpus generates the same listings for the same seed, and only then."""
+    pages: List[Dict] = list(Corpus(seed=1).listing_pages(source="r:python", items=250))
+
+    assert pages == list(Corpus(seed=1).listing_pages(source="r:python", items=250))
+    assert pages != list(Corpus(seed=2).listing_pages(source="r:python", items=250))
+    assert [len(page["data"]["children"]) for page in pages] == [100, 100, 50]
+    assert pages[-1]["data"]["after"] is None
+
+
+def test_corpus_thread_expands_to_every_comment():
+    """Tests that a thread's comments page and morechildren responses hold every comment once."""
+    corpus = Corpus(comments_per_post=1000)
+    comments_page, *more_children = corpus.thread_pages(post_id="abc123", limit=200)
+
+    def walk(things: List[Dict]) -> List[str]:
+        names: List[str] = []
+        for thing in things:
+            if thing["kind"] == "t1":
+                names.append(thing["data"]["name"])
+                replies = thing["data"]["replies"]
+                names.extend(walk(replies["data"]["children"]) if replies else [])
+        return names
+
+    names: List[str] = walk(comments_page[1]["data"]["children"]) + [
+        thing["data"]["name"]
+        for response in more_children
+        for thing in response["json"]["data"]["things"]
+    ]
+
+    assert len(names) == len(set(names)) == 1000
+    assert any(
+        thing["data"]["replies"]
+        for thing in comments_page[1]["data"]["children"]
+        if thing["kind"] == "t1"
+    )
+
+
+# -------------------------------- END ----------------------------------------- #